@@ -3,16 +3,29 @@ Interview Practice Partner - Main Streamlit Application
 """
 
 import streamlit as st
+from concurrent.futures import wait
 from datetime import datetime
 import os
+import time
+import uuid
 
 # Modules
 from src.config import Config
+from src.agents.admission import Overloaded, get_admission_controller
 from src.agents.interview_engine import InterviewEngine
+from src.agents.job_executor import get_job_executor
+from src.agents.session_pool import get_session_pool
+from src.agents.transcript import Transcript
 from src.feedback.analyzer import FeedbackAnalyzer
+from src.profiling import get_profiler
+from src.storage.journal import get_journal
 from src.storage.manager import StorageManager
+from src.storage.summary import METRICS
 from src.voice.output_handler import TTSHandler
 from src.voice.input_handler import STTHandler
+from src.voice.pipeline import ReplyStream, VoiceOutputPipeline, voice_metrics
+from src.voice.prewarm import start_warmup
+from src.ui.audio_player import render_audio_segment
 
 # Page Setup
 st.set_page_config(
@@ -26,8 +39,9 @@ st.set_page_config(
 if 'initialized' not in st.session_state:
     st.session_state.initialized = True
     st.session_state.interview_active = False
-    st.session_state.interview_engine = None
-    st.session_state.messages = []
+    st.session_state.engine_ready = False
+    st.session_state.transcript = Transcript()
+    st.session_state.chat_page = 0
     st.session_state.session_id = None
     st.session_state.role = None
     st.session_state.input_mode = "text"
@@ -36,11 +50,45 @@ if 'initialized' not in st.session_state:
     st.session_state.show_feedback = False
     st.session_state.feedback_data = None
     st.session_state.persona = "normal"
+    st.session_state.spoken_index = -1
+    st.session_state.reply_stream = None
+    st.session_state.job_key = uuid.uuid4().hex
+    st.session_state.awaiting_feedback = False
+    st.session_state.job_error = None
+    st.session_state.queued_start = None
+    st.session_state.profile_session = False
 
-# Managers
-storage = StorageManager()
-tts_handler = TTSHandler()
-stt_handler = STTHandler()
+# ------------------------------
+# Managers (process-wide resources)
+# ------------------------------
+# Streamlit reruns this script on every interaction; cache_resource builds
+# each manager once per process and hands the same instance to every
+# rerun and browser session.
+@st.cache_resource
+def get_storage() -> StorageManager:
+    return StorageManager()
+
+
+@st.cache_resource
+def get_tts_handler() -> TTSHandler:
+    return TTSHandler()
+
+
+@st.cache_resource
+def get_stt_handler() -> STTHandler:
+    return STTHandler()
+
+
+storage = get_storage()
+tts_handler = get_tts_handler()
+stt_handler = get_stt_handler()
+jobs = get_job_executor()
+admission = get_admission_controller()
+profiler = get_profiler()
+session_pool = get_session_pool()
+
+# Pre-synthesize static interviewer phrases (once per process)
+warmup_job = start_warmup(tts_handler)
 
 
 # ------------------------------
@@ -60,54 +108,380 @@ def validate_api_key():
 # ------------------------------
 # Start Interview
 # ------------------------------
+def request_interview(role: str, persona: str, input_mode: str):
+    """
+    Start right away if there is capacity, otherwise join the FIFO
+    admission queue (or be turned away if it is full).
+    """
+    try:
+        position = admission.admit(st.session_state.job_key)
+    except Overloaded as e:
+        st.session_state.job_error = str(e)
+        return
+
+    if position:
+        st.session_state.queued_start = (role, persona, input_mode)
+        return
+    start_new_interview(role, persona, input_mode)
+
+
+def check_admission():
+    """
+    Re-check the queued start; returns the queue position (0 = started).
+    """
+    try:
+        position = admission.admit(st.session_state.job_key)
+    except Overloaded as e:
+        st.session_state.queued_start = None
+        st.session_state.job_error = str(e)
+        return 0
+
+    if position == 0:
+        role, persona, input_mode = st.session_state.queued_start
+        st.session_state.queued_start = None
+        start_new_interview(role, persona, input_mode)
+    return position
+
+
+@st.fragment(run_every=Config.JOB_POLL_SECONDS * 2)
+def poll_admission():
+    position = check_admission()
+    if position == 0:
+        st.rerun()
+    st.info(f"⏳ Lots of candidates right now. You are #{position} in line; your interview starts automatically.")
+    if st.button("Leave queue"):
+        admission.release(st.session_state.job_key)
+        st.session_state.queued_start = None
+        st.rerun()
+
+
 def start_new_interview(role: str, persona: str, input_mode: str):
     st.session_state.role = role
     st.session_state.persona = persona
     st.session_state.input_mode = input_mode
-    st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if st.session_state.session_id:
+        # Stop profiling the interview this one replaces
+        profiler.disable(st.session_state.session_id)
+    # Engines are pooled per process, so ids must be unique across tabs
+    st.session_state.session_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
     st.session_state.start_time = datetime.now()
-    st.session_state.messages = []
+    st.session_state.transcript = Transcript()
+    st.session_state.chat_page = 0
     st.session_state.show_feedback = False
     st.session_state.feedback_data = None
+    st.session_state.spoken_index = -1
+    st.session_state.reply_stream = None
+    st.session_state.awaiting_feedback = False
+    st.session_state.job_error = None
+    st.session_state.engine_ready = False
+    if st.session_state.profile_session:
+        profiler.enable(st.session_state.session_id)
+
+    # The opening question comes from the LLM: fetch it in the background
+    jobs.submit(
+        st.session_state.job_key, "start", _run_start,
+        st.session_state.session_id, role, persona, input_mode,
+        session_id=st.session_state.session_id
+    )
 
-    st.session_state.interview_engine = InterviewEngine(role)
+    st.session_state.interview_active = True
 
-    opening = st.session_state.interview_engine.start_interview()
-    st.session_state.messages.append({
-        "role": "interviewer",
-        "content": opening
-    })
 
-    st.session_state.interview_active = True
+def _run_start(session_id: str, role: str, persona: str, input_mode: str):
+    with profiler.turn(session_id, "start"):
+        engine = InterviewEngine(role, persona=persona, input_mode=input_mode, session_id=session_id)
+        if admission.degraded:
+            engine.shorten()
+        # Under overload the opening comes from the local question bank
+        with admission.llm_slot() as granted:
+            opening = engine.start_interview() if granted else engine.start_interview_local()
+        session_pool.add(engine)
+        return opening
+
+
+def current_engine():
+    """
+    This tab's live engine. Only the session id is kept in session state;
+    the engine lives in the process-wide pool and is resumed from its
+    checkpoint if it was evicted while idle.
+    """
+    if not st.session_state.engine_ready:
+        return None
+    return session_pool.get(st.session_state.session_id)
 
 
 # ------------------------------
-# End Interview & Generate Feedback
+# Answer Turn
 # ------------------------------
-def end_interview():
-    if st.session_state.interview_engine:
-        with st.spinner("Analyzing your interview performance..."):
-            analyzer = FeedbackAnalyzer()
-            transcript = st.session_state.interview_engine.get_transcript()
-            feedback = analyzer.analyze_interview(st.session_state.role, transcript)
+def submit_answer(user_text: str):
+    engine = current_engine()
 
-            st.session_state.feedback_data = feedback
-            st.session_state.show_feedback = True
+    pending = jobs.get(st.session_state.job_key)
+    if pending is not None and not pending.finished:
+        st.toast("Still working on your previous answer...")
+        return
+
+    # Apply persona modifications
+    persona_input = engine.apply_persona(user_text, st.session_state.persona)
+
+    # A session reaped while idle has to get back in line first
+    try:
+        position = admission.touch(st.session_state.job_key)
+    except Overloaded as e:
+        st.session_state.job_error = str(e)
+        return
+    if position:
+        st.toast(f"⏳ Lots of candidates right now. You are #{position} in line; please send your answer again in a moment.")
+        return
+
+    # The answer shows up right away; the reply is generated in the background
+    engine.record_answer(persona_input)
+    # With voice on, the reply is spoken sentence by sentence while the
+    # model is still writing it (see play_reply_stream)
+    stream = ReplyStream() if st.session_state.tts_enabled else None
+    job = jobs.submit(
+        st.session_state.job_key, "turn", _run_turn, st.session_state.session_id, persona_input,
+        stream, time.perf_counter(),
+        session_id=st.session_state.session_id
+    )
+    if job is not None and stream is not None:
+        st.session_state.reply_stream = (job.id, len(engine.transcript), stream)
+    st.session_state.chat_page = 0
+
+
+def _run_turn(session_id: str, answer: str, stream: ReplyStream = None, submitted: float = None):
+    with profiler.turn(session_id, "turn"):
+        engine = session_pool.get(session_id)
+        if admission.degraded:
+            engine.shorten()
+
+        if stream is None:
+            with admission.llm_slot() as granted:
+                reply = engine.respond(answer) if granted else engine.respond_local(answer)
+            session_pool.save(engine)
+            return reply
+
+        parts = []
+
+        def pieces():
+            # The LLM slot is released as soon as the text is complete,
+            # before the last sentences are synthesized
+            with admission.llm_slot() as granted:
+                replies = engine.respond_stream(answer) if granted else [engine.respond_local(answer)]
+                for piece in replies:
+                    parts.append(piece)
+                    stream.put("text", piece)
+                    yield piece
+
+        try:
+            pipeline = VoiceOutputPipeline(tts_handler)
+            for segment in pipeline.speak(pieces(), started=submitted):
+                stream.put("audio", segment)
+        finally:
+            stream.close()
+        session_pool.save(engine)
+        return "".join(parts)
+
+
+# ------------------------------
+# Background Job Results
+# ------------------------------
+def collect_finished_job():
+    """
+    Apply the result of this session's finished background job, if any.
+    """
+    job = jobs.pop_finished(st.session_state.job_key)
+    if job is None:
+        return
+
+    error = job.error()
+    if error is not None:
+        st.session_state.job_error = f"The interviewer could not respond: {error}"
+        if job.kind == "start":
+            st.session_state.interview_active = False
+            admission.release(st.session_state.job_key)
+        elif job.kind == "feedback":
+            st.session_state.awaiting_feedback = False
+        return
+
+    if job.kind == "start":
+        st.session_state.engine_ready = True
+
+    elif job.kind == "turn":
+        # The engine already added the reply to the shared transcript
+        st.session_state.chat_page = 0
+
+    elif job.kind == "feedback":
+        finish_interview(job.result())
+
+
+@st.fragment(run_every=Config.JOB_POLL_SECONDS)
+def poll_job(label: str):
+    """
+    Show progress of the in-flight job and rerun the page once it is done.
+    Only this fragment reruns while waiting, so the page stays responsive.
+    """
+    job = jobs.get(st.session_state.job_key)
+    if job is None:
+        return
+    if job.finished:
+        st.rerun()
+    st.caption(f"⏳ {label} ({job.elapsed():.0f}s)")
+
+
+# ------------------------------
+# Chat Display
+# ------------------------------
+@st.fragment
+def render_chat():
+    """
+    Draw one page of the conversation, newest page by default. Each run
+    draws at most TRANSCRIPT_PAGE_SIZE turns however long the interview
+    gets, and paging back reruns only this fragment.
+    """
+    transcript = st.session_state.transcript
+    page_size = Config.TRANSCRIPT_PAGE_SIZE
+    pages = transcript.page_count(page_size)
+    page = min(st.session_state.chat_page, pages - 1)
+
+    if page < pages - 1 and st.button("⬆️ Show earlier turns", key="chat_earlier"):
+        st.session_state.chat_page = page + 1
+        st.rerun(scope="fragment")
+
+    start, turns = transcript.page(page, page_size)
+    for turn in turns:
+        if turn.role == "interviewer":
+            with st.chat_message("assistant", avatar="👔"):
+                st.write(turn.content)
+        else:
+            with st.chat_message("user", avatar="🙋"):
+                st.write(turn.content)
+
+    if page > 0:
+        st.caption(f"Turns {start + 1}–{start + len(turns)} of {len(transcript)}")
+        if st.button("⬇️ Back to latest", key="chat_latest"):
+            st.session_state.chat_page = 0
+            st.rerun(scope="fragment")
+
+
+# ------------------------------
+# Voice Output
+# ------------------------------
+def speak_latest_reply():
+    """
+    Speak the newest interviewer message once, sentence by sentence:
+    the first sentence starts playing while later ones are synthesized.
+    """
+    transcript = st.session_state.transcript
+    last = len(transcript) - 1
+
+    if not st.session_state.tts_enabled or last < 0:
+        return
+    if transcript[last].role != "interviewer" or st.session_state.spoken_index == last:
+        return
+
+    st.session_state.spoken_index = last
+    turn = f"{st.session_state.session_id}-{last}"
+
+    pipeline = VoiceOutputPipeline(tts_handler)
+    for seq, (audio, mime) in enumerate(pipeline.speak([transcript[last].content])):
+        render_audio_segment(audio, mime, turn, seq)
+
+
+def play_reply_stream(job) -> bool:
+    """
+    Show and speak the reply of this session's turn job while it is
+    being produced. Returns False if the job has no reply stream (voice
+    off, or already played), so the caller polls instead.
+    """
+    entry = st.session_state.reply_stream
+    if entry is None or entry[0] != job.id:
+        return False
+
+    # Played once: a rerun mid-reply falls back to polling, not a replay
+    st.session_state.reply_stream = None
+    _, index, stream = entry
+    st.session_state.spoken_index = index
+    turn = f"{st.session_state.session_id}-{index}"
+
+    text = st.empty()
+    text.caption("⏳ Interviewer is thinking...")
+    reply, seq = "", 0
+    for kind, value in stream:
+        if kind == "text":
+            reply += value
+            text.write(reply)
+        else:
+            render_audio_segment(*value, turn, seq)
+            seq += 1
+
+    # No rerun afterwards: it would cut off the audio still playing
+    wait([job.future])
+    if job.error() is not None:
+        st.rerun()
+    return True
 
-            duration = (datetime.now() - st.session_state.start_time).total_seconds()
-            data = {
-                "session_id": st.session_state.session_id,
-                "role": st.session_state.role,
-                "persona": st.session_state.persona,
-                "input_mode": st.session_state.input_mode,
-                "timestamp_start": st.session_state.start_time.isoformat(),
-                "duration_seconds": int(duration),
-                "messages": st.session_state.messages,
-                "feedback": feedback
-            }
-            storage.save_interview(data)
 
+# ------------------------------
+# End Interview & Generate Feedback
+# ------------------------------
+def end_interview():
+    # Ending early abandons a turn (or the opening) still in flight
+    jobs.cancel(st.session_state.job_key)
+
+    engine = current_engine()
+    if engine is None:
         st.session_state.interview_active = False
+        admission.release(st.session_state.job_key)
+        return
+
+    # A cancelled reply that arrives late must not change the saved interview
+    engine.transcript.freeze()
+    transcript = engine.get_transcript()
+    job = jobs.submit(
+        st.session_state.job_key, "feedback", _run_feedback,
+        st.session_state.session_id, st.session_state.role, transcript,
+        session_id=st.session_state.session_id
+    )
+    st.session_state.awaiting_feedback = job is not None
+
+
+def _run_feedback(session_id: str, role: str, transcript: str):
+    with profiler.turn(session_id, "feedback"):
+        # Feedback has no local fallback: wait in line for a slot
+        with admission.llm_slot(timeout=None):
+            return FeedbackAnalyzer(session_id=session_id).analyze_interview(role, transcript)
+
+
+def finish_interview(feedback):
+    st.session_state.feedback_data = feedback
+    st.session_state.show_feedback = True
+    st.session_state.awaiting_feedback = False
+
+    engine = current_engine()
+    if engine is not None:
+        st.session_state.transcript = engine.transcript
+        # Closes the session journal and folds it into the final record
+        data = session_pool.complete(engine, feedback)
+    else:
+        duration = (datetime.now() - st.session_state.start_time).total_seconds()
+        data = {
+            "session_id": st.session_state.session_id,
+            "role": st.session_state.role,
+            "persona": st.session_state.persona,
+            "input_mode": st.session_state.input_mode,
+            "timestamp_start": st.session_state.start_time.isoformat(),
+            "duration_seconds": int(duration),
+            "messages": st.session_state.transcript.to_dicts(),
+            "feedback": feedback
+        }
+    storage.save_interview(data)
+    session_pool.discard(st.session_state.session_id)
+    admission.release(st.session_state.job_key)
+    profiler.disable(st.session_state.session_id)
+
+    st.session_state.engine_ready = False
+    st.session_state.interview_active = False
 
 
 # ------------------------------
@@ -116,6 +490,13 @@ def end_interview():
 def display_feedback(feedback):
     st.header("📊 Interview Feedback")
 
+    if feedback is None:
+        st.warning("This interview was never finished, so there is no feedback.")
+        st.subheader("📝 Transcript")
+        for turn in st.session_state.transcript:
+            st.write(turn.line())
+        return
+
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
         st.metric("Overall Score", f"{feedback.get('overall_score', 0)}/10")
@@ -161,6 +542,82 @@ def display_feedback(feedback):
     st.write(feedback.get("summary", "N/A"))
 
 
+# ------------------------------
+# Progress Dashboard
+# ------------------------------
+def display_progress():
+    analytics = storage.analytics
+    analytics.refresh_if_changed()
+
+    series = analytics.moving_averages(window=3)
+    if len(series["overall_score"]) < 2:
+        st.info("Complete a few interviews to see your progress trends.")
+        return
+
+    st.caption("Scores over time (3-interview moving average)")
+    st.line_chart({metric: series[metric] for metric in METRICS})
+
+    st.caption("Trend per interview (score points gained per session)")
+    st.dataframe(analytics.role_trends(), use_container_width=True)
+
+
+# ------------------------------
+# History Entry
+# ------------------------------
+def render_history_entry(log, key_prefix: str):
+    with st.expander(f"{log['role'].title()} — {log['timestamp'][:10]} (Score: {log.get('overall_score', 'N/A')})"):
+        if st.button("View Session", key=f"{key_prefix}_{log['session_id']}"):
+            data = storage.load_interview(log['session_id'])
+            st.session_state.transcript = Transcript.from_dicts(data["messages"])
+            st.session_state.feedback_data = data["feedback"]
+            st.session_state.show_feedback = True
+            st.session_state.role = data["role"]
+            st.rerun()
+
+
+def render_unfinished_entry(summary):
+    label = f"{summary['role'].title()} — {summary['timestamp'][:10]} ({summary['turns']} turns)"
+    with st.expander(label):
+        if st.button("View Transcript", key=f"unfinished_{summary['session_id']}"):
+            data = get_journal().materialize(summary['session_id'])
+            st.session_state.transcript = Transcript.from_dicts(data["messages"])
+            st.session_state.feedback_data = None
+            st.session_state.show_feedback = True
+            st.session_state.role = data["role"]
+            st.rerun()
+
+
+# ------------------------------
+# Profiling Controls
+# ------------------------------
+def render_profiling_controls():
+    """
+    Switch CPU/memory profiling of interview turns on for this session
+    or the whole process, and list the newest artifacts.
+    """
+    session_id = st.session_state.session_id
+
+    profile_session = st.checkbox("Profile this session", value=st.session_state.profile_session)
+    if profile_session != st.session_state.profile_session:
+        st.session_state.profile_session = profile_session
+        if session_id:
+            (profiler.enable if profile_session else profiler.disable)(session_id)
+
+    process_wide = st.checkbox("Profile all sessions", value=profiler.process_wide)
+    if process_wide != profiler.process_wide:
+        profiler.set_process_wide(process_wide)
+
+    artifacts = profiler.artifacts(session_id) if session_id else []
+    if not artifacts:
+        st.caption(f"Profiles are written to `{profiler.directory}/<session_id>/`.")
+        return
+
+    st.caption(f"Newest profiles in `{os.path.dirname(artifacts[0])}`")
+    for path in artifacts[:6]:
+        with open(path, "rb") as f:
+            st.download_button(os.path.basename(path), f.read(), file_name=os.path.basename(path), key=f"profile_{path}")
+
+
 # ------------------------------
 # MAIN APP
 # ------------------------------
@@ -176,6 +633,42 @@ def main():
         st.markdown("### Text-to-Speech")
         st.session_state.tts_enabled = st.checkbox("Enable Voice Output", value=True)
 
+        warmup = warmup_job.progress()
+        if not warmup["finished"]:
+            st.progress(
+                warmup["done"] / max(warmup["total"], 1),
+                text=f"Warming voice cache: {warmup['done']}/{warmup['total']}"
+            )
+
+        engine = tts_handler.engine_stats()
+        st.caption(f"Engine: {engine['engine']} · avg synthesis {engine['avg_ms']:.0f} ms/chunk")
+
+        metrics = voice_metrics()
+        if metrics["samples"]:
+            st.caption(
+                f"Time to first audio: p50 {metrics['ttfa_p50'] * 1000:.0f} ms · "
+                f"p95 {metrics['ttfa_p95'] * 1000:.0f} ms ({metrics['samples']} replies)"
+            )
+
+        st.divider()
+
+        st.markdown("### Load")
+        load = admission.stats()
+        sessions, llm_calls = load["sessions"], load["llm_calls"]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Interviews", f"{sessions['active']}/{sessions['capacity']}")
+        col2.metric("Queued", sessions["waiting"])
+        col3.metric("Turned away", sessions["shed"])
+        st.caption(
+            f"LLM calls {llm_calls['active']}/{llm_calls['capacity']} · "
+            f"queue wait p95 {sessions['wait_p95_ms'] / 1000:.1f} s · "
+            f"{load['local_replies']} local replies"
+            + (" · ⚠️ degraded" if load["degraded"] else "")
+        )
+
+        with st.expander("🩺 Profiling (admin)"):
+            render_profiling_controls()
+
         st.divider()
 
         st.markdown("### Interview Stats")
@@ -184,6 +677,18 @@ def main():
         st.metric("Average Score", f"{stats.get('average_score', 0)}/10")
 
         st.divider()
+        st.markdown("### Audio Cache")
+        cache_stats = tts_handler.cache_stats()
+        st.caption(
+            f"{cache_stats['entries']}/{cache_stats['max_entries']} files "
+            f"({cache_stats['pinned']} pinned) · "
+            f"{cache_stats['bytes'] / 1_048_576:.1f}/{cache_stats['max_bytes'] / 1_048_576:.0f} MB"
+        )
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Hits", cache_stats["hits"])
+        col2.metric("Misses", cache_stats["misses"])
+        col3.metric("Evictions", cache_stats["evictions"])
+
         if st.button("🗑️ Clear Audio Cache"):
             tts_handler.clear_cache()
             st.success("Audio cache cleared.")
@@ -192,8 +697,18 @@ def main():
     if not validate_api_key():
         return
 
+    collect_finished_job()
+    if st.session_state.job_error:
+        st.error(st.session_state.job_error)
+        st.session_state.job_error = None
+
+    # Waiting for a free interview slot
+    if st.session_state.queued_start is not None:
+        st.title("🎤 Interview Practice Partner")
+        poll_admission()
+
     # Home screen
-    if not st.session_state.interview_active and not st.session_state.show_feedback:
+    elif not st.session_state.interview_active and not st.session_state.show_feedback:
         st.title("🎤 Interview Practice Partner")
         st.markdown("AI-powered interview simulation with **adaptive personas** and **intelligent feedback**.")
 
@@ -203,38 +718,66 @@ def main():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("💼 Sales Interview"):
-                start_new_interview("sales", st.session_state.persona, "text")
+                request_interview("sales", st.session_state.persona, "text")
                 st.rerun()
 
             if st.button("💻 Software Engineer"):
-                start_new_interview("engineer", st.session_state.persona, "text")
+                request_interview("engineer", st.session_state.persona, "text")
                 st.rerun()
 
         with col2:
             if st.button("🛍️ Retail Associate"):
-                start_new_interview("retail", st.session_state.persona, "text")
+                request_interview("retail", st.session_state.persona, "text")
                 st.rerun()
 
             if st.button("📋 Behavioral Interview"):
-                start_new_interview("behavioral", st.session_state.persona, "text")
+                request_interview("behavioral", st.session_state.persona, "text")
                 st.rerun()
 
+        st.divider()
+        st.subheader("📈 Progress")
+        display_progress()
+
         st.divider()
         st.subheader("📚 Previous Interviews")
 
-        history = storage.list_interviews(limit=10)
-        if history:
-            for log in history:
-                with st.expander(f"{log['role'].title()} — {log['timestamp'][:10]} (Score: {log.get('overall_score', 'N/A')})"):
-                    if st.button("View Session", key=log['session_id']):
-                        data = storage.load_interview(log['session_id'])
-                        st.session_state.messages = data["messages"]
-                        st.session_state.feedback_data = data["feedback"]
-                        st.session_state.show_feedback = True
-                        st.session_state.role = data["role"]
-                        st.rerun()
+        query = st.text_input("🔍 Search past interviews", placeholder="e.g. negotiation, Kubernetes")
+
+        if query:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                role_filter = st.selectbox("Role", ["all"] + list(Config.INTERVIEW_ROLES.keys()))
+            with col2:
+                persona_filter = st.selectbox("Candidate persona", ["all"] + Config.PERSONA_LIST)
+            with col3:
+                score_range = st.slider("Score range", 0, 10, (0, 10))
+
+            results = storage.search_interviews(
+                query,
+                role=None if role_filter == "all" else role_filter,
+                persona=None if persona_filter == "all" else persona_filter,
+                min_score=score_range[0] if score_range != (0, 10) else None,
+                max_score=score_range[1] if score_range != (0, 10) else None,
+            )
+            if results:
+                for log in results:
+                    render_history_entry(log, key_prefix="search")
+            else:
+                st.info("No interviews match your search.")
         else:
-            st.info("No previous sessions found.")
+            history = storage.list_interviews(limit=10)
+            if history:
+                for log in history:
+                    render_history_entry(log, key_prefix="history")
+            else:
+                st.info("No previous sessions found.")
+
+            # Journals without an end record: crashed, timed out or abandoned
+            unfinished = get_journal().unfinished(exclude=session_pool.resident_ids())
+            if unfinished:
+                st.caption("Unfinished interviews")
+                for summary in unfinished[:10]:
+                    render_unfinished_entry(summary)
 
     # Interview Active
     elif st.session_state.interview_active:
@@ -243,27 +786,32 @@ def main():
 
         st.divider()
 
-        # Chat display
-        for msg in st.session_state.messages:
-            if msg["role"] == "interviewer":
-                with st.chat_message("assistant", avatar="👔"):
-                    st.write(msg["content"])
-            else:
-                with st.chat_message("user", avatar="🙋"):
-                    st.write(msg["content"])
+        engine = current_engine()
+        if engine is not None:
+            st.session_state.transcript = engine.transcript
 
-        # User input
-        if not st.session_state.interview_engine.is_complete():
-            user_text = st.chat_input("Type your answer here...")
+        render_chat()
+        speak_latest_reply()
 
-            if user_text:
-                # Apply persona modifications
-                persona_input = st.session_state.interview_engine.apply_persona(user_text, st.session_state.persona)
+        pending = jobs.get(st.session_state.job_key)
 
-                st.session_state.messages.append({"role": "candidate", "content": persona_input})
-                reply = st.session_state.interview_engine.process_answer(persona_input)
+        if st.session_state.awaiting_feedback:
+            poll_job("Analyzing your interview performance...")
 
-                st.session_state.messages.append({"role": "interviewer", "content": reply})
+        elif engine is None or not engine.is_complete():
+            if pending is not None:
+                with st.chat_message("assistant", avatar="👔"):
+                    if not play_reply_stream(pending):
+                        poll_job("Interviewer is thinking...")
+
+            # User input
+            user_text = st.chat_input(
+                "Type your answer here...",
+                disabled=engine is None or (pending is not None and not pending.finished)
+            )
+
+            if user_text:
+                submit_answer(user_text)
                 st.rerun()
 
             if st.button("✅ End Interview & Get Feedback"):
@@ -284,7 +832,7 @@ def main():
         if st.button("🔄 Start New Interview"):
             st.session_state.show_feedback = False
             st.session_state.feedback_data = None
-            st.session_state.messages = []
+            st.session_state.transcript = Transcript()
             st.rerun()
 
 
@@ -0,0 +1,115 @@
+"""
+Throughput of the headless interview service against the stub LLM.
+
+Runs full interviews (start, answers, end) through the ASGI app in-process
+at increasing concurrency on a single event loop, i.e. one core. Since the
+stub only sleeps, the numbers measure the service's own overhead per turn
+and how many concurrent sessions one core can carry.
+
+Run from the project root:
+    python -m benchmarks.bench_service_throughput
+    python -m benchmarks.bench_service_throughput --concurrency 10 100 1000 --answers 6 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from functools import partial
+from typing import Dict, List, Tuple
+
+from src.agents.admission import AdmissionController
+from src.llm.stub_client import StubLLMClient
+from src.service.asgi import InterviewService
+from src.service.sessions import SessionManager
+
+
+ANSWER = "I led the migration of our billing service and cut failed payments by a third."
+
+
+async def call(app, method: str, path: str, body: Dict = None) -> Tuple[int, Dict]:
+    """Minimal in-memory ASGI client."""
+    raw = json.dumps(body or {}).encode()
+    scope = {"type": "http", "method": method, "path": path, "query_string": b""}
+    response = {"status": None, "body": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": raw, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        else:
+            response["body"] += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return response["status"], json.loads(response["body"])
+
+
+async def run_session(app, answers: int, latencies: List[float]):
+    started = time.perf_counter()
+    _, result = await call(app, "POST", "/sessions", {"role": "engineer"})
+    latencies.append(time.perf_counter() - started)
+    session_id = result["session_id"]
+
+    for _ in range(answers):
+        started = time.perf_counter()
+        await call(app, "POST", f"/sessions/{session_id}/answer", {"text": ANSWER})
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await call(app, "POST", f"/sessions/{session_id}/end")
+    latencies.append(time.perf_counter() - started)
+
+
+async def run_level(concurrency: int, answers: int, latency_ms: int) -> Dict:
+    # Admission caps sized to the level: this measures raw capacity, not shedding
+    manager = SessionManager(
+        llm_factory=partial(StubLLMClient, latency_ms=latency_ms),
+        persist=False,
+        admission=AdmissionController(max_sessions=concurrency, max_llm_calls=concurrency),
+    )
+    app = InterviewService(manager)
+    latencies: List[float] = []
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    await asyncio.gather(*(run_session(app, answers, latencies) for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    latencies.sort()
+    utilization = cpu / wall if wall else 0.0
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "requests_per_s": len(latencies) / wall,
+        "cpu_ms_per_request": cpu / len(latencies) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "core_utilization": utilization,
+        # Sessions one fully busy core could carry at this LLM latency
+        "sessions_per_core": concurrency / utilization if utilization else float("inf"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service throughput against the stub LLM.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--answers", type=int, default=6, help="answers per interview (default 6)")
+    parser.add_argument("--latency-ms", type=int, default=100, help="stub LLM latency (default 100)")
+    args = parser.parse_args()
+
+    print(f"stub latency {args.latency_ms} ms, {args.answers} answers per interview, 1 event loop\n")
+    print(f"{'sessions':>9}{'req/s':>10}{'cpu ms/req':>12}{'p50 ms':>10}{'p95 ms':>10}"
+          f"{'core use':>10}{'sessions/core':>15}")
+    for concurrency in args.concurrency:
+        r = asyncio.run(run_level(concurrency, args.answers, args.latency_ms))
+        print(f"{r['concurrency']:>9}{r['requests_per_s']:>10.0f}{r['cpu_ms_per_request']:>12.2f}"
+              f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['core_utilization']:>9.0%}"
+              f"{r['sessions_per_core']:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Micro-benchmarks for TTS text preparation on long inputs.
+
+Run from the project root:
+    python -m benchmarks.bench_tts_text
+"""
+
+import timeit
+
+from src.voice.text import chunk_text, make_cache_key, normalize_text
+
+
+SENTENCE = (
+    "Tell me about a time you disagreed with a teammate, what you did about it, "
+    "and how it turned out in the end. "
+)
+SIZES = (1_000, 10_000, 100_000)
+
+
+def legacy_chunk_text(text: str, max_len: int = 180):
+    """The previous word-by-word chunker (quadratic in chunk length)."""
+    words = text.split()
+    chunks = []
+    current = []
+    for word in words:
+        if len(" ".join(current + [word])) > max_len:
+            chunks.append(" ".join(current))
+            current = []
+        current.append(word)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def bench(fn, text: str) -> float:
+    runs, total = timeit.Timer(lambda: fn(text)).autorange()
+    return total / runs * 1000
+
+
+def main():
+    cases = [
+        ("normalize_text", normalize_text),
+        ("make_cache_key", lambda t: make_cache_key(t, "gtts", "en", False)),
+        ("chunk_text", chunk_text),
+        ("legacy_chunk_text", legacy_chunk_text),
+    ]
+
+    print(f"{'case':<20}" + "".join(f"{size:>14,} chars" for size in SIZES))
+    for name, fn in cases:
+        row = f"{name:<20}"
+        for size in SIZES:
+            text = (SENTENCE * (size // len(SENTENCE) + 1))[:size]
+            row += f"{bench(fn, text):>17.3f} ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
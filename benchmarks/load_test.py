@@ -0,0 +1,350 @@
+"""
+Load test with synthetic candidates.
+
+Simulates N candidates spread over the interview roles and candidate
+personas (Config.PERSONAS). Each one runs a full interview through
+InterviewEngine and FeedbackAnalyzer: opening, answers shaped by
+apply_persona until the interviewer closes, then feedback. Candidates
+run concurrently on one event loop using the engines' async API.
+
+Reports per turn type (start, question, probe, closing, feedback):
+- p50/p95/p99 latency
+- throughput
+- error rates
+- tokens per session
+Output is a text table and, optionally, JSON, for capacity planning and
+for comparing runs before a release.
+
+The LLM clients return plain text, so token counts are estimated from
+prompt and reply length (about 4 characters per token). Gemini swallows
+API errors and returns a fixed apology; those replies count as errors.
+
+Run from the project root:
+    python -m benchmarks.load_test --sessions 200 --concurrency 50
+    python -m benchmarks.load_test --backend gemini --sessions 10 --concurrency 2 --json load.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from functools import partial
+from typing import Dict, List, Optional
+
+from src.agents.interview_engine import InterviewEngine
+from src.config import Config
+from src.feedback.analyzer import FeedbackAnalyzer
+from src.llm.factory import create_llm_client
+from src.llm.gemini_client import ERROR_REPLIES
+
+
+TURN_TYPES = ("start", "question", "probe", "closing", "feedback")
+
+CHARS_PER_TOKEN = 4
+
+ANSWERS = {
+    "sales": [
+        "I closed a two year contract with a logistics customer after three months of negotiation.",
+        "I qualify leads by budget and timeline first, then focus on the ones that can sign this quarter.",
+        "When a customer pushed back on price I reframed the deal around the cost of their downtime.",
+    ],
+    "engineer": [
+        "I led the migration of our billing service and cut failed payments by a third.",
+        "I tracked down a race condition in our job queue by adding tracing around every lock.",
+        "I split a monolith endpoint into three services and added contract tests between them.",
+    ],
+    "retail": [
+        "A customer was upset about a missing order so I found a replacement and gave them a discount.",
+        "During the holiday rush I reorganized the stockroom so restocking took half the time.",
+        "I trained two new colleagues on the register and the returns process in their first week.",
+    ],
+    "behavioral": [
+        "I disagreed with my manager about a deadline, shared the data, and we agreed on a phased release.",
+        "I took over a struggling project, set weekly goals, and we delivered a month later than planned.",
+        "I made a call with incomplete data, documented the risks, and revisited it after a week.",
+    ],
+}
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+class MeteredClient:
+    """
+    Wraps an LLM client to count calls, estimated tokens and error
+    replies. Everything else is passed through.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.calls = 0
+        self.tokens = 0
+        self.error_replies = 0
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def _meter(self, prompt: str, reply: str) -> str:
+        self.calls += 1
+        self.tokens += estimate_tokens(prompt) + estimate_tokens(reply)
+        if reply in ERROR_REPLIES:
+            self.error_replies += 1
+        return reply
+
+    async def start_chat_async(self, system_instruction=None):
+        await self._client.start_chat_async(system_instruction)
+        if system_instruction:
+            self.tokens += estimate_tokens(system_instruction)
+
+    async def send_message_async(self, message):
+        return self._meter(message, await self._client.send_message_async(message))
+
+    async def generate_content_async(self, prompt):
+        return self._meter(prompt, await self._client.generate_content_async(prompt))
+
+
+class Results:
+    """Latencies and errors collected across all candidates."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.error_kinds: Counter = Counter()
+        self.sessions: List[Dict] = []
+
+    def record(self, turn_type: str, seconds: float):
+        self.latencies[turn_type].append(seconds)
+
+    def fail(self, turn_type: str, error: BaseException):
+        self.errors[turn_type] += 1
+        self.error_kinds[type(error).__name__] += 1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_candidate(
+    results: Results,
+    role: str,
+    persona: str,
+    llm_factory,
+    max_answers: int,
+    rng: random.Random,
+):
+    llm = MeteredClient(llm_factory())
+    engine = InterviewEngine(role, llm=llm, start_chat=False, persona=persona)
+    session = {"role": role, "persona": persona, "answers": 0, "completed": False}
+    turn_type = "start"
+    wall_start = time.perf_counter()
+
+    try:
+        await engine.start_chat_async()
+
+        started = time.perf_counter()
+        await engine.start_interview_async()
+        results.record(turn_type, time.perf_counter() - started)
+
+        while not engine.is_complete() and session["answers"] < max_answers:
+            answer = engine.apply_persona(rng.choice(ANSWERS[role]), persona)
+            started = time.perf_counter()
+            await engine.process_answer_async(answer)
+            # The engine records which kind of reply it just planned
+            turn_type = engine.state["current_state"]
+            results.record(turn_type, time.perf_counter() - started)
+            session["answers"] += 1
+
+        turn_type = "feedback"
+        analyzer = FeedbackAnalyzer(llm=MeteredClient(llm_factory()))
+        started = time.perf_counter()
+        await analyzer.analyze_interview_async(role, engine.get_transcript())
+        results.record(turn_type, time.perf_counter() - started)
+        llm.calls += analyzer.gemini.calls
+        llm.tokens += analyzer.gemini.tokens
+        llm.error_replies += analyzer.gemini.error_replies
+
+        session["completed"] = engine.is_complete()
+    except Exception as e:
+        results.fail(turn_type, e)
+        session["error"] = f"{type(e).__name__}: {e}"
+
+    session.update({
+        "seconds": time.perf_counter() - wall_start,
+        "llm_calls": llm.calls,
+        "tokens": llm.tokens,
+        "error_replies": llm.error_replies,
+    })
+    results.sessions.append(session)
+
+
+async def run_load(
+    sessions: int,
+    concurrency: int,
+    roles: List[str],
+    personas: List[str],
+    llm_factory,
+    max_answers: int,
+    seed: int,
+) -> Dict:
+    results = Results()
+    rng = random.Random(seed)
+    gate = asyncio.Semaphore(concurrency)
+
+    # Round-robin over every role x persona pair, so each one is exercised
+    mix = itertools.cycle([(role, persona) for role in roles for persona in personas])
+
+    async def candidate(role, persona):
+        async with gate:
+            await run_candidate(results, role, persona, llm_factory, max_answers, rng)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(candidate(*next(mix)) for _ in range(sessions)))
+    wall = time.perf_counter() - wall_start
+
+    return summarize(results, wall, concurrency)
+
+
+def summarize(results: Results, wall: float, concurrency: int) -> Dict:
+    turns = {}
+    for turn_type in TURN_TYPES:
+        values = sorted(results.latencies.get(turn_type, []))
+        errors = results.errors.get(turn_type, 0)
+        attempts = len(values) + errors
+        if not attempts:
+            continue
+        turns[turn_type] = {
+            "count": len(values),
+            "errors": errors,
+            "error_rate": errors / attempts,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+            "max_ms": values[-1] * 1000 if values else 0.0,
+        }
+
+    sessions = results.sessions
+    failed = sum(1 for s in sessions if "error" in s)
+    tokens = sorted(s["tokens"] for s in sessions)
+    total_turns = sum(len(v) for v in results.latencies.values())
+
+    by_persona = defaultdict(list)
+    for s in sessions:
+        by_persona[s["persona"]].append(s)
+
+    return {
+        "sessions": len(sessions),
+        "concurrency": concurrency,
+        "wall_seconds": wall,
+        "throughput": {
+            "sessions_per_s": len(sessions) / wall if wall else 0.0,
+            "turns_per_s": total_turns / wall if wall else 0.0,
+        },
+        "errors": {
+            "failed_sessions": failed,
+            "session_error_rate": failed / len(sessions) if sessions else 0.0,
+            "error_replies": sum(s["error_replies"] for s in sessions),
+            "by_type": dict(results.error_kinds),
+        },
+        "tokens_per_session": {
+            "mean": sum(tokens) / len(tokens) if tokens else 0.0,
+            "p50": percentile(tokens, 50),
+            "p95": percentile(tokens, 95),
+        },
+        "turns": turns,
+        "personas": {
+            persona: {
+                "sessions": len(group),
+                "completion_rate": sum(s["completed"] for s in group) / len(group),
+                "mean_answers": sum(s["answers"] for s in group) / len(group),
+                "mean_tokens": sum(s["tokens"] for s in group) / len(group),
+            }
+            for persona, group in sorted(by_persona.items())
+        },
+    }
+
+
+def print_report(report: Dict, out=sys.stdout):
+    throughput = report["throughput"]
+    errors = report["errors"]
+    tokens = report["tokens_per_session"]
+
+    print(
+        f"{report['sessions']} sessions, concurrency {report['concurrency']}, "
+        f"{report['wall_seconds']:.1f} s wall\n"
+        f"throughput {throughput['sessions_per_s']:.2f} sessions/s, "
+        f"{throughput['turns_per_s']:.1f} turns/s\n"
+        f"errors: {errors['failed_sessions']} failed sessions "
+        f"({errors['session_error_rate']:.1%}), {errors['error_replies']} error replies\n"
+        f"tokens/session (est.): mean {tokens['mean']:.0f}, p50 {tokens['p50']}, p95 {tokens['p95']}\n",
+        file=out,
+    )
+
+    print(f"{'turn':<10}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}", file=out)
+    for turn_type, t in report["turns"].items():
+        print(
+            f"{turn_type:<10}{t['count']:>8}{t['errors']:>8}{t['p50_ms']:>10.1f}"
+            f"{t['p95_ms']:>10.1f}{t['p99_ms']:>10.1f}{t['max_ms']:>10.1f}",
+            file=out,
+        )
+
+    print(f"\n{'persona':<10}{'sessions':>10}{'completed':>11}{'answers':>10}{'tokens':>10}", file=out)
+    for persona, p in report["personas"].items():
+        print(
+            f"{persona:<10}{p['sessions']:>10}{p['completion_rate']:>11.0%}"
+            f"{p['mean_answers']:>10.1f}{p['mean_tokens']:>10.0f}",
+            file=out,
+        )
+
+    if errors["by_type"]:
+        print("\nerror types: " + ", ".join(f"{k} x{v}" for k, v in errors["by_type"].items()), file=out)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Persona-driven load test of full interviews.")
+    parser.add_argument("--sessions", type=int, default=100, help="candidates in total (default 100)")
+    parser.add_argument("--concurrency", type=int, default=20, help="candidates at once (default 20)")
+    parser.add_argument("--roles", nargs="+", default=list(Config.INTERVIEW_ROLES), choices=list(Config.INTERVIEW_ROLES))
+    parser.add_argument("--personas", nargs="+", default=Config.PERSONA_LIST, choices=Config.PERSONA_LIST)
+    parser.add_argument("--backend", default="stub", choices=["stub", "gemini"])
+    parser.add_argument("--latency-ms", type=int, default=None, help="stub LLM latency (default STUB_LLM_LATENCY_MS)")
+    parser.add_argument("--max-answers", type=int, default=20, help="safety cap on answers per interview")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    if args.backend == "stub":
+        from src.llm.stub_client import StubLLMClient
+        llm_factory = partial(StubLLMClient, latency_ms=args.latency_ms)
+    else:
+        llm_factory = partial(create_llm_client, backend="gemini")
+
+    report = asyncio.run(run_load(
+        args.sessions, args.concurrency, args.roles, args.personas,
+        llm_factory, args.max_answers, args.seed,
+    ))
+    report["backend"] = args.backend
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nJSON report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Cold-start import benchmark based on `python -X importtime`.
+
+Imports the modules app.py imports in a fresh interpreter, several times,
+and reports the median cumulative import time per module, the slowest
+transitive imports, and any heavy SDK that was imported eagerly (those
+should only load on first real use, see src/lazy.py).
+
+Run from the project root:
+    python -m benchmarks.startup_importtime
+    python -m benchmarks.startup_importtime --runs 10 --top 25 --with-streamlit
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+# Project modules imported by app.py at startup
+APP_IMPORTS = [
+    "src.config",
+    "src.agents.interview_engine",
+    "src.agents.job_executor",
+    "src.feedback.analyzer",
+    "src.storage.manager",
+    "src.storage.summary",
+    "src.voice.output_handler",
+    "src.voice.input_handler",
+    "src.voice.pipeline",
+    "src.voice.prewarm",
+    "src.ui.audio_player",
+]
+
+# SDKs that must not be imported before first use
+DEFERRED = [
+    "google.generativeai",
+    "speech_recognition",
+    "gtts",
+    "vosk",
+    "ffmpeg",
+]
+
+
+def run_once(modules: List[str]) -> List[Tuple[int, str, int, int]]:
+    """
+    Import the modules in a fresh interpreter.
+    Returns (depth, module, self_us, cumulative_us) per imported module.
+    """
+    code = "\n".join(f"import {name}" for name in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure app cold-start import time.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to start (default 5)")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list (default 15)")
+    parser.add_argument("--with-streamlit", action="store_true", help="include streamlit itself")
+    args = parser.parse_args()
+
+    modules = (["streamlit"] if args.with_streamlit else []) + APP_IMPORTS
+
+    cumulative: Dict[str, List[int]] = defaultdict(list)
+    totals: List[int] = []
+    imported = set()
+
+    for _ in range(args.runs):
+        rows = run_once(modules)
+        totals.append(sum(cum for depth, _, _, cum in rows if depth == 0))
+        for _, name, _, cum in rows:
+            cumulative[name].append(cum)
+            imported.add(name)
+
+    median_ms = {name: statistics.median(values) / 1000 for name, values in cumulative.items()}
+
+    print(f"Total import time: {statistics.median(totals) / 1000:.1f} ms "
+          f"(median of {args.runs} runs, min {min(totals) / 1000:.1f} ms)")
+    print()
+
+    print(f"{'app module':<36}{'cumulative':>14}")
+    for name in modules:
+        print(f"{name:<36}{median_ms.get(name, 0.0):>11.1f} ms")
+    print()
+
+    print(f"{'slowest imports':<36}{'cumulative':>14}")
+    for name, ms in sorted(median_ms.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<36}{ms:>11.1f} ms")
+    print()
+
+    eager = [name for name in DEFERRED if name in imported]
+    if eager:
+        print("Imported eagerly (should be lazy): " + ", ".join(eager))
+        sys.exit(1)
+    print("Heavy SDKs deferred: " + ", ".join(DEFERRED))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+Micro-benchmark suite for the hot paths, with saved baselines.
+
+Cases (name[size]):
+    storage.list_interviews[n]      StorageManager.list_interviews() over n saved sessions
+    storage.get_stats[n]            StorageManager.get_stats() over n saved sessions
+    tts.chunk_text[chars]           TTSHandler._chunk_text() on long interviewer text
+    tts.cache_key[chars]            cache-path hashing (TTSHandler._get_cache_filename)
+    engine.analyze[words]           InterviewEngine.analyze() on long answers
+    engine.get_transcript[turns]    InterviewEngine.get_transcript() on a freshly loaded transcript
+    feedback.parse[kind]            parse_feedback() on clean, fenced and malformed model output
+
+Synthetic sessions are generated once per size in the temp directory and
+reused by later runs; 100k sessions take a minute or two to create the
+first time (use --quick to stop at 10k).
+
+Run from the project root:
+    python -m benchmarks.suite run --save benchmarks/baselines/main.json
+    python -m benchmarks.suite compare benchmarks/baselines/main.json
+    python -m benchmarks.suite compare old.json new.json --threshold 0.1
+    python -m benchmarks.suite run --filter storage --quick
+
+compare exits with status 1 if any case got slower than the baseline by
+more than --threshold (default 25%), so it can gate a release. Baselines
+are only comparable on the same machine.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config import Config
+
+
+BASELINE_VERSION = 1
+
+STORAGE_SIZES = (1_000, 10_000, 100_000)
+TEXT_SIZES = (1_000, 10_000, 100_000)
+TRANSCRIPT_SIZES = (100, 1_000, 10_000)
+
+SENTENCE = (
+    "Tell me about a time you disagreed with a teammate, what you did about it, "
+    "and how it turned out in the end. "
+)
+
+
+# ------------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------------
+def synthetic_session(i: int, rng: random.Random) -> Dict:
+    role = rng.choice(list(Config.INTERVIEW_ROLES))
+    started = datetime(2024, 1, 1) + timedelta(minutes=37 * i)
+    scores = {name: rng.randint(3, 10) for name in
+              ("communication", "structure", "confidence", "content_quality", "role_fit")}
+    return {
+        "session_id": f"{started.strftime('%Y%m%d_%H%M%S')}_{i:06x}",
+        "role": role,
+        "persona": rng.choice(Config.PERSONA_LIST),
+        "input_mode": "text",
+        "timestamp_start": started.isoformat(),
+        "duration_seconds": rng.randint(120, 1800),
+        "messages": [
+            {"role": "interviewer", "content": "Tell me about yourself."},
+            {"role": "candidate", "content": "I build backend services and lead a small team."},
+            {"role": "interviewer", "content": "What was the hardest bug you fixed?"},
+            {"role": "candidate", "content": "A race condition in our job queue under load."},
+        ],
+        "feedback": {
+            "overall_score": round(sum(scores.values()) / len(scores)),
+            "scores": scores,
+            "strengths": ["Clear structure"],
+            "improvements": ["Quantify results"],
+            "summary": "Synthetic session.",
+        },
+    }
+
+
+def session_fixture(n: int) -> str:
+    """Directory with n saved sessions, created on first use."""
+    directory = os.path.join(tempfile.gettempdir(), f"interview-bench-sessions-{n}")
+    interviews = os.path.join(directory, "interviews")
+    marker = os.path.join(directory, ".complete")
+    if os.path.exists(marker):
+        return directory
+
+    print(f"  generating {n:,} synthetic sessions in {directory} ...", file=sys.stderr)
+    os.makedirs(interviews, exist_ok=True)
+    rng = random.Random(n)
+    base = datetime(2024, 1, 1).timestamp()
+    for i in range(n):
+        data = synthetic_session(i, rng)
+        path = os.path.join(interviews, f"{data['session_id']}_{data['role']}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        # Distinct, increasing mtimes like real history
+        os.utime(path, (base + i * 60, base + i * 60))
+
+    open(marker, "w").close()
+    return directory
+
+
+def storage_for(n: int):
+    """
+    A StorageManager pointed at the n-session fixture. Repoints the
+    process-wide Config paths, which is fine for a benchmark process.
+    """
+    directory = session_fixture(n)
+    Config.INTERVIEWS_DIR = os.path.join(directory, "interviews")
+    Config.SEARCH_INDEX_PATH = os.path.join(directory, "search_index.sqlite3")
+    Config.ANALYTICS_CACHE_PATH = os.path.join(directory, "analytics_cache.npz")
+
+    from src.storage.manager import StorageManager
+    return StorageManager()
+
+
+def long_text(size: int) -> str:
+    return (SENTENCE * (size // len(SENTENCE) + 1))[:size]
+
+
+# ------------------------------------------------------------
+# Cases: each factory does its setup and returns the timed callable
+# ------------------------------------------------------------
+def case_list_interviews(n: int) -> Callable:
+    storage = storage_for(n)
+    return lambda: storage.list_interviews(limit=50)
+
+
+def case_get_stats(n: int) -> Callable:
+    storage = storage_for(n)
+    return storage.get_stats
+
+
+def case_chunk_text(size: int) -> Callable:
+    from src.voice.text import chunk_text
+    text = long_text(size)
+    return lambda: chunk_text(text)
+
+
+def case_cache_key(size: int) -> Callable:
+    from src.voice.text import make_cache_key
+    text = long_text(size)
+    return lambda: make_cache_key(text, "gtts", Config.TTS_LANGUAGE, Config.TTS_SLOW)
+
+
+def _engine():
+    from src.agents.interview_engine import InterviewEngine
+    from src.llm.stub_client import StubLLMClient
+    return InterviewEngine("engineer", llm=StubLLMClient(latency_ms=0), start_chat=False)
+
+
+def case_analyze(words: int) -> Callable:
+    engine = _engine()
+    answer = " ".join((SENTENCE.split() * (words // 20 + 1))[:words])
+    return lambda: engine.analyze(answer)
+
+
+def case_get_transcript(turns: int) -> Callable:
+    from src.agents.transcript import Transcript
+    engine = _engine()
+    dicts = [
+        {"role": "interviewer" if i % 2 == 0 else "candidate", "content": SENTENCE}
+        for i in range(turns)
+    ]
+
+    def run():
+        # As after a resume: the transcript text is not cached yet
+        engine.transcript = Transcript.from_dicts(dicts)
+        return engine.get_transcript()
+
+    return run
+
+
+FEEDBACK_JSON = json.dumps({
+    "overall_score": 7,
+    "scores": {"communication": 7, "structure": 6, "confidence": 8, "content_quality": 7, "role_fit": 7},
+    "strengths": ["Clear structure", "Relevant examples", "Calm delivery"],
+    "improvements": ["Quantify results", "Shorter answers", "Use the STAR format"],
+    "best_answer": "The project walkthrough.",
+    "needs_work": "The conflict example.",
+    "summary": "Solid interview. " * 20,
+})
+
+FEEDBACK_OUTPUTS = {
+    "clean": FEEDBACK_JSON,
+    "fenced": f"```json\n{FEEDBACK_JSON}\n```",
+    "malformed": "Here is the feedback: " + FEEDBACK_JSON[:-10],
+}
+
+
+def case_parse_feedback(kind: str) -> Callable:
+    from src.feedback.analyzer import parse_feedback
+    raw = FEEDBACK_OUTPUTS[kind]
+    return lambda: parse_feedback(raw)
+
+
+CASES: List[Tuple[str, Tuple, Callable]] = [
+    ("storage.list_interviews", STORAGE_SIZES, case_list_interviews),
+    ("storage.get_stats", STORAGE_SIZES, case_get_stats),
+    ("tts.chunk_text", TEXT_SIZES, case_chunk_text),
+    ("tts.cache_key", TEXT_SIZES, case_cache_key),
+    ("engine.analyze", TEXT_SIZES, case_analyze),
+    ("engine.get_transcript", TRANSCRIPT_SIZES, case_get_transcript),
+    ("feedback.parse", tuple(FEEDBACK_OUTPUTS), case_parse_feedback),
+]
+
+
+def case_names(quick: bool = False) -> List[Tuple[str, Callable, object]]:
+    cases = []
+    for name, params, factory in CASES:
+        for param in params:
+            if quick and isinstance(param, int) and param > 10_000:
+                continue
+            cases.append((f"{name}[{param}]", factory, param))
+    return cases
+
+
+# ------------------------------------------------------------
+# Running
+# ------------------------------------------------------------
+def measure(fn: Callable, repeat: int) -> Dict:
+    """
+    Seconds per call: autorange picks a loop count that runs for at
+    least 0.2 s, then the loop is timed `repeat` times.
+    """
+    timer = timeit.Timer(fn)
+    loops, _ = timer.autorange()
+    per_call = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "median_s": statistics.median(per_call),
+        "min_s": min(per_call),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run_suite(patterns: Optional[List[str]] = None, quick: bool = False, repeat: int = 5) -> Dict:
+    results = {}
+    for name, factory, param in case_names(quick):
+        if patterns and not any(fnmatch.fnmatch(name, p) or p in name for p in patterns):
+            continue
+        fn = factory(param)
+        fn()  # warm caches and lazy imports
+        results[name] = measure(fn, repeat)
+        print(f"  {name:<40}{format_seconds(results[name]['median_s']):>12}", file=sys.stderr)
+
+    return {"version": BASELINE_VERSION, "meta": environment(), "results": results}
+
+
+def environment() -> Dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+# ------------------------------------------------------------
+# Comparing
+# ------------------------------------------------------------
+def compare(baseline: Dict, current: Dict, threshold: float) -> Tuple[List[Dict], bool]:
+    """
+    Per-case change in the fastest repeat (less noisy than the median
+    on a busy machine). A case regressed if it is slower than the
+    baseline by more than threshold (0.25 = 25%).
+    """
+    rows = []
+    regressed = False
+    names = list(baseline["results"]) + [n for n in current["results"] if n not in baseline["results"]]
+
+    for name in names:
+        before = baseline["results"].get(name)
+        after = current["results"].get(name)
+        if before is None or after is None:
+            rows.append({"case": name, "status": "new" if before is None else "missing"})
+            continue
+
+        change = after["min_s"] / before["min_s"] - 1 if before["min_s"] else 0.0
+        if change > threshold:
+            status = "REGRESSION"
+            regressed = True
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append({
+            "case": name,
+            "baseline_s": before["min_s"],
+            "current_s": after["min_s"],
+            "change": change,
+            "status": status,
+        })
+
+    return rows, regressed
+
+
+def print_comparison(rows: List[Dict], baseline: Dict, current: Dict, threshold: float):
+    print(f"baseline {baseline['meta'].get('commit')} ({baseline['meta'].get('created_at')}) vs "
+          f"current {current['meta'].get('commit')}, threshold {threshold:.0%}")
+    if baseline["meta"].get("machine") != current["meta"].get("machine"):
+        print("warning: baseline was recorded on a different machine")
+    print(f"\n{'case':<40}{'baseline':>12}{'current':>12}{'change':>9}  status")
+    for row in rows:
+        if "change" not in row:
+            print(f"{row['case']:<40}{'':>12}{'':>12}{'':>9}  {row['status']}")
+            continue
+        print(f"{row['case']:<40}{format_seconds(row['baseline_s']):>12}"
+              f"{format_seconds(row['current_s']):>12}{row['change']:>+9.0%}  {row['status']}")
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def load(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != BASELINE_VERSION:
+        raise SystemExit(f"{path}: unsupported baseline version {data.get('version')}")
+    return data
+
+
+def save(data: Dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"results written to {path}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Hot-path micro-benchmarks with regression tracking.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("--filter", nargs="+", metavar="PATTERN", help="substring or glob of case names")
+    run.add_argument("--quick", action="store_true", help="skip the 100k sizes")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--save", metavar="PATH", help="write results as a baseline JSON")
+
+    cmp = commands.add_parser("compare", help="compare against a baseline (runs the suite if CURRENT is omitted)")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current", nargs="?")
+    cmp.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (default 0.25 = 25%%)")
+    cmp.add_argument("--repeat", type=int, default=5)
+    cmp.add_argument("--save", metavar="PATH", help="also write the fresh results")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        data = run_suite(args.filter, args.quick, args.repeat)
+        if args.save:
+            save(data, args.save)
+        else:
+            json.dump(data, sys.stdout, indent=2)
+            print()
+        return
+
+    baseline = load(args.baseline)
+    if args.current:
+        current = load(args.current)
+    else:
+        # Only the cases the baseline has, so a --quick baseline stays quick
+        current = run_suite(list(baseline["results"]), repeat=args.repeat)
+        if args.save:
+            save(current, args.save)
+
+    rows, regressed = compare(baseline, current, args.threshold)
+    print_comparison(rows, baseline, current, args.threshold)
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""
+Admission control for concurrent interviews.
+
+Two fair (FIFO) gates sit in front of the LLM:
+
+    sessions   at most MAX_ACTIVE_SESSIONS interviews run at once. Later
+               starts wait in a queue of at most ADMISSION_QUEUE_LIMIT and
+               see their position; beyond that they are shed (Overloaded).
+    llm calls  at most MAX_INFLIGHT_LLM_CALLS model calls are in flight.
+               A turn that cannot get a slot within LLM_SLOT_WAIT_SECONDS
+               is answered locally instead of waiting.
+
+While either gate has a backlog the controller is "degraded" and engines
+shorten their interview to Config.MIN_QUESTIONS. Together with local
+replies (see InterviewEngine.respond_local) this keeps the reply latency
+of admitted candidates bounded during bursts.
+
+Both gates hand a freed slot directly to the oldest waiter, so nobody
+can barge ahead of the queue. Waiting works by polling (Streamlit
+reruns), by blocking a thread, or by awaiting in an event loop.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Hashable, List, Optional
+
+from src.config import Config
+
+
+class Overloaded(RuntimeError):
+    """The admission queue is full; the request was shed."""
+
+    def __str__(self):
+        return "The service is at capacity. Please try again in a minute."
+
+
+class _Ticket:
+    __slots__ = ("enqueued_at", "last_seen", "event", "futures", "blocked")
+
+    def __init__(self):
+        self.enqueued_at = self.last_seen = time.monotonic()
+        self.event = threading.Event()
+        self.futures = []
+        self.blocked = False
+
+
+class FairGate:
+    """
+    Counting semaphore with a FIFO wait queue, keyed by holder.
+
+    Holders that go quiet for longer than idle_seconds, and queued
+    tickets that stop polling for ticket_ttl seconds, are reaped, so
+    abandoned browser tabs do not hold capacity forever.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        queue_limit: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+        ticket_ttl: Optional[float] = None,
+    ):
+        self.capacity = capacity
+        self.queue_limit = queue_limit
+        self.idle_seconds = idle_seconds
+        self.ticket_ttl = ticket_ttl
+        self._holders: Dict[Hashable, float] = {}
+        self._queue: "OrderedDict[Hashable, _Ticket]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=1000)
+        self._counts = {"admitted": 0, "queued": 0, "shed": 0, "reaped": 0, "abandoned": 0}
+
+    # ------------------------------------------------------------
+    # Entering and leaving
+    # ------------------------------------------------------------
+    def enter(self, key: Hashable) -> int:
+        """
+        Ask for a slot, or check on an earlier request.
+        Returns 0 once admitted, else the 1-based queue position.
+        Raises Overloaded if the queue is full.
+        """
+        with self._lock:
+            self._reap()
+            now = time.monotonic()
+
+            if key in self._holders:
+                self._holders[key] = now
+                return 0
+
+            ticket = self._queue.get(key)
+            if ticket is not None:
+                ticket.last_seen = now
+                return list(self._queue).index(key) + 1
+
+            if len(self._holders) < self.capacity and not self._queue:
+                self._holders[key] = now
+                self._counts["admitted"] += 1
+                self._waits.append(0.0)
+                return 0
+
+            if self.queue_limit is not None and len(self._queue) >= self.queue_limit:
+                self._counts["shed"] += 1
+                raise Overloaded()
+
+            self._queue[key] = _Ticket()
+            self._counts["queued"] += 1
+            return len(self._queue)
+
+    def touch(self, key: Hashable) -> int:
+        """
+        Mark a holder as active so it is not reaped. A holder that was
+        reaped in the meantime enters again, so it cannot go on without
+        a slot; returns what enter() returns.
+        """
+        with self._lock:
+            if key in self._holders:
+                self._holders[key] = time.monotonic()
+                return 0
+        return self.enter(key)
+
+    def leave(self, key: Hashable):
+        """Give back a slot, or withdraw from the queue."""
+        with self._lock:
+            if self._holders.pop(key, None) is None:
+                ticket = self._queue.pop(key, None)
+                if ticket is not None:
+                    self._counts["abandoned"] += 1
+            self._promote()
+
+    # ------------------------------------------------------------
+    # Waiting
+    # ------------------------------------------------------------
+    def wait(self, key: Hashable, timeout: Optional[float] = None) -> bool:
+        """
+        Enter and block until admitted. On timeout the request is
+        withdrawn and False is returned.
+        """
+        if self.enter(key) == 0:
+            return True
+        with self._lock:
+            ticket = self._queue.get(key)
+            if ticket is not None:
+                ticket.blocked = True
+        if ticket is None or ticket.event.wait(timeout):
+            return True
+        return self._withdraw(key)
+
+    async def wait_async(self, key: Hashable, timeout: Optional[float] = None) -> bool:
+        """Like wait(), without blocking the event loop."""
+        if self.enter(key) == 0:
+            return True
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            ticket = self._queue.get(key)
+            if ticket is None:
+                return True
+            ticket.futures.append((loop, future))
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self._withdraw(key)
+        except asyncio.CancelledError:
+            if not self._withdraw(key):
+                raise
+            # Admitted just as we were cancelled: do not leak the slot
+            self.leave(key)
+            raise
+
+    def _withdraw(self, key: Hashable) -> bool:
+        # True if the slot was granted in the meantime
+        with self._lock:
+            if key in self._holders:
+                return True
+            if self._queue.pop(key, None) is not None:
+                self._counts["abandoned"] += 1
+            return False
+
+    # ------------------------------------------------------------
+    # Internals (called with the lock held)
+    # ------------------------------------------------------------
+    def _promote(self):
+        now = time.monotonic()
+        while self._queue and len(self._holders) < self.capacity:
+            key, ticket = self._queue.popitem(last=False)
+            self._holders[key] = now
+            self._counts["admitted"] += 1
+            self._waits.append(now - ticket.enqueued_at)
+            ticket.event.set()
+            for loop, future in ticket.futures:
+                loop.call_soon_threadsafe(_resolve, future)
+
+    def _reap(self):
+        now = time.monotonic()
+        if self.idle_seconds is not None:
+            for key, last_seen in list(self._holders.items()):
+                if now - last_seen > self.idle_seconds:
+                    del self._holders[key]
+                    self._counts["reaped"] += 1
+        if self.ticket_ttl is not None:
+            for key, ticket in list(self._queue.items()):
+                # Blocked waiters never poll; only abandoned pollers expire
+                if not ticket.blocked and not ticket.futures and now - ticket.last_seen > self.ticket_ttl:
+                    del self._queue[key]
+                    self._counts["abandoned"] += 1
+        self._promote()
+
+    # ------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------
+    @property
+    def backlog(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            waits = sorted(self._waits)
+            return {
+                "capacity": self.capacity,
+                "active": len(self._holders),
+                "waiting": len(self._queue),
+                **self._counts,
+                "wait_p50_ms": _percentile(waits, 50),
+                "wait_p95_ms": _percentile(waits, 95),
+            }
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+def _percentile(values: List[float], pct: int) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(len(values) * pct / 100))
+    return round(values[index] * 1000, 1)
+
+
+class AdmissionController:
+    """Session and LLM-call gates plus the degraded-mode signal."""
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        max_llm_calls: Optional[int] = None,
+        queue_limit: Optional[int] = None,
+        llm_wait: Optional[float] = None,
+    ):
+        self.sessions = FairGate(
+            Config.MAX_ACTIVE_SESSIONS if max_sessions is None else max_sessions,
+            queue_limit=Config.ADMISSION_QUEUE_LIMIT if queue_limit is None else queue_limit,
+            idle_seconds=Config.SESSION_IDLE_SECONDS,
+            ticket_ttl=Config.ADMISSION_TICKET_TTL_SECONDS,
+        )
+        self.llm = FairGate(Config.MAX_INFLIGHT_LLM_CALLS if max_llm_calls is None else max_llm_calls)
+        self.llm_wait = Config.LLM_SLOT_WAIT_SECONDS if llm_wait is None else llm_wait
+        self._call_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._degraded_turns = 0
+
+    @property
+    def degraded(self) -> bool:
+        """True while sessions are queued or LLM calls wait for a slot."""
+        return self.sessions.backlog > 0 or self.llm.backlog > 0
+
+    # ------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------
+    def admit(self, key: Hashable) -> int:
+        """0 once admitted, else the queue position. Raises Overloaded."""
+        return self.sessions.enter(key)
+
+    async def admit_async(self, key: Hashable, timeout: Optional[float] = None):
+        """Wait for a session slot; Overloaded if shed or timed out."""
+        if not await self.sessions.wait_async(key, timeout):
+            raise Overloaded()
+
+    def touch(self, key: Hashable) -> int:
+        """
+        Keep a session's slot. 0 if it holds one, else its queue position
+        after it was reaped for idling. Raises Overloaded.
+        """
+        return self.sessions.touch(key)
+
+    async def touch_async(self, key: Hashable, timeout: Optional[float] = None):
+        """Keep a session's slot, waiting for a new one if it was reaped."""
+        if self.sessions.touch(key):
+            await self.admit_async(key, timeout)
+
+    def release(self, key: Hashable):
+        self.sessions.leave(key)
+
+    # ------------------------------------------------------------
+    # LLM calls
+    # ------------------------------------------------------------
+    @contextmanager
+    def llm_slot(self, timeout: Optional[float] = -1):
+        """
+        Hold one LLM call slot. Yields False if none came free within
+        timeout (default LLM_SLOT_WAIT_SECONDS; None waits forever): the
+        caller should answer locally.
+        """
+        key = next(self._call_ids)
+        granted = self.llm.wait(key, self.llm_wait if timeout == -1 else timeout)
+        if not granted:
+            self._count_degraded()
+        try:
+            yield granted
+        finally:
+            if granted:
+                self.llm.leave(key)
+
+    @asynccontextmanager
+    async def llm_slot_async(self, timeout: Optional[float] = -1):
+        key = next(self._call_ids)
+        granted = await self.llm.wait_async(key, self.llm_wait if timeout == -1 else timeout)
+        if not granted:
+            self._count_degraded()
+        try:
+            yield granted
+        finally:
+            if granted:
+                self.llm.leave(key)
+
+    def _count_degraded(self):
+        with self._lock:
+            self._degraded_turns += 1
+
+    # ------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------
+    def stats(self) -> Dict:
+        with self._lock:
+            degraded_turns = self._degraded_turns
+        return {
+            "degraded": self.degraded,
+            "local_replies": degraded_turns,
+            "sessions": self.sessions.stats(),
+            "llm_calls": self.llm.stats(),
+        }
+
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Process-wide controller shared by all browser sessions."""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController()
+        return _controller
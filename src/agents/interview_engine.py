@@ -4,28 +4,122 @@ Compatible with google-generativeai==0.3.2
 """
 
 import random
-from src.llm.gemini_client import GeminiClient
-from src.llm.prompts import get_system_instruction, ENCOURAGEMENT_PROMPTS
+from datetime import datetime
+from typing import Dict, Optional
+
+from src.agents.states import InterviewState, create_initial_state
+from src.agents.transcript import Transcript
+from src.llm.factory import create_llm_client
+from src.llm.prompts import (
+    get_system_instruction,
+    ENCOURAGEMENT_PROMPTS,
+    PROBE_PROMPTS,
+    FALLBACK_REPLY,
+    CLOSING_QUESTION,
+    LOCAL_OPENING,
+    LOCAL_QUESTIONS,
+    LOCAL_CLOSING,
+)
 from src.config import Config
+from src.storage.checkpoints import CHECKPOINT_VERSION
 
 
 class InterviewEngine:
 
-    def __init__(self, role: str):
-        self.role = role
-        self.gemini = GeminiClient()
-        self.question_count = 0
-        self.messages = []
+    def __init__(
+        self,
+        role: str,
+        llm=None,
+        start_chat: bool = True,
+        persona: str = "normal",
+        input_mode: str = "text",
+        session_id: Optional[str] = None,
+    ):
+        self.state: InterviewState = create_initial_state(
+            role,
+            persona,
+            input_mode,
+            session_id or datetime.now().strftime("%Y%m%d_%H%M%S"),
+        )
+        self.gemini = llm or create_llm_client(session_id=self.session_id)
+        self.transcript = Transcript()
 
         # FINAL SAFE SYSTEM INSTRUCTION
-        system_instruction = (
+        self.system_instruction = (
             get_system_instruction(role)
             + "\nAsk ONLY ONE question in your reply."
             + "\nDo NOT ask multiple questions."
             + "\nKeep replies 1–3 sentences maximum."
         )
 
-        self.gemini.start_chat(system_instruction)
+        # Async callers pass start_chat=False and await start_chat_async()
+        if start_chat:
+            self.gemini.start_chat(self.system_instruction)
+
+    async def start_chat_async(self):
+        await self.gemini.start_chat_async(self.system_instruction)
+
+    @property
+    def role(self) -> str:
+        return self.state["role"]
+
+    @property
+    def session_id(self) -> str:
+        return self.state["session_id"]
+
+    @property
+    def question_count(self) -> int:
+        return self.state["question_count"]
+
+    @property
+    def question_limit(self) -> int:
+        return self.state.get("question_limit") or Config.MAX_QUESTIONS
+
+    def shorten(self):
+        """
+        Wrap up after Config.MIN_QUESTIONS (or right away if that many
+        were already asked). Used by admission control under load.
+        """
+        limit = max(Config.MIN_QUESTIONS, self.question_count)
+        if limit < self.question_limit:
+            self.state["question_limit"] = limit
+
+    # ------------ CHECKPOINTS -------------------
+    def checkpoint(self) -> Dict:
+        """
+        JSON-serializable snapshot of the interview, including the LLM
+        chat history, taken after every turn.
+        """
+        state = dict(self.state)
+        state["messages"] = self.transcript.to_dicts()
+        return {
+            "version": CHECKPOINT_VERSION,
+            "state": state,
+            "llm_history": self.gemini.export_history(),
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Dict, llm=None) -> "InterviewEngine":
+        """
+        Rebuild an engine from checkpoint() output. The chat history is
+        restored locally; no LLM call is replayed.
+        """
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {checkpoint.get('version')}")
+
+        state = checkpoint["state"]
+        engine = cls(
+            state["role"],
+            llm=llm,
+            start_chat=False,
+            persona=state["persona"],
+            input_mode=state["input_mode"],
+            session_id=state["session_id"],
+        )
+        engine.state.update({k: v for k, v in state.items() if k != "messages"})
+        engine.transcript = Transcript.from_dicts(state["messages"])
+        engine.gemini.restore_history(checkpoint["llm_history"])
+        return engine
 
     # ------------ PERSONA FILTER -----------------
     def apply_persona(self, text: str, persona: str) -> str:
@@ -47,15 +141,16 @@ class InterviewEngine:
 
     # ------------ START INTERVIEW ---------------
     def start_interview(self):
-        prompt = (
-            "Greet the candidate briefly. Then ask ONE question: "
-            "'Tell me about yourself.'"
-        )
+        prompt, counts = self._opening()
+        return self._finish(self.gemini.send_message(prompt), counts)
 
-        reply = self._safe_llm(prompt)
-        self._save_interviewer(reply)
-        self.question_count += 1
-        return reply
+    async def start_interview_async(self):
+        prompt, counts = self._opening()
+        return self._finish(await self.gemini.send_message_async(prompt), counts)
+
+    def start_interview_local(self):
+        prompt, counts = self._opening()
+        return self._finish(self._local_exchange(prompt), counts)
 
     # ------------ ANALYZE ANSWER ----------------
     def analyze(self, answer: str):
@@ -67,74 +162,156 @@ class InterviewEngine:
 
     # ------------ PROCESS ANSWER ----------------
     def process_answer(self, answer: str) -> str:
+        self.record_answer(answer)
+        return self.respond(answer)
+
+    async def process_answer_async(self, answer: str) -> str:
+        self.record_answer(answer)
+        return await self.respond_async(answer)
+
+    def record_answer(self, answer: str):
+        self.state["last_answer"] = answer
         self._save_candidate(answer)
+
+    def respond(self, answer: str) -> str:
+        prompt, counts = self._plan_reply(answer)
+        return self._finish(self.gemini.send_message(prompt), counts)
+
+    async def respond_async(self, answer: str) -> str:
+        prompt, counts = self._plan_reply(answer)
+        return self._finish(await self.gemini.send_message_async(prompt), counts)
+
+    def respond_local(self, answer: str) -> str:
+        """
+        Reply without calling the LLM, from the local question bank.
+        Used when no LLM slot is free in time.
+        """
+        prompt, counts = self._plan_reply(answer)
+        return self._finish(self._local_exchange(prompt), counts)
+
+    def _local_exchange(self, prompt: str) -> str:
+        # Keep the model's chat history in step with the transcript, so
+        # the next LLM turn knows which question was asked
+        reply = self._local_reply()
+        self.gemini.add_exchange(prompt, reply)
+        return reply
+
+    def respond_stream(self, answer: str):
+        """
+        Yield the reply in pieces as the model streams it; the complete
+        reply is saved once the stream ends.
+        """
+        prompt, counts = self._plan_reply(answer)
+        parts = []
+        for piece in self.gemini.stream_message(prompt):
+            parts.append(piece)
+            yield piece
+
+        reply = self._finish("".join(parts), counts)
+        if not parts:
+            yield reply
+
+    async def respond_stream_async(self, answer: str):
+        prompt, counts = self._plan_reply(answer)
+        parts = []
+        async for piece in self.gemini.stream_message_async(prompt):
+            parts.append(piece)
+            yield piece
+
+        reply = self._finish("".join(parts), counts)
+        if not parts:
+            yield reply
+
+    # ------------ PLAN NEXT REPLY ---------------
+    def _plan_reply(self, answer: str):
+        """
+        Pick the prompt for the interviewer's next reply.
+        Returns (prompt, whether the reply counts as a question).
+        """
         analysis = self.analyze(answer)
+        self.state["last_answer_quality"] = "vague" if analysis["vague"] else "good"
+        self.state["needs_encouragement"] = analysis["uncertain"]
+        self.state["needs_probing"] = analysis["vague"] and self.question_count < self.question_limit
 
-        if analysis["vague"] and self.question_count < Config.MAX_QUESTIONS:
-            return self._probe()
+        if self.state["needs_probing"]:
+            self.state["current_state"] = "probe"
+            return self._probe(), False
 
-        if self.question_count >= Config.MAX_QUESTIONS:
-            return self._closing()
+        if self.question_count >= self.question_limit:
+            self.state["current_state"] = "closing"
+            return self._closing(), True
 
-        return self._next_question(analysis)
+        self.state["current_state"] = "question"
+        return self._next_question(analysis), True
+
+    # ------------ OPENING -----------------------
+    def _opening(self):
+        prompt = (
+            "Greet the candidate briefly. Then ask ONE question: "
+            "'Tell me about yourself.'"
+        )
+        return prompt, True
 
     # ------------ PROBE FOLLOW-UP ---------------
     def _probe(self):
-        prompt = (
+        return (
             "Ask ONE probing follow-up question requesting clarity "
             "or a specific example."
         )
-        reply = self._safe_llm(prompt)
-        self._save_interviewer(reply)
-        return reply
 
     # ------------ NEXT QUESTION -----------------
     def _next_question(self, analysis):
         encouragement = random.choice(ENCOURAGEMENT_PROMPTS) if analysis["uncertain"] else ""
 
-        prompt = (
+        return (
             f"Ask ONE next interview question for the role: {self.role}. "
             "Keep it short, job-related, and professional. "
             f"{encouragement}"
         )
 
-        reply = self._safe_llm(prompt)
-        self._save_interviewer(reply)
-        self.question_count += 1
-        return reply
-
     # ------------ CLOSING -----------------------
     def _closing(self):
-        prompt = (
+        return (
             "Thank the candidate and ask ONE final question: "
-            "'Do you have any questions for me?'"
+            f"'{CLOSING_QUESTION}'"
         )
-        reply = self._safe_llm(prompt)
-        self._save_interviewer(reply)
-        self.question_count += 1
-        return reply
 
-    # ------------ SAFE LLM CALL -----------------
-    def _safe_llm(self, prompt):
-        reply = self.gemini.send_message(prompt)
+    # ------------ LOCAL REPLY -------------------
+    def _local_reply(self):
+        kind = self.state["current_state"]
+        if kind == "start":
+            return LOCAL_OPENING
+        if kind == "probe":
+            return random.choice(PROBE_PROMPTS)
+        if kind == "closing":
+            return LOCAL_CLOSING
+
+        asked = {turn.content for turn in self.transcript if turn.role == "interviewer"}
+        bank = LOCAL_QUESTIONS.get(self.role, LOCAL_QUESTIONS["behavioral"])
+        fresh = [q for q in bank if q not in asked]
+        return random.choice(fresh or bank)
+
+    # ------------ SAVE REPLY --------------------
+    def _finish(self, reply, counts_as_question: bool):
         if not reply or reply.strip() == "":
-            reply = "Could you explain that more clearly?"
+            reply = FALLBACK_REPLY
+        self._save_interviewer(reply)
+        if counts_as_question:
+            self.state["question_count"] += 1
+        self.state["is_complete"] = self.is_complete()
         return reply
 
     # ------------ COMPLETION CHECK ---------------
     def is_complete(self):
-        return self.question_count >= Config.MAX_QUESTIONS + 1
+        return self.question_count >= self.question_limit + 1
 
     # ------------ TRANSCRIPT --------------------
     def get_transcript(self):
-        return "\n".join([
-            f"{m['role'].capitalize()}: {m['content']}"
-            for m in self.messages
-        ])
+        return self.transcript.text()
 
     def _save_interviewer(self, text):
-        self.messages.append({"role": "interviewer", "content": text})
+        self.transcript.append("interviewer", text)
 
     def _save_candidate(self, text):
-        self.messages.append({"role": "candidate", "content": text})
+        self.transcript.append("candidate", text)
     
\ No newline at end of file
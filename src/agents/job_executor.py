@@ -0,0 +1,187 @@
+"""
+Background job executor for interview turns.
+
+LLM work (starting an interview, answering a turn, generating feedback)
+runs on a process-wide thread pool instead of the Streamlit script
+thread. Jobs are keyed by browser session, and each session can have at
+most one job in flight; the UI polls for the result.
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.config import Config
+
+
+class Job:
+    """One unit of background work for a session."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, session_key: str, kind: str, future: Future, session_id: Optional[str] = None):
+        self.id = next(self._ids)
+        self.session_key = session_key
+        self.session_id = session_id      # the interview the job works on
+        self.kind = kind                  # "start", "turn" or "feedback"
+        self.future = future
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.cancelled = False
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future):
+        self.finished_at = time.time()
+
+    @property
+    def status(self) -> str:
+        if self.cancelled:
+            return "cancelled"
+        if not self.future.done():
+            return "running" if self.future.running() else "pending"
+        return "failed" if self.future.exception() else "done"
+
+    @property
+    def finished(self) -> bool:
+        """Nothing more to wait for; a cancelled job may still be running."""
+        return self.cancelled or self.future.done()
+
+    def result(self) -> Any:
+        return self.future.result()
+
+    def error(self) -> Optional[BaseException]:
+        if self.future.done() and not self.future.cancelled():
+            return self.future.exception()
+        return None
+
+    def elapsed(self) -> float:
+        return time.time() - self.submitted_at
+
+
+class JobExecutor:
+    """Thread pool with a limit of one in-flight job per session."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or Config.JOB_MAX_WORKERS,
+            thread_name_prefix="interview-job"
+        )
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self.result_ttl = Config.JOB_RESULT_TTL_SECONDS
+
+    def submit(
+        self, session_key: str, kind: str, fn: Callable, *args, session_id: Optional[str] = None, **kwargs
+    ) -> Optional[Job]:
+        """
+        Queue fn(*args, **kwargs) for the session.
+        Returns None if the session already has a job in flight. If a
+        cancelled job of the session is still running, the new one starts
+        when it is done, never alongside it.
+        session_id names the interview the job works on (see busy()).
+        """
+        with self._lock:
+            self._reap()
+            current = self._jobs.get(session_key)
+            if current is not None and not current.finished:
+                return None
+
+            if current is not None and not current.future.done():
+                future = self._submit_after(current.future, fn, args, kwargs)
+            else:
+                future = self._pool.submit(fn, *args, **kwargs)
+            job = Job(session_key, kind, future, session_id)
+            self._jobs[session_key] = job
+            return job
+
+    def _submit_after(self, previous: Future, fn: Callable, args, kwargs) -> Future:
+        future = Future()
+
+        def start(_):
+            if future.set_running_or_notify_cancel():
+                self._pool.submit(_run_into, future, fn, args, kwargs)
+
+        previous.add_done_callback(start)
+        return future
+
+    def _reap(self):
+        """Drop finished jobs whose tab never collected them. Caller holds the lock."""
+        cutoff = time.time() - self.result_ttl
+        for session_key, job in list(self._jobs.items()):
+            if job.finished_at is not None and job.finished_at < cutoff:
+                del self._jobs[session_key]
+
+    def get(self, session_key: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(session_key)
+
+    def pop_finished(self, session_key: str) -> Optional[Job]:
+        """
+        Hand over a finished job exactly once; cancelled jobs are dropped
+        once their worker is done.
+        """
+        with self._lock:
+            job = self._jobs.get(session_key)
+            if job is None or not job.finished:
+                return None
+            if job.cancelled:
+                if job.future.done():
+                    del self._jobs[session_key]
+                return None
+            del self._jobs[session_key]
+            return job
+
+    def cancel(self, session_key: str) -> bool:
+        """
+        Abandon the session's in-flight job. A job that has not started
+        is removed from the queue; a running one finishes in the
+        background and its result is discarded. Until then it stays
+        listed, so busy() and submit() still see it.
+        """
+        with self._lock:
+            job = self._jobs.get(session_key)
+            if job is None or job.finished:
+                return False
+            job.cancelled = True
+            job.future.cancel()
+            return True
+
+    def busy(self, session_id: str) -> bool:
+        """True while a job for this interview is queued or running."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return any(j.session_id == session_id and not j.future.done() for j in jobs)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._reap()
+            jobs = list(self._jobs.values())
+        return {
+            "in_flight": sum(1 for j in jobs if not j.finished),
+            "abandoned": sum(1 for j in jobs if j.cancelled and not j.future.done()),
+            "waiting_pickup": sum(1 for j in jobs if j.future.done() and not j.cancelled),
+        }
+
+
+def _run_into(future: Future, fn: Callable, args, kwargs):
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+_executor: Optional[JobExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_job_executor() -> JobExecutor:
+    """Process-wide executor shared by all browser sessions."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = JobExecutor()
+        return _executor
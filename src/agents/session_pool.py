@@ -0,0 +1,269 @@
+"""
+Resident interview engines with idle eviction.
+
+Engines live here, keyed by session id, instead of in each browser tab's
+session state. Every turn is appended to the session journal (cost
+proportional to the turn). Engines idle for longer than
+Config.SESSION_IDLE_SECONDS are spilled to a compact checkpoint and
+dropped from memory; the next request rebuilds them from the checkpoint,
+or from the journal after a crash or restart, without replaying LLM
+calls. Memory therefore scales with active interviews, and interviews
+survive a restart.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from src.agents.interview_engine import InterviewEngine
+from src.agents.job_executor import get_job_executor
+from src.config import Config
+from src.storage.checkpoints import CheckpointStore
+from src.storage.journal import SessionJournal, get_journal, session_document
+
+
+class SessionPool:
+    """Thread-safe map of session id -> engine, backed by journal and checkpoints."""
+
+    def __init__(
+        self,
+        store: Optional[CheckpointStore] = None,
+        journal: Optional[SessionJournal] = None,
+        llm_factory: Optional[Callable] = None,
+        idle_seconds: Optional[float] = None,
+    ):
+        # Without a journal the pool is memory-only and never evicts.
+        # Without llm_factory, resumed engines create their own client
+        # for their session id (see create_llm_client).
+        self.store = store
+        self.journal = journal
+        self.llm_factory = llm_factory
+        self.idle_seconds = Config.SESSION_IDLE_SECONDS if idle_seconds is None else idle_seconds
+        self._engines: Dict[str, Tuple[InterviewEngine, float]] = {}
+        # Per session: (transcript turns, LLM history entries) already journaled
+        self._journaled: Dict[str, Tuple[int, int]] = {}
+        # Ended interviews: late saves from their jobs must not revive them
+        self._discarded = set()
+        self._lock = threading.Lock()
+        self._stats = {"evicted": 0, "resumed": 0}
+        self._evictor: Optional[threading.Thread] = None
+
+    @property
+    def durable(self) -> bool:
+        return self.journal is not None
+
+    # ------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------
+    def add(self, engine: InterviewEngine):
+        with self._lock:
+            self._discarded.discard(engine.session_id)
+            self._engines[engine.session_id] = (engine, time.monotonic())
+            self._journaled[engine.session_id] = (0, 0)
+        self.save(engine)
+
+    def get(self, session_id: str) -> Optional[InterviewEngine]:
+        """
+        The session's engine, rehydrated if it was evicted. None if the
+        session is unknown or has ended.
+        """
+        with self._lock:
+            entry = self._engines.get(session_id)
+            if entry is not None:
+                self._engines[session_id] = (entry[0], time.monotonic())
+                return entry[0]
+
+        if not self.durable or session_id in self._discarded:
+            return None
+
+        checkpoint = self.store.load(session_id) if self.store is not None else None
+        if checkpoint is None:
+            # Crash or restart before the engine was spilled
+            checkpoint = self.journal.fold(session_id)
+            if checkpoint is None or checkpoint["ended_at"]:
+                return None
+
+        llm = self.llm_factory() if self.llm_factory else None
+        engine = InterviewEngine.from_checkpoint(checkpoint, llm=llm)
+        with self._lock:
+            if session_id in self._discarded:
+                return None
+            # Another thread may have resumed it meanwhile: keep the first
+            entry = self._engines.setdefault(session_id, (engine, time.monotonic()))
+            if entry[0] is engine:
+                self._journaled[session_id] = (
+                    len(checkpoint["state"]["messages"]), len(checkpoint["llm_history"])
+                )
+                self._stats["resumed"] += 1
+                if self.store is not None:
+                    # Later turns go to the journal only; never leave a stale spill
+                    self.store.delete(session_id)
+            return entry[0]
+
+    def save(self, engine: InterviewEngine):
+        """
+        Journal what changed since the last save: new turns, new LLM chat
+        history and the (small) flow state.
+        """
+        session_id = engine.session_id
+        with self._lock:
+            if session_id in self._discarded:
+                # Ended while this turn ran: the interview is already saved
+                return
+            entry = self._engines.get(session_id)
+            if entry is not None and entry[0] is not engine:
+                # Evicted mid-turn and resumed as a new engine since:
+                # this copy is stale, and journaling it would fork history
+                print(f"[SessionPool] Dropping save of stale engine {session_id}")
+                return
+            self._engines[session_id] = (engine, time.monotonic())
+            offsets = self._journaled.get(session_id)
+
+        if not self.durable:
+            return
+
+        if offsets is None:
+            # Evicted while this turn ran: the journal knows what it holds
+            offsets = self._journaled_offsets(session_id)
+            if self.store is not None:
+                # The spill predates this turn; resume from the journal instead
+                self.store.delete(session_id)
+        turns, history = offsets
+
+        messages = engine.transcript.to_dicts(turns)
+        llm_history = engine.gemini.export_history(history)
+        state = {k: v for k, v in engine.state.items() if k != "messages"}
+        self.journal.append(session_id, {
+            "t": "turn",
+            "state": state,
+            "messages": messages,
+            "llm": llm_history,
+        })
+
+        with self._lock:
+            self._journaled[session_id] = (turns + len(messages), history + len(llm_history))
+
+    def _journaled_offsets(self, session_id: str) -> Tuple[int, int]:
+        folded = self.journal.fold(session_id)
+        if folded is None:
+            return 0, 0
+        return len(folded["state"]["messages"]), len(folded["llm_history"])
+
+    def complete(self, engine: InterviewEngine, feedback: Dict) -> Dict:
+        """
+        Record the end of the interview and return the final session
+        document, materialized from the journal.
+        """
+        ended_at = datetime.now().isoformat()
+
+        if not self.durable:
+            return session_document(engine.checkpoint(), feedback, ended_at)
+
+        self.save(engine)
+        self.journal.append(engine.session_id, {"t": "end", "feedback": feedback, "ended_at": ended_at})
+        return self.journal.materialize(engine.session_id)
+
+    def discard(self, session_id: str):
+        """Forget a finished (and saved) interview, in memory and on disk."""
+        with self._lock:
+            self._discarded.add(session_id)
+            self._engines.pop(session_id, None)
+            self._journaled.pop(session_id, None)
+        if self.store is not None:
+            self.store.delete(session_id)
+        if self.journal is not None:
+            self.journal.delete(session_id)
+
+    # ------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------
+    def evict_idle(self, keep: Callable[[str], bool] = lambda session_id: False) -> int:
+        """
+        Spill engines idle past idle_seconds to a checkpoint and drop them.
+        keep(session_id) can veto, e.g. for sessions mid-turn. Journals
+        and checkpoints of interviews abandoned for longer than their
+        retention are deleted.
+        """
+        if not self.durable:
+            return 0
+
+        self.journal.expire()
+        if self.store is not None:
+            self.store.expire()
+
+        cutoff = time.monotonic() - self.idle_seconds
+        with self._lock:
+            idle = [
+                (session_id, entry) for session_id, entry in self._engines.items()
+                if entry[1] < cutoff and not keep(session_id)
+            ]
+
+        # Spill without holding the lock; requests for other sessions go on
+        if self.store is not None:
+            for session_id, (engine, _) in idle:
+                self.store.save(session_id, engine.checkpoint())
+
+        evicted, revived = 0, []
+        with self._lock:
+            for session_id, entry in idle:
+                if self._engines.get(session_id) is entry:
+                    del self._engines[session_id]
+                    self._journaled.pop(session_id, None)
+                    evicted += 1
+                else:
+                    # Used or discarded while spilling: the spill is stale
+                    revived.append(session_id)
+            self._stats["evicted"] += evicted
+
+        if self.store is not None:
+            for session_id in revived:
+                self.store.delete(session_id)
+        return evicted
+
+    def start_evictor(
+        self,
+        interval: Optional[float] = None,
+        keep: Callable[[str], bool] = lambda session_id: False,
+    ):
+        """
+        Evict idle engines periodically on a daemon thread. keep is passed
+        to evict_idle.
+        """
+        interval = interval or Config.SESSION_EVICT_INTERVAL_SECONDS
+
+        def run():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.evict_idle(keep)
+                except Exception as e:
+                    print(f"[SessionPool] Eviction failed: {e}")
+
+        with self._lock:
+            if self._evictor is None:
+                self._evictor = threading.Thread(target=run, name="session-evictor", daemon=True)
+                self._evictor.start()
+
+    def resident_ids(self) -> set:
+        with self._lock:
+            return set(self._engines)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"resident": len(self._engines), **self._stats}
+
+
+_pool: Optional[SessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Process-wide pool used by the Streamlit app."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SessionPool(CheckpointStore(), get_journal())
+            # Never spill an engine while a background job is using it
+            _pool.start_evictor(keep=get_job_executor().busy)
+        return _pool
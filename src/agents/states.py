@@ -26,6 +26,7 @@ class InterviewState(TypedDict, total=False):
     # -------------------------------------------
     messages: Annotated[List[Dict[str, str]], operator.add]  # Full conversation history
     question_count: int           # Total questions asked
+    question_limit: Optional[int] # Shortened limit under load (None = Config.MAX_QUESTIONS)
     last_answer: Optional[str]    # Last user answer
     last_answer_quality: Optional[str]  # "good", "vague", "off_topic", "detailed"
 
@@ -95,6 +96,7 @@ def create_initial_state(
         # Conversation
         messages=[],
         question_count=0,
+        question_limit=None,
         last_answer=None,
         last_answer_quality=None,
 
@@ -0,0 +1,105 @@
+"""
+Compact, append-only interview transcript.
+
+One Transcript is shared by the InterviewEngine (which appends turns) and
+the UI (which renders and saves them), instead of each keeping its own
+list of dicts. Turns are __slots__ records, and the "Role: text"
+transcript string sent to the feedback model is extended as turns arrive
+rather than rebuilt on every call.
+"""
+
+import sys
+import threading
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class Turn:
+    """One message in the interview."""
+
+    __slots__ = ("role", "content")
+
+    def __init__(self, role: str, content: str):
+        self.role = sys.intern(role)      # "interviewer" or "candidate"
+        self.content = content
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"role": self.role, "content": self.content}
+
+    def line(self) -> str:
+        return f"{self.role.capitalize()}: {self.content}"
+
+
+class Transcript:
+    """Append-only list of turns with a cached transcript string."""
+
+    def __init__(self, turns: Iterable[Turn] = ()):
+        self._turns: List[Turn] = list(turns)
+        self._lock = threading.Lock()
+        self._text = ""
+        self._text_turns = 0      # turns already folded into _text
+        self._frozen = False
+
+    @classmethod
+    def from_dicts(cls, messages: Iterable[Dict]) -> "Transcript":
+        return cls(Turn(m["role"], m["content"]) for m in messages)
+
+    # ------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------
+    def append(self, role: str, content: str) -> bool:
+        """
+        Add a turn. Returns False (and drops the turn) once frozen, e.g.
+        when a cancelled reply arrives after the interview has ended.
+        """
+        with self._lock:
+            if self._frozen:
+                return False
+            self._turns.append(Turn(role, content))
+            return True
+
+    def freeze(self):
+        with self._lock:
+            self._frozen = True
+
+    # ------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def __iter__(self) -> Iterator[Turn]:
+        return iter(self._turns[:])
+
+    def __getitem__(self, index):
+        return self._turns[index]
+
+    def text(self) -> str:
+        """
+        "Role: content" lines for the whole interview. Only turns added
+        since the last call are formatted.
+        """
+        with self._lock:
+            new_turns = self._turns[self._text_turns:]
+            if new_turns:
+                lines = "\n".join(turn.line() for turn in new_turns)
+                self._text = f"{self._text}\n{lines}" if self._text else lines
+                self._text_turns += len(new_turns)
+            return self._text
+
+    def to_dicts(self, start: int = 0) -> List[Dict[str, str]]:
+        """
+        Serialize turns from index start on (the stored "messages" format).
+        """
+        return [turn.to_dict() for turn in self._turns[start:]]
+
+    def page(self, page: int, page_size: int) -> Tuple[int, List[Turn]]:
+        """
+        Turns of one page, counted back from the newest (page 0 is the
+        latest page_size turns). Returns (index of the first turn, turns).
+        """
+        end = max(len(self._turns) - page * page_size, 0)
+        start = max(end - page_size, 0)
+        return start, self._turns[start:end]
+
+    def page_count(self, page_size: int) -> int:
+        return max(1, -(-len(self._turns) // page_size))
@@ -16,6 +16,16 @@ class Config:
     GEMINI_TEMPERATURE = 0.7
     GEMINI_MAX_TOKENS = 2048
 
+    # "gemini" or "stub" (canned offline replies, see src/llm/stub_client.py)
+    LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+    STUB_LLM_LATENCY_MS = int(os.getenv("STUB_LLM_LATENCY_MS", "50"))
+
+    # LLM cassettes (src/llm/cassette.py): LLM_RECORD=1 records every call;
+    # LLM_BACKEND=replay serves them back, LLM_REPLAY_CASSETTE pins one file
+    LLM_RECORD = os.getenv("LLM_RECORD", "").lower() in ("1", "true", "yes")
+    LLM_REPLAY_CASSETTE = os.getenv("LLM_REPLAY_CASSETTE")
+    LLM_REPLAY_TIME_SCALE = float(os.getenv("LLM_REPLAY_TIME_SCALE", "1.0"))
+
     MIN_QUESTIONS = 5
     MAX_QUESTIONS = 7
 
@@ -39,6 +49,82 @@ class Config:
     DATA_DIR = "data"
     INTERVIEWS_DIR = os.path.join(DATA_DIR, "interviews")
     AUDIO_CACHE_DIR = os.path.join(DATA_DIR, "audio_cache")
+    AUDIO_CACHE_MAX_BYTES = int(os.getenv("AUDIO_CACHE_MAX_MB", "200")) * 1024 * 1024
+    AUDIO_CACHE_MAX_ENTRIES = int(os.getenv("AUDIO_CACHE_MAX_ENTRIES", "2000"))
+    SEARCH_INDEX_PATH = os.path.join(DATA_DIR, "search_index.sqlite3")
+    ANALYTICS_CACHE_PATH = os.path.join(DATA_DIR, "analytics_cache.npz")
+    CASSETTES_DIR = os.path.join(DATA_DIR, "cassettes")
+
+    # "gtts" (network) or "espeak" (local, offline)
+    TTS_ENGINE = os.getenv("TTS_ENGINE", "gtts")
+    TTS_LANGUAGE = "en"
+    TTS_SLOW = False
+    TTS_MAX_WORKERS = 4
+    TTS_WARMUP_WORKERS = 2
+
+    # Post-processing with ffmpeg: "mp3" (one clean stream), "opus" (Ogg/Opus)
+    # or "raw" (serve engine output as-is)
+    TTS_OUTPUT_FORMAT = os.getenv("TTS_OUTPUT_FORMAT", "mp3")
+    TTS_OUTPUT_BITRATE = os.getenv("TTS_OUTPUT_BITRATE", "32k")
+    TTS_TRANSCODE_WORKERS = 2
+
+    # Speech-to-text: "google" (network) or "vosk" (local, offline)
+    STT_ENGINE = os.getenv("STT_ENGINE", "google")
+    VOSK_MODEL_PATH = os.getenv("VOSK_MODEL_PATH", os.path.join(DATA_DIR, "models", "vosk"))
+    STT_BATCH_WORKERS = os.cpu_count() or 2
+    STT_CALIBRATION_SECONDS = 1
+    STT_CALIBRATION_TTL_SECONDS = 300
+    STT_SEGMENT_PAUSE_SECONDS = 0.4
+    STT_SEGMENT_MAX_SECONDS = 8
+    STT_END_OF_SPEECH_SECONDS = 1.0
+    STT_MAX_WORKERS = 3
+
+    # Background LLM jobs (start / turn / feedback), shared by all sessions
+    JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "8"))
+    JOB_POLL_SECONDS = 0.5
+    # Finished jobs nobody collected (tab closed) are dropped after this
+    JOB_RESULT_TTL_SECONDS = 600
+
+    # Chat turns drawn per page in the active interview view
+    TRANSCRIPT_PAGE_SIZE = 20
+
+    # Live interviews: journal every turn, spill idle engines to a checkpoint
+    JOURNALS_DIR = os.path.join(DATA_DIR, "journals")
+    JOURNAL_FSYNC_INTERVAL_MS = int(os.getenv("JOURNAL_FSYNC_INTERVAL_MS", "200"))
+    JOURNAL_RETENTION_DAYS = float(os.getenv("JOURNAL_RETENTION_DAYS", "7"))
+    CHECKPOINTS_DIR = os.path.join(DATA_DIR, "checkpoints")
+    CHECKPOINT_RETENTION_DAYS = float(os.getenv("CHECKPOINT_RETENTION_DAYS", "7"))
+    SESSION_IDLE_SECONDS = int(os.getenv("SESSION_IDLE_SECONDS", "900"))
+    SESSION_EVICT_INTERVAL_SECONDS = 60
+
+    # Admission control (src/agents/admission.py): concurrent interviews,
+    # in-flight LLM calls, and how long a turn waits for an LLM slot
+    # before it is answered locally
+    MAX_ACTIVE_SESSIONS = int(os.getenv("MAX_ACTIVE_SESSIONS", "50"))
+    ADMISSION_QUEUE_LIMIT = int(os.getenv("ADMISSION_QUEUE_LIMIT", "100"))
+    ADMISSION_TICKET_TTL_SECONDS = 30
+    ADMISSION_WAIT_SECONDS = float(os.getenv("ADMISSION_WAIT_SECONDS", "30"))
+    MAX_INFLIGHT_LLM_CALLS = int(os.getenv("MAX_INFLIGHT_LLM_CALLS", "16"))
+    LLM_SLOT_WAIT_SECONDS = float(os.getenv("LLM_SLOT_WAIT_SECONDS", "2.0"))
+
+    # Turn profiling (src/profiling.py): PROFILING=1 profiles every session
+    PROFILING = os.getenv("PROFILING", "").lower() in ("1", "true", "yes")
+    PROFILES_DIR = os.path.join(DATA_DIR, "profiles")
+    PROFILE_SAMPLE_INTERVAL_MS = 5
+    PROFILE_TOP_N = 25
+    PROFILE_TRACEMALLOC_FRAMES = 1
+
+    # Bulk re-grading of stored interviews (python -m src.feedback.regrade)
+    REGRADE_WORKERS = int(os.getenv("REGRADE_WORKERS", "4"))
+    REGRADE_REQUESTS_PER_MINUTE = float(os.getenv("REGRADE_REQUESTS_PER_MINUTE", "60"))
+    REGRADE_MAX_ATTEMPTS = 3
+    REGRADE_CHECKPOINT_PATH = os.path.join(DATA_DIR, "regrade_checkpoint.json")
+    REGRADE_CHECKPOINT_EVERY = 25
+    REGRADE_REPORT_SECONDS = 5
+
+    # Headless interview service (python -m src.service)
+    SERVICE_HOST = os.getenv("SERVICE_HOST", "127.0.0.1")
+    SERVICE_PORT = int(os.getenv("SERVICE_PORT", "8000"))
 
     PAGE_TITLE = "🎤 Interview Practice Partner"
     PAGE_ICON = "🎤"
@@ -46,7 +132,7 @@ class Config:
 
     @classmethod
     def validate(cls):
-        if not cls.GEMINI_API_KEY:
+        if cls.LLM_BACKEND == "gemini" and not cls.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY not found in .env")
         os.makedirs(cls.INTERVIEWS_DIR, exist_ok=True)
         os.makedirs(cls.AUDIO_CACHE_DIR, exist_ok=True)
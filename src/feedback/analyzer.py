@@ -4,22 +4,30 @@ compatible with google-generativeai==0.3.2
 """
 
 import json
-from src.llm.gemini_client import GeminiClient
+from src.llm.factory import create_llm_client
 
 
 class FeedbackAnalyzer:
 
-    def __init__(self):
-        # Use same model (gemini-pro)
-        self.gemini = GeminiClient()
+    def __init__(self, llm=None, session_id=None):
+        # Use same model (gemini-pro); session_id names LLM recordings
+        self.gemini = llm or create_llm_client(session_id=session_id)
 
     def analyze_interview(self, role: str, transcript: str):
         """
         Analyze interview transcript and return structured feedback.
         Gemini output is parsed safely without requiring strict JSON.
         """
+        raw_output = self.gemini.generate_content(build_feedback_prompt(role, transcript))
+        return parse_feedback(raw_output)
 
-        prompt = f"""
+    async def analyze_interview_async(self, role: str, transcript: str):
+        raw_output = await self.gemini.generate_content_async(build_feedback_prompt(role, transcript))
+        return parse_feedback(raw_output)
+
+
+def build_feedback_prompt(role: str, transcript: str) -> str:
+    return f"""
 You are an interview evaluation assistant.
 
 Evaluate the following mock interview for a **{role}** role.
@@ -61,35 +69,47 @@ IMPORTANT RULES:
 - Return ONLY the JSON object.
 """
 
-        # Gemini generates the JSON-like feedback
-        raw_output = self.gemini.generate_content(prompt).strip()
-
-        # Cleanup: remove accidental ``` or text before JSON
-        cleaned = raw_output
-        if cleaned.startswith("```"):
-            cleaned = cleaned.strip("`")
-        if cleaned.startswith("json"):
-            cleaned = cleaned[4:]
-
-        # Best-effort JSON parsing
-        try:
-            feedback = json.loads(cleaned)
-        except Exception:
-            # Fallback structure in case JSON fails
-            feedback = {
-                "overall_score": 7,
-                "scores": {
-                    "communication": 7,
-                    "structure": 7,
-                    "confidence": 7,
-                    "content_quality": 7,
-                    "role_fit": 7
-                },
-                "strengths": ["Good participation", "Clear answers", "Professional tone"],
-                "improvements": ["More examples needed", "Use STAR format", "Give measurable results"],
-                "best_answer": "N/A",
-                "needs_work": "N/A",
-                "summary": raw_output  # use raw text as summary fallback
-            }
-
-        return feedback
+
+def parse_feedback(raw_output: str):
+    """
+    Best-effort parse of the model's JSON-like feedback.
+    """
+    try:
+        return parse_feedback_strict(raw_output)
+    except ValueError:
+        # Fallback structure in case JSON fails
+        return {
+            "overall_score": 7,
+            "scores": {
+                "communication": 7,
+                "structure": 7,
+                "confidence": 7,
+                "content_quality": 7,
+                "role_fit": 7
+            },
+            "strengths": ["Good participation", "Clear answers", "Professional tone"],
+            "improvements": ["More examples needed", "Use STAR format", "Give measurable results"],
+            "best_answer": "N/A",
+            "needs_work": "N/A",
+            "summary": raw_output.strip()  # use raw text as summary fallback
+        }
+
+
+def parse_feedback_strict(raw_output: str):
+    """
+    Parse the model's feedback JSON, raising ValueError if it is not a
+    JSON object.
+    """
+    raw_output = raw_output.strip()
+
+    # Cleanup: remove accidental ``` or text before JSON
+    cleaned = raw_output
+    if cleaned.startswith("```"):
+        cleaned = cleaned.strip("`")
+    if cleaned.startswith("json"):
+        cleaned = cleaned[4:]
+
+    feedback = json.loads(cleaned)
+    if not isinstance(feedback, dict):
+        raise ValueError("feedback is not a JSON object")
+    return feedback
@@ -0,0 +1,354 @@
+"""
+Bulk offline re-grading of stored interviews.
+
+When the feedback rubric (build_feedback_prompt) or the model changes,
+past interviews can be re-scored in one job:
+
+    python -m src.feedback.regrade --workers 4 --rpm 60
+
+Sessions are streamed from StorageManager.iter_sessions and graded by a
+pool of async workers. At most --workers calls are in flight and calls
+are spaced to stay under --rpm requests per minute; failed calls are
+retried with backoff. Output that is not a feedback JSON object counts
+as a failed call too; it is never stored.
+
+Each regraded session keeps its history: the previous feedback moves to
+"feedback_versions" and the new one takes its place, with
+"feedback_meta" recording the content hash, rubric fingerprint, model
+and time it was graded. The content hash covers role, transcript and
+rubric, so sessions whose hash matches their current feedback are
+skipped; re-running the same job is cheap.
+
+Progress is checkpointed to REGRADE_CHECKPOINT_PATH. An interrupted run
+picks up where it stopped; the checkpoint is removed once a run
+finishes without failures.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.agents.transcript import Transcript
+from src.config import Config
+from src.feedback.analyzer import build_feedback_prompt, parse_feedback_strict
+from src.llm.factory import create_llm_client
+from src.llm.gemini_client import ERROR_REPLIES
+from src.storage.manager import StorageManager
+from src.storage.transfer import parse_since, parse_until
+
+
+COUNTERS = ("regraded", "unchanged", "resumed", "skipped", "failed")
+
+
+def rubric_fingerprint(model: str) -> str:
+    """Changes whenever the feedback prompt template or the model does."""
+    template = build_feedback_prompt("{role}", "{transcript}")
+    return hashlib.sha256(f"{model}\n{template}".encode("utf-8")).hexdigest()[:16]
+
+
+def content_hash(role: str, transcript: str, rubric: str) -> str:
+    payload = json.dumps([role, transcript, rubric], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RateLimiter:
+    """Spaces calls evenly at rate_per_minute. 0 disables the limit."""
+
+    def __init__(self, rate_per_minute: float):
+        self.interval = 60 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class Checkpoint:
+    """Session ids already handled by a run with the same rubric."""
+
+    def __init__(self, path: str, key: Dict):
+        self.path = path
+        self.key = key
+        self.done = set()
+        self._unsaved = 0
+
+    def load(self) -> int:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            print(f"[Regrade] Ignoring unreadable checkpoint: {e}")
+            return 0
+        if data.get("key") == self.key:
+            self.done = set(data.get("done", []))
+        return len(self.done)
+
+    def mark(self, session_id: str):
+        self.done.add(session_id)
+        self._unsaved += 1
+        if self._unsaved >= Config.REGRADE_CHECKPOINT_EVERY:
+            self.save()
+
+    def save(self):
+        if not self._unsaved:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": self.key, "done": sorted(self.done)}, f)
+        os.replace(tmp, self.path)
+        self._unsaved = 0
+
+    def clear(self):
+        self.done.clear()
+        self._unsaved = 0
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class Regrader:
+    """Re-grades stored interviews with bounded concurrency."""
+
+    def __init__(
+        self,
+        storage: Optional[StorageManager] = None,
+        llm=None,
+        backend: Optional[str] = None,
+        workers: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        force: bool = False,
+        dry_run: bool = False,
+        checkpoint_path: Optional[str] = None,
+    ):
+        self.storage = storage or StorageManager()
+        self.llm = llm or create_llm_client(backend=backend, session_id="regrade")
+        self.model = getattr(self.llm, "model_name", None) or (backend or Config.LLM_BACKEND)
+        self.rubric = rubric_fingerprint(self.model)
+        self.workers = max(1, Config.REGRADE_WORKERS if workers is None else workers)
+        self.limiter = RateLimiter(
+            Config.REGRADE_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        )
+        self.force = force
+        self.dry_run = dry_run
+        self.checkpoint = Checkpoint(
+            checkpoint_path or Config.REGRADE_CHECKPOINT_PATH,
+            {"rubric": self.rubric, "force": force},
+        )
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.total = 0
+        self._started = 0.0
+
+    # ------------------------------------------------------------
+    # Running a job
+    # ------------------------------------------------------------
+    async def run(self, limit: Optional[int] = None, **filters) -> Dict:
+        """
+        Re-grade every session matching the iter_sessions filters
+        (since, until, role, min_score, max_score). Returns the report.
+        """
+        self.total = self.storage.count_sessions(
+            **{k: filters[k] for k in ("since", "until", "role") if k in filters}
+        )
+        if limit is not None:
+            self.total = min(self.total, limit)
+        if not self.dry_run and self.checkpoint.load():
+            print(f"[Regrade] Resuming: {len(self.checkpoint.done)} sessions already done")
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+        self._started = time.monotonic()
+        reporter = asyncio.create_task(self._report_periodically())
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.workers)]
+        try:
+            for i, data in enumerate(self.storage.iter_sessions(**filters)):
+                if limit is not None and i >= limit:
+                    break
+                await queue.put(data)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            reporter.cancel()
+            if not self.dry_run:
+                self.checkpoint.save()
+            if self.counts["regraded"] and not self.dry_run:
+                # Rewrites skip the per-save analytics update
+                await asyncio.to_thread(self.storage.analytics.refresh)
+
+        if not self.dry_run and not self.counts["failed"]:
+            self.checkpoint.clear()
+        return self.report()
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            data = await queue.get()
+            if data is None:
+                return
+            try:
+                result = await self._regrade(data)
+            except Exception as e:
+                print(f"[Regrade] Error on session {data.get('session_id')}: {e}")
+                result = "failed"
+            self.counts[result] += 1
+
+    async def _regrade(self, data: Dict) -> str:
+        session_id = data.get("session_id")
+        messages = data.get("messages") or []
+        if (
+            not session_id
+            or data.get("status") == "unfinished"
+            or not any(m.get("role") == "candidate" for m in messages)
+        ):
+            return "skipped"
+        if session_id in self.checkpoint.done:
+            return "resumed"
+
+        role = data.get("role", "unknown")
+        transcript = Transcript.from_dicts(messages).text()
+        digest = content_hash(role, transcript, self.rubric)
+        if not self.force and (data.get("feedback_meta") or {}).get("content_hash") == digest:
+            if not self.dry_run:
+                self.checkpoint.mark(session_id)
+            return "unchanged"
+        if self.dry_run:
+            return "regraded"
+
+        feedback = await self._grade(role, transcript)
+        if feedback is None or not await asyncio.to_thread(self._store, data, feedback, digest):
+            return "failed"
+        self.checkpoint.mark(session_id)
+        return "regraded"
+
+    async def _grade(self, role: str, transcript: str) -> Optional[Dict]:
+        prompt = build_feedback_prompt(role, transcript)
+        for attempt in range(Config.REGRADE_MAX_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(2 ** attempt)
+            await self.limiter.acquire()
+            try:
+                raw_output = await self.llm.generate_content_async(prompt)
+            except Exception as e:
+                print(f"[Regrade] LLM error: {e}")
+                continue
+            if not raw_output or raw_output.strip() in ERROR_REPLIES:
+                continue
+            try:
+                return parse_feedback_strict(raw_output)
+            except ValueError:
+                # Never store the analyzer's made-up fallback as a grade
+                print(f"[Regrade] Unparseable feedback: {raw_output.strip()[:80]!r}")
+        return None
+
+    def _store(self, data: Dict, feedback: Dict, digest: str) -> bool:
+        previous = data.get("feedback")
+        if previous is not None:
+            meta = data.get("feedback_meta") or {"graded_at": data.get("saved_at")}
+            data.setdefault("feedback_versions", []).append({"feedback": previous, **meta})
+
+        data["feedback"] = feedback
+        data["feedback_meta"] = {
+            "content_hash": digest,
+            "rubric": self.rubric,
+            "model": self.model,
+            "graded_at": datetime.now().isoformat(),
+        }
+        return bool(self.storage.rewrite_interview(data))
+
+    # ------------------------------------------------------------
+    # Progress
+    # ------------------------------------------------------------
+    def report(self) -> Dict:
+        elapsed = time.monotonic() - self._started
+        processed = sum(self.counts.values())
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        remaining = max(self.total - processed, 0)
+        return {
+            **self.counts,
+            "processed": processed,
+            "total": self.total,
+            "elapsed_seconds": round(elapsed, 1),
+            "sessions_per_second": round(rate, 2),
+            "eta_seconds": round(remaining / rate) if rate else None,
+        }
+
+    async def _report_periodically(self):
+        while True:
+            await asyncio.sleep(Config.REGRADE_REPORT_SECONDS)
+            print(format_report(self.report()))
+
+
+def _duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "?"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def format_report(report: Dict) -> str:
+    counts = ", ".join(f"{name} {report[name]}" for name in COUNTERS if report[name])
+    return (
+        f"[Regrade] {report['processed']}/{report['total']} ({counts or 'nothing yet'}) "
+        f"{report['sessions_per_second']:.2f}/s, elapsed {_duration(report['elapsed_seconds'])}, "
+        f"ETA {_duration(report['eta_seconds'])}"
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Re-grade stored interviews with the current rubric.")
+    parser.add_argument("--workers", type=int, default=Config.REGRADE_WORKERS, help="LLM calls in flight")
+    parser.add_argument("--rpm", type=float, default=Config.REGRADE_REQUESTS_PER_MINUTE,
+                        help="max LLM requests per minute (0 = unlimited)")
+    parser.add_argument("--backend", help="LLM backend (default: LLM_BACKEND)")
+    parser.add_argument("--role", help="only sessions for this role")
+    parser.add_argument("--since", type=parse_since, help="only sessions started on/after (ISO date)")
+    parser.add_argument("--until", type=parse_until, help="only sessions started on/before (ISO date, inclusive)")
+    parser.add_argument("--limit", type=int, help="stop after this many sessions")
+    parser.add_argument("--force", action="store_true", help="re-grade even if the content hash is unchanged")
+    parser.add_argument("--dry-run", action="store_true", help="count what would be re-graded; no LLM calls")
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+
+    regrader = Regrader(
+        backend=args.backend,
+        workers=args.workers,
+        requests_per_minute=args.rpm,
+        force=args.force,
+        dry_run=args.dry_run,
+    )
+    if args.restart:
+        regrader.checkpoint.clear()
+
+    filters = {k: v for k, v in (("role", args.role), ("since", args.since), ("until", args.until)) if v}
+    try:
+        report = asyncio.run(regrader.run(limit=args.limit, **filters))
+    except KeyboardInterrupt:
+        print(format_report(regrader.report()))
+        print("[Regrade] Interrupted; run again to resume from the checkpoint.")
+        return
+
+    print(format_report(report))
+    if args.dry_run:
+        print("[Regrade] Dry run: \"regraded\" counts sessions that would be re-graded.")
+    if report["failed"]:
+        print(f"[Regrade] {report['failed']} sessions failed; run again to retry them.")
+
+
+if __name__ == "__main__":
+    main()
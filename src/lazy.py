@@ -0,0 +1,52 @@
+"""
+Deferred imports for heavy SDKs.
+
+google.generativeai, speech_recognition, vosk and ffmpeg-python each take
+tens to hundreds of milliseconds to import. Modules bind them with
+lazy_import() instead, so the real import happens on first attribute
+access rather than when the app starts, and check for them with
+is_installed(), which finds the package without importing it.
+"""
+
+import importlib
+import importlib.util
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in module that imports the real one on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            # import_module holds the import lock, so concurrent first
+            # uses still import once
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
+
+
+def is_installed(name: str) -> bool:
+    """
+    True if the module can be imported (only parent packages are imported
+    to find out).
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
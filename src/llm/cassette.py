@@ -0,0 +1,424 @@
+"""
+Record-and-replay LLM cassettes.
+
+Recording (LLM_RECORD=1) wraps the real client. Every chat start,
+send_message, streamed message and generate_content call is appended
+as one compact JSON line to data/cassettes/<session_id>.jsonl, with the
+request, the response and how long the call took (and, for streams,
+when each piece arrived). The engine's chat and the feedback call of
+one interview land in the same cassette.
+
+Replay (LLM_BACKEND=replay, or ReplayClient(path) directly) serves the
+recorded responses back in order. It sleeps the recorded latency
+multiplied by time_scale (LLM_REPLAY_TIME_SCALE; 0 = no delay), so
+InterviewEngine and FeedbackAnalyzer runs are repeatable offline with
+the latency shape of the real session. The text of each request is
+compared with the recording; mismatches are counted (or raised, with
+strict=True) but do not stop the replay, since the engine's prompts
+contain random encouragement.
+
+Cassette lines:
+    {"cassette": 1, "session_id", "backend", "model", "recorded_at"}     header
+    {"op": "start_chat", "request", "ms"}
+    {"op": "send_message" | "generate_content", "request", "response", "ms"}
+    {"op": "stream_message", "request", "chunks": [[ms, text], ...], "ms"}
+
+Replay a saved interview against its cassette:
+    python -m src.llm.cassette show data/cassettes/<id>.jsonl
+    python -m src.llm.cassette replay data/cassettes/<id>.jsonl --session data/interviews/<id>_<role>.json --time-scale 0.5
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.config import Config
+
+
+CASSETTE_VERSION = 1
+
+# Replay queues: both chat ops serve chat turns, so a recording made
+# with streaming can be replayed without it and vice versa
+QUEUES = {
+    "start_chat": "start_chat",
+    "send_message": "chat",
+    "stream_message": "chat",
+    "generate_content": "generate_content",
+}
+
+_file_locks: Dict[str, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+
+class CassetteExhausted(RuntimeError):
+    """Replay asked for more calls than were recorded."""
+
+
+class CassetteMismatch(RuntimeError):
+    """Strict replay got a different request than was recorded."""
+
+
+def cassette_path(session_id: Optional[str] = None) -> str:
+    """Cassette file for a session; clients without one get a fresh name."""
+    name = session_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+    return os.path.join(Config.CASSETTES_DIR, f"{name}.jsonl")
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _file_locks_guard:
+        return _file_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+class RecordingClient:
+    """
+    Passes calls through to a real client and appends each one to a
+    cassette. Everything else (history export, restore) is delegated.
+    """
+
+    def __init__(self, client, path: str, session_id: Optional[str] = None, backend: Optional[str] = None):
+        self._client = client
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        with _lock_for(path):
+            if not os.path.exists(path):
+                self._write({
+                    "cassette": CASSETTE_VERSION,
+                    "session_id": session_id,
+                    "backend": backend,
+                    "model": getattr(client, "model_name", None),
+                    "recorded_at": datetime.now().isoformat(timespec="seconds"),
+                })
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def _write(self, record: Dict):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def _record(self, record: Dict):
+        with _lock_for(self.path):
+            self._write(record)
+
+    # ------------------------------------------------------------
+    # Sync interface
+    # ------------------------------------------------------------
+    def start_chat(self, system_instruction=None):
+        started = time.perf_counter()
+        self._client.start_chat(system_instruction)
+        self._record({"op": "start_chat", "request": system_instruction, "ms": _elapsed_ms(started)})
+
+    def send_message(self, message):
+        started = time.perf_counter()
+        reply = self._client.send_message(message)
+        self._record({"op": "send_message", "request": message, "response": reply, "ms": _elapsed_ms(started)})
+        return reply
+
+    def stream_message(self, message):
+        started = time.perf_counter()
+        chunks = []
+        for piece in self._client.stream_message(message):
+            chunks.append([_elapsed_ms(started), piece])
+            yield piece
+        self._record({"op": "stream_message", "request": message, "chunks": chunks, "ms": _elapsed_ms(started)})
+
+    def generate_content(self, prompt):
+        started = time.perf_counter()
+        output = self._client.generate_content(prompt)
+        self._record({"op": "generate_content", "request": prompt, "response": output, "ms": _elapsed_ms(started)})
+        return output
+
+    # ------------------------------------------------------------
+    # Async interface
+    # ------------------------------------------------------------
+    async def start_chat_async(self, system_instruction=None):
+        started = time.perf_counter()
+        await self._client.start_chat_async(system_instruction)
+        self._record({"op": "start_chat", "request": system_instruction, "ms": _elapsed_ms(started)})
+
+    async def send_message_async(self, message):
+        started = time.perf_counter()
+        reply = await self._client.send_message_async(message)
+        self._record({"op": "send_message", "request": message, "response": reply, "ms": _elapsed_ms(started)})
+        return reply
+
+    async def stream_message_async(self, message):
+        started = time.perf_counter()
+        chunks = []
+        async for piece in self._client.stream_message_async(message):
+            chunks.append([_elapsed_ms(started), piece])
+            yield piece
+        self._record({"op": "stream_message", "request": message, "chunks": chunks, "ms": _elapsed_ms(started)})
+
+    async def generate_content_async(self, prompt):
+        started = time.perf_counter()
+        output = await self._client.generate_content_async(prompt)
+        self._record({"op": "generate_content", "request": prompt, "response": output, "ms": _elapsed_ms(started)})
+        return output
+
+
+def load_cassette(path: str) -> Dict:
+    """Header and calls of a cassette. A torn last line is skipped."""
+    header: Dict = {}
+    calls: List[Dict] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if "cassette" in record:
+                header = record
+            elif record.get("op") in QUEUES:
+                calls.append(record)
+
+    if header and header.get("cassette") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version {header.get('cassette')}")
+    return {"header": header, "calls": calls}
+
+
+def _response_text(call: Dict) -> str:
+    if call["op"] == "stream_message":
+        return "".join(piece for _, piece in call["chunks"])
+    return call.get("response") or ""
+
+
+class ReplayClient:
+    """Same interface as GeminiClient, answering from a cassette."""
+
+    def __init__(self, path: str, time_scale: Optional[float] = None, strict: bool = False):
+        self.path = path
+        self.time_scale = Config.LLM_REPLAY_TIME_SCALE if time_scale is None else time_scale
+        self.strict = strict
+
+        cassette = load_cassette(path)
+        self.header = cassette["header"]
+        self.model_name = self.header.get("model") or "replay"
+        self._queues = {name: deque() for name in set(QUEUES.values())}
+        for call in cassette["calls"]:
+            self._queues[QUEUES[call["op"]]].append(call)
+
+        self._lock = threading.Lock()
+        self.chat: List[Dict] = []
+        self.mismatches = 0
+        self.served = 0
+
+    # ------------------------------------------------------------
+    # Cassette access
+    # ------------------------------------------------------------
+    def _next(self, queue: str, request) -> Optional[Dict]:
+        with self._lock:
+            calls = self._queues[queue]
+            if not calls:
+                if queue == "start_chat":
+                    return None
+                raise CassetteExhausted(f"No more recorded '{queue}' calls in {self.path}")
+            call = calls.popleft()
+            self.served += 1
+            if call.get("request") != request:
+                self.mismatches += 1
+                if self.strict:
+                    raise CassetteMismatch(
+                        f"Call {self.served} of {self.path}: expected {call.get('request')!r}, got {request!r}"
+                    )
+            return call
+
+    def _delay(self, call: Optional[Dict]) -> float:
+        return (call or {}).get("ms", 0) / 1000 * self.time_scale
+
+    def _chat_turn(self, message: str, reply: str) -> str:
+        self.chat.append({"role": "user", "parts": [message]})
+        self.chat.append({"role": "model", "parts": [reply]})
+        return reply
+
+    # ------------------------------------------------------------
+    # History (checkpoints and the session journal)
+    # ------------------------------------------------------------
+    def export_history(self, start=0):
+        return list(self.chat[start:])
+
+    def restore_history(self, history):
+        """
+        Continue a checkpointed chat: recorded chat calls already answered
+        in the history are skipped, so the next turn gets the next reply.
+        Local replies (add_exchange) were never recorded and match nothing.
+        """
+        self.chat = list(history)
+        with self._lock:
+            calls = self._queues["chat"]
+            for entry in history:
+                if entry.get("role") != "model" or not calls:
+                    continue
+                if "".join(entry.get("parts", [])) == _response_text(calls[0]):
+                    calls.popleft()
+                    self.served += 1
+
+    def add_exchange(self, message, reply):
+        # A local reply was never recorded: history only, no cassette call
+        self._chat_turn(message, reply)
+
+    # ------------------------------------------------------------
+    # Sync interface
+    # ------------------------------------------------------------
+    def start_chat(self, system_instruction=None):
+        self.chat = []
+        time.sleep(self._delay(self._next("start_chat", system_instruction)))
+
+    def send_message(self, message):
+        call = self._next("chat", message)
+        time.sleep(self._delay(call))
+        return self._chat_turn(message, _response_text(call))
+
+    def stream_message(self, message):
+        call = self._next("chat", message)
+        if call["op"] != "stream_message":
+            # Recorded without streaming: the whole reply after the full delay
+            time.sleep(self._delay(call))
+            yield self._chat_turn(message, _response_text(call))
+            return
+
+        elapsed = 0.0
+        for at_ms, piece in call["chunks"]:
+            time.sleep(max(0.0, at_ms - elapsed) / 1000 * self.time_scale)
+            elapsed = at_ms
+            yield piece
+        self._chat_turn(message, _response_text(call))
+
+    def generate_content(self, prompt):
+        call = self._next("generate_content", prompt)
+        time.sleep(self._delay(call))
+        return _response_text(call)
+
+    # ------------------------------------------------------------
+    # Async interface
+    # ------------------------------------------------------------
+    async def start_chat_async(self, system_instruction=None):
+        self.chat = []
+        await asyncio.sleep(self._delay(self._next("start_chat", system_instruction)))
+
+    async def send_message_async(self, message):
+        call = self._next("chat", message)
+        await asyncio.sleep(self._delay(call))
+        return self._chat_turn(message, _response_text(call))
+
+    async def stream_message_async(self, message):
+        call = self._next("chat", message)
+        if call["op"] != "stream_message":
+            # Recorded without streaming: the whole reply after the full delay
+            await asyncio.sleep(self._delay(call))
+            yield self._chat_turn(message, _response_text(call))
+            return
+
+        elapsed = 0.0
+        for at_ms, piece in call["chunks"]:
+            await asyncio.sleep(max(0.0, at_ms - elapsed) / 1000 * self.time_scale)
+            elapsed = at_ms
+            yield piece
+        self._chat_turn(message, _response_text(call))
+
+    async def generate_content_async(self, prompt):
+        call = self._next("generate_content", prompt)
+        await asyncio.sleep(self._delay(call))
+        return _response_text(call)
+
+
+# ------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------
+def _percentile(values: List[float], pct: int) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def show(path: str):
+    cassette = load_cassette(path)
+    header, calls = cassette["header"], cassette["calls"]
+    print(f"{path}: session {header.get('session_id')}, {header.get('backend')} / {header.get('model')}, "
+          f"recorded {header.get('recorded_at')}")
+    print(f"\n{'op':<18}{'calls':>7}{'p50 ms':>10}{'p95 ms':>10}{'total s':>10}")
+    for op in QUEUES:
+        ms = [c["ms"] for c in calls if c["op"] == op]
+        if ms:
+            print(f"{op:<18}{len(ms):>7}{_percentile(ms, 50):>10.0f}{_percentile(ms, 95):>10.0f}{sum(ms) / 1000:>10.1f}")
+
+
+def replay(path: str, session_path: str, time_scale: float, strict: bool):
+    """
+    Re-run a saved interview (its candidate answers) through
+    InterviewEngine and FeedbackAnalyzer against the cassette, and
+    compare per-call latency with the recording.
+    """
+    from src.agents.interview_engine import InterviewEngine
+    from src.feedback.analyzer import FeedbackAnalyzer
+
+    with open(session_path, "r", encoding="utf-8") as f:
+        session = json.load(f)
+    answers = [m["content"] for m in session["messages"] if m["role"] == "candidate"]
+
+    client = ReplayClient(path, time_scale=time_scale, strict=strict)
+    recorded = [c["ms"] for c in load_cassette(path)["calls"] if QUEUES[c["op"]] != "start_chat"]
+    timings = []
+
+    started = time.perf_counter()
+    engine = InterviewEngine(session["role"], llm=client, persona=session.get("persona", "normal"))
+    call_started = time.perf_counter()
+    engine.start_interview()
+    timings.append(_elapsed_ms(call_started))
+
+    for answer in answers:
+        # The saved answers already went through apply_persona
+        call_started = time.perf_counter()
+        engine.process_answer(answer)
+        timings.append(_elapsed_ms(call_started))
+
+    call_started = time.perf_counter()
+    feedback = FeedbackAnalyzer(llm=client).analyze_interview(engine.role, engine.get_transcript())
+    timings.append(_elapsed_ms(call_started))
+    total = time.perf_counter() - started
+
+    print(f"replayed {len(timings)} calls in {total:.2f} s (time scale {time_scale}), "
+          f"{client.mismatches} request mismatches")
+    print(f"\n{'call':>5}{'recorded ms':>14}{'replayed ms':>14}")
+    for i, ms in enumerate(timings):
+        before = f"{recorded[i]:.0f}" if i < len(recorded) else "-"
+        print(f"{i + 1:>5}{before:>14}{ms:>14.0f}")
+    print(f"\noverall score: {feedback.get('overall_score')}")
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or replay LLM cassettes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show_cmd = commands.add_parser("show", help="summarize a cassette")
+    show_cmd.add_argument("cassette")
+
+    replay_cmd = commands.add_parser("replay", help="re-run a saved interview against its cassette")
+    replay_cmd.add_argument("cassette")
+    replay_cmd.add_argument("--session", required=True, help="saved interview JSON (for the answers)")
+    replay_cmd.add_argument("--time-scale", type=float, default=1.0, help="latency multiplier (0 = no delay)")
+    replay_cmd.add_argument("--strict", action="store_true", help="fail on the first request mismatch")
+
+    args = parser.parse_args(argv)
+    if args.command == "show":
+        show(args.cassette)
+    else:
+        replay(args.cassette, args.session, args.time_scale, args.strict)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+LLM client selection.
+
+Config.LLM_BACKEND picks the client used by the interview engine and the
+feedback analyzer:
+- "gemini": Google Gemini (default, needs GEMINI_API_KEY)
+- "stub":   canned offline replies (development and benchmarks)
+- "replay": recorded calls from a cassette (see src/llm/cassette.py)
+
+With Config.LLM_RECORD set, gemini and stub clients are wrapped to record
+every call into the session's cassette.
+"""
+
+from src.config import Config
+
+
+def create_llm_client(model_name=None, backend=None, session_id=None):
+    backend = (backend or Config.LLM_BACKEND).lower()
+
+    if backend == "replay":
+        from src.llm.cassette import ReplayClient, cassette_path
+        return ReplayClient(Config.LLM_REPLAY_CASSETTE or cassette_path(session_id))
+
+    if backend == "stub":
+        from src.llm.stub_client import StubLLMClient
+        client = StubLLMClient(model_name)
+    else:
+        if backend != "gemini":
+            print(f"[LLM] Unknown backend '{backend}', using gemini.")
+            backend = "gemini"
+
+        from src.llm.gemini_client import GeminiClient
+        client = GeminiClient(model_name)
+
+    if Config.LLM_RECORD:
+        from src.llm.cassette import RecordingClient, cassette_path
+        return RecordingClient(client, cassette_path(session_id), session_id=session_id, backend=backend)
+    return client
@@ -1,5 +1,14 @@
-import google.generativeai as genai
 from src.config import Config
+from src.lazy import lazy_import
+
+# Imported on first client construction, not at app start
+genai = lazy_import("google.generativeai")
+
+# Returned instead of raising when a call fails; callers that must not
+# mistake them for model output check ERROR_REPLIES
+CHAT_ERROR_REPLY = "I'm having trouble generating a response."
+CONTENT_ERROR_REPLY = "Error generating content."
+ERROR_REPLIES = frozenset({CHAT_ERROR_REPLY, CONTENT_ERROR_REPLY})
 
 class GeminiClient:
     def __init__(self, model_name=None):
@@ -21,6 +30,34 @@ class GeminiClient:
             except Exception as e:
                 print("System Instruction Error:", e)
 
+    def export_history(self, start=0):
+        """
+        Chat history from entry start on, as plain dicts, for checkpoints
+        and the session journal.
+        """
+        if not self.chat:
+            return []
+        return [
+            {"role": content.role, "parts": [part.text for part in content.parts]}
+            for content in self.chat.history[start:]
+        ]
+
+    def restore_history(self, history):
+        """
+        Continue a checkpointed chat without re-sending anything.
+        """
+        self.chat = self.model.start_chat(history=history)
+
+    def add_exchange(self, message, reply):
+        """
+        Record a turn answered without the model (see
+        InterviewEngine.respond_local), so later turns see it.
+        """
+        self.restore_history(self.export_history() + [
+            {"role": "user", "parts": [message]},
+            {"role": "model", "parts": [reply]},
+        ])
+
     def send_message(self, message):
         if not self.chat:
             self.start_chat()
@@ -30,7 +67,23 @@ class GeminiClient:
             return response.text or ""
         except Exception as e:
             print("Gemini Error:", e)
-            return "I'm having trouble generating a response."
+            return CHAT_ERROR_REPLY
+
+    def stream_message(self, message):
+        """
+        Yield the reply in pieces as the model produces them.
+        """
+        if not self.chat:
+            self.start_chat()
+
+        try:
+            response = self.chat.send_message(message, stream=True)
+            for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            print("Gemini Error:", e)
+            yield CHAT_ERROR_REPLY
 
     def generate_content(self, prompt):
         try:
@@ -38,4 +91,51 @@ class GeminiClient:
             return response.text or ""
         except Exception as e:
             print("GenerateContent Error:", e)
-            return "Error generating content."
+            return CONTENT_ERROR_REPLY
+
+    # ------------------------------------------------------------
+    # Async variants (used by the service layer)
+    # ------------------------------------------------------------
+    async def start_chat_async(self, system_instruction=None):
+        self.chat = self.model.start_chat(history=[])
+
+        if system_instruction:
+            try:
+                await self.chat.send_message_async(system_instruction)
+            except Exception as e:
+                print("System Instruction Error:", e)
+
+    async def send_message_async(self, message):
+        if not self.chat:
+            await self.start_chat_async()
+
+        try:
+            response = await self.chat.send_message_async(message)
+            return response.text or ""
+        except Exception as e:
+            print("Gemini Error:", e)
+            return CHAT_ERROR_REPLY
+
+    async def stream_message_async(self, message):
+        """
+        Yield the reply in pieces as the model produces them.
+        """
+        if not self.chat:
+            await self.start_chat_async()
+
+        try:
+            response = await self.chat.send_message_async(message, stream=True)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            print("Gemini Error:", e)
+            yield CHAT_ERROR_REPLY
+
+    async def generate_content_async(self, prompt):
+        try:
+            response = await self.model.generate_content_async(prompt)
+            return response.text or ""
+        except Exception as e:
+            print("GenerateContent Error:", e)
+            return CONTENT_ERROR_REPLY
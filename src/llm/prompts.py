@@ -55,3 +55,59 @@ PROBE_PROMPTS = [
     "What challenge did you face and how did you handle it?",
     "Can you explain that a bit more clearly?"
 ]
+
+# Spoken when the model returns an empty reply
+FALLBACK_REPLY = "Could you explain that more clearly?"
+
+# Final question of every interview
+CLOSING_QUESTION = "Do you have any questions for me?"
+
+
+# Used instead of the LLM when the service is overloaded
+LOCAL_OPENING = "Hello, thanks for joining. Tell me about yourself."
+
+LOCAL_QUESTIONS = {
+    "sales": [
+        "Tell me about a deal you closed that you are proud of.",
+        "How do you handle a customer who says your price is too high?",
+        "How do you keep your pipeline full when targets go up?",
+        "Describe a time you lost a deal. What did you learn?",
+        "How do you build trust with a new customer?",
+    ],
+    "engineer": [
+        "Walk me through a system you designed recently.",
+        "Tell me about the hardest bug you have debugged.",
+        "How do you decide when code is ready to ship?",
+        "Describe a technical disagreement with a teammate and how it ended.",
+        "How do you keep a growing codebase maintainable?",
+    ],
+    "retail": [
+        "Tell me about a time you turned an unhappy customer around.",
+        "How do you stay productive during a busy rush?",
+        "What would you do if you saw a coworker being rude to a customer?",
+        "How do you handle a request you cannot fulfil?",
+        "What does great customer service mean to you?",
+    ],
+    "behavioral": [
+        "Tell me about a conflict at work and how you resolved it.",
+        "Describe a time you led a team through a difficult situation.",
+        "Tell me about a decision you made with incomplete information.",
+        "Describe a failure and what you changed afterwards.",
+        "Tell me about a time you had to adapt to a big change.",
+    ],
+}
+
+LOCAL_CLOSING = "Thank you, that covers my questions. " + CLOSING_QUESTION
+
+
+def get_static_phrases():
+    """
+    Interviewer replies that are spoken verbatim and over and over: the
+    local question bank and the fixed fallbacks. (Encouragements only
+    ever reach the LLM inside a prompt.) Used as the manifest for TTS
+    cache warm-up.
+    """
+    phrases = [LOCAL_OPENING, LOCAL_CLOSING, FALLBACK_REPLY] + PROBE_PROMPTS
+    for questions in LOCAL_QUESTIONS.values():
+        phrases += questions
+    return list(dict.fromkeys(phrases))
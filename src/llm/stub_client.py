@@ -0,0 +1,120 @@
+"""
+Offline stand-in for GeminiClient.
+
+Returns canned interviewer questions and well-formed feedback JSON after
+a fixed, configurable delay (Config.STUB_LLM_LATENCY_MS). Used with
+LLM_BACKEND=stub for local development without an API key, and for load
+and throughput benchmarks where the real model would dominate.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+
+from src.config import Config
+
+
+STUB_QUESTIONS = [
+    "Thanks for joining. Tell me about yourself.",
+    "Can you walk me through a recent project you are proud of?",
+    "What was the hardest problem in that project, and how did you solve it?",
+    "Tell me about a time you disagreed with a teammate.",
+    "How do you prioritize when everything seems urgent?",
+    "Describe a mistake you made and what you learned from it.",
+    "Where would you like to grow in your next role?",
+    "Thank you. Do you have any questions for me?",
+]
+
+
+class StubLLMClient:
+    """Same interface as GeminiClient, no network."""
+
+    def __init__(self, model_name=None, latency_ms=None):
+        self.model_name = model_name or "stub"
+        self.latency = (Config.STUB_LLM_LATENCY_MS if latency_ms is None else latency_ms) / 1000
+        self.chat = []
+        self.turn = 0
+
+    # ------------------------------------------------------------
+    # Replies
+    # ------------------------------------------------------------
+    def _next_reply(self, message: str) -> str:
+        reply = STUB_QUESTIONS[min(self.turn, len(STUB_QUESTIONS) - 1)]
+        self.turn += 1
+        self.chat.append({"role": "user", "parts": [message]})
+        self.chat.append({"role": "model", "parts": [reply]})
+        return reply
+
+    @staticmethod
+    def _feedback(prompt: str) -> str:
+        # Deterministic but transcript-dependent scores
+        digest = hashlib.md5(prompt.encode("utf-8")).digest()
+        scores = {
+            name: 4 + digest[i] % 6
+            for i, name in enumerate(
+                ["communication", "structure", "confidence", "content_quality", "role_fit"]
+            )
+        }
+        return json.dumps({
+            "overall_score": round(sum(scores.values()) / len(scores)),
+            "scores": scores,
+            "strengths": ["Clear structure", "Relevant examples", "Calm delivery"],
+            "improvements": ["Quantify results", "Shorter answers", "Use the STAR format"],
+            "best_answer": "The project walkthrough.",
+            "needs_work": "The conflict example.",
+            "summary": "Stub feedback generated offline.",
+        })
+
+    # ------------------------------------------------------------
+    # Sync interface
+    # ------------------------------------------------------------
+    def start_chat(self, system_instruction=None):
+        self.chat = []
+        self.turn = 0
+
+    def export_history(self, start=0):
+        return list(self.chat[start:])
+
+    def restore_history(self, history):
+        self.chat = list(history)
+        self.turn = sum(1 for entry in history if entry["role"] == "model")
+
+    def add_exchange(self, message, reply):
+        self.chat.append({"role": "user", "parts": [message]})
+        self.chat.append({"role": "model", "parts": [reply]})
+        self.turn += 1
+
+    def send_message(self, message):
+        time.sleep(self.latency)
+        return self._next_reply(message)
+
+    def stream_message(self, message):
+        words = self._next_reply(message).split(" ")
+        for i, word in enumerate(words):
+            time.sleep(self.latency / len(words))
+            yield word if i == 0 else " " + word
+
+    def generate_content(self, prompt):
+        time.sleep(self.latency)
+        return self._feedback(prompt)
+
+    # ------------------------------------------------------------
+    # Async interface
+    # ------------------------------------------------------------
+    async def start_chat_async(self, system_instruction=None):
+        self.start_chat(system_instruction)
+
+    async def send_message_async(self, message):
+        await asyncio.sleep(self.latency)
+        return self._next_reply(message)
+
+    async def stream_message_async(self, message):
+        words = self._next_reply(message).split(" ")
+        for i, word in enumerate(words):
+            await asyncio.sleep(self.latency / len(words))
+            yield word if i == 0 else " " + word
+
+    async def generate_content_async(self, prompt):
+        await asyncio.sleep(self.latency)
+        return self._feedback(prompt)
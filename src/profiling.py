@@ -0,0 +1,239 @@
+"""
+On-demand CPU and memory profiling of interview turns.
+
+Profiling is off by default. It can be switched on for one session (the
+sidebar's admin section) or for the whole process (PROFILING=1, or the
+same sidebar section). While it is on, every turn handled in a
+`with get_profiler().turn(session_id, label):` block is profiled:
+
+CPU     a sampling profiler reads the turn thread's stack every
+        PROFILE_SAMPLE_INTERVAL_MS. It writes collapsed stacks
+        (<artifact>.collapsed, one "frame;frame;frame count" line per
+        stack, for flamegraph.pl or speedscope) and a top-functions
+        summary (<artifact>.cpu.txt). Sampling costs no time in the
+        profiled thread and works in worker threads, where cProfile
+        would not.
+memory  tracemalloc snapshots are taken after each turn. The top
+        allocators and the growth since the session's previous turn go
+        to <artifact>.mem.txt. Steady growth across turns points at
+        state that is never released. tracemalloc sees the whole
+        process, so concurrent sessions show up in these numbers too.
+
+Artifacts go to data/profiles/<session_id>/<timestamp>_<label>.*
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.config import Config
+
+
+PROCESS_KEY = "process"
+
+# Frames of the profiler itself are left out of the memory reports
+_IGNORED_FILES = (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap>")
+
+
+class StackSampler:
+    """Samples one thread's call stack on a daemon thread."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top(self, limit: int) -> str:
+        """Functions by samples on the stack (total) and at the top (self)."""
+        total: Counter = Counter()
+        own: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+
+        samples = max(self.samples, 1)
+        lines = [f"{self.samples} samples every {self.interval * 1000:.0f} ms\n",
+                 f"{'total %':>8}{'self %':>8}  function"]
+        for frame, count in total.most_common(limit):
+            lines.append(f"{count / samples:>8.1%}{own[frame] / samples:>8.1%}  {frame}")
+        return "\n".join(lines) + "\n"
+
+
+class Profiler:
+    """Per-session and process-wide profiling switches, and turn profiling."""
+
+    def __init__(self, directory: Optional[str] = None, interval: Optional[float] = None):
+        self.directory = directory or Config.PROFILES_DIR
+        self.interval = Config.PROFILE_SAMPLE_INTERVAL_MS / 1000 if interval is None else interval
+        self.process_wide = Config.PROFILING
+        self._sessions: Dict[str, float] = {}     # session id -> last turn
+        self._snapshots: Dict[str, tracemalloc.Snapshot] = {}
+        self._active_turns = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # Switches
+    # ------------------------------------------------------------
+    def enable(self, session_id: str):
+        with self._lock:
+            self._sessions[session_id] = time.monotonic()
+            self._expire_sessions()
+
+    def disable(self, session_id: str):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            self._snapshots.pop(session_id, None)
+            self._stop_tracing()
+
+    def set_process_wide(self, enabled: bool):
+        with self._lock:
+            self.process_wide = enabled
+            if not enabled:
+                self._snapshots = {k: v for k, v in self._snapshots.items() if k in self._sessions}
+                self._stop_tracing()
+
+    def is_enabled(self, session_id: Optional[str] = None) -> bool:
+        return self.process_wide or (session_id is not None and session_id in self._sessions)
+
+    def _expire_sessions(self):
+        # Called with the lock held. Sessions of closed tabs are never
+        # disabled explicitly; drop them once idle like the session pool
+        cutoff = time.monotonic() - Config.SESSION_IDLE_SECONDS
+        for session_id, last_seen in list(self._sessions.items()):
+            if last_seen < cutoff:
+                del self._sessions[session_id]
+                self._snapshots.pop(session_id, None)
+        self._stop_tracing()
+
+    def _stop_tracing(self):
+        # Called with the lock held
+        if not self.process_wide and not self._sessions and not self._active_turns and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            self._snapshots.clear()
+
+    # ------------------------------------------------------------
+    # Profiling a turn
+    # ------------------------------------------------------------
+    @contextmanager
+    def turn(self, session_id: Optional[str], label: str):
+        """
+        Profile the enclosed block if profiling is on for the session.
+        Costs one set lookup when it is off.
+        """
+        if not self.is_enabled(session_id):
+            yield
+            return
+
+        key = session_id or PROCESS_KEY
+        with self._lock:
+            if session_id in self._sessions:
+                self._sessions[session_id] = time.monotonic()
+            self._expire_sessions()
+            self._active_turns += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(Config.PROFILE_TRACEMALLOC_FRAMES)
+
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            sampler.stop()
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, name) for name in _IGNORED_FILES]
+            )
+            with self._lock:
+                previous = self._snapshots.get(key)
+                self._snapshots[key] = snapshot
+                self._active_turns -= 1
+                self._stop_tracing()
+            try:
+                self._write(key, label, elapsed, sampler, snapshot, previous)
+            except OSError as e:
+                print(f"[Profiler] Could not write profile: {e}")
+
+    def _write(self, key, label, elapsed, sampler, snapshot, previous):
+        directory = os.path.join(self.directory, key)
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{label}")
+        limit = Config.PROFILE_TOP_N
+
+        with open(f"{base}.collapsed", "w", encoding="utf-8") as f:
+            f.write(sampler.collapsed())
+
+        with open(f"{base}.cpu.txt", "w", encoding="utf-8") as f:
+            f.write(f"{label} for {key}: {elapsed * 1000:.0f} ms wall\n")
+            f.write(sampler.top(limit))
+
+        stats = snapshot.statistics("lineno")
+        lines = [f"traced memory: {sum(s.size for s in stats) / 1024:.0f} KiB in {len(stats)} lines\n",
+                 f"Top {limit} allocators:"]
+        lines += [str(stat) for stat in stats[:limit]]
+        if previous is not None:
+            diff = snapshot.compare_to(previous, "lineno")
+            growth = sum(d.size_diff for d in diff)
+            lines += ["", f"Change since the previous turn: {growth / 1024:+.0f} KiB", f"Top {limit} changes:"]
+            lines += [str(d) for d in diff[:limit]]
+        with open(f"{base}.mem.txt", "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    # ------------------------------------------------------------
+    # Artifacts
+    # ------------------------------------------------------------
+    def artifacts(self, session_id: Optional[str] = None, limit: int = 20) -> List[str]:
+        """Newest artifact files for a session (or process-wide profiles)."""
+        directory = os.path.join(self.directory, session_id or PROCESS_KEY)
+        try:
+            names = sorted(os.listdir(directory), reverse=True)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(directory, name) for name in names[:limit]]
+
+
+_profiler: Optional[Profiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    """Process-wide profiler shared by all browser sessions."""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = Profiler()
+        return _profiler
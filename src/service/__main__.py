@@ -0,0 +1,28 @@
+"""
+Run the headless interview service:
+    python -m src.service [--host 127.0.0.1] [--port 8000]
+"""
+
+import argparse
+
+from src.config import Config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless interview service (HTTP + WebSocket).")
+    parser.add_argument("--host", default=Config.SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=Config.SERVICE_PORT)
+    args = parser.parse_args()
+
+    Config.validate()
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("uvicorn is not installed: pip install 'uvicorn[standard]'")
+
+    uvicorn.run("src.service.asgi:app", host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
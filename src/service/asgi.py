@@ -0,0 +1,273 @@
+"""
+ASGI application for the headless interview service.
+
+Run with:
+    python -m src.service
+    uvicorn src.service.asgi:app --port 8000
+
+HTTP (JSON bodies and responses):
+    POST /sessions                   {"role", "persona", "input_mode"} -> {"session_id", "reply"}
+                                     (503 when the admission queue is full)
+    GET  /sessions/<id>              current state and transcript
+    POST /sessions/<id>/answer       {"text"} -> {"reply", "complete"}
+         ?stream=1                   NDJSON: {"delta": ...} lines, then {"reply", "complete"}
+    POST /sessions/<id>/end          -> {"feedback"} (also saved to history)
+    GET  /history?limit=10           saved interview summaries
+    GET  /health                     also reports admission queue and shed metrics
+
+WebSocket /ws, one interview per connection. Client messages:
+    {"type": "start", "role", "persona"} | {"type": "answer", "text"} | {"type": "end"}
+Server messages:
+    {"type": "started", "session_id", "reply"} | {"type": "delta", "text"}
+    {"type": "reply", "reply", "complete"} | {"type": "feedback", "feedback"}
+    {"type": "error", "error"}
+
+Written against the bare ASGI interface, so any ASGI server can host it
+without a web framework dependency.
+"""
+
+import json
+import re
+from typing import Dict, Optional
+from urllib.parse import parse_qs
+
+from src.agents.admission import Overloaded
+from src.service.sessions import SessionClosed, SessionManager, SessionNotFound, session_state
+
+
+SESSION_ID = r"(?P<session_id>[\w-]+)"
+
+ROUTES = [
+    ("POST", re.compile(r"^/sessions$"), "start"),
+    ("GET", re.compile(rf"^/sessions/{SESSION_ID}$"), "state"),
+    ("POST", re.compile(rf"^/sessions/{SESSION_ID}/answer$"), "answer"),
+    ("POST", re.compile(rf"^/sessions/{SESSION_ID}/end$"), "end"),
+    ("GET", re.compile(r"^/history$"), "history"),
+    ("GET", re.compile(r"^/health$"), "health"),
+]
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class InterviewService:
+    """ASGI callable routing HTTP and WebSocket requests to a SessionManager."""
+
+    def __init__(self, manager: Optional[SessionManager] = None):
+        self.manager = manager or SessionManager()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            await self._handle_http(scope, receive, send)
+        elif scope["type"] == "websocket":
+            await self._handle_websocket(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+
+    # ------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------
+    async def _handle_http(self, scope, receive, send):
+        try:
+            handler, params = self._route(scope["method"], scope["path"])
+            body = await _read_body(receive)
+            query = {k: v[-1] for k, v in parse_qs(scope.get("query_string", b"").decode()).items()}
+            await handler(send, body, query, **params)
+        except HTTPError as e:
+            await _send_json(send, e.status, {"error": e.message})
+        except SessionNotFound as e:
+            await _send_json(send, 404, {"error": str(e)})
+        except SessionClosed as e:
+            await _send_json(send, 409, {"error": str(e)})
+        except Overloaded as e:
+            await _send_json(send, 503, {"error": str(e)})
+        except ValueError as e:
+            await _send_json(send, 400, {"error": str(e)})
+
+    def _route(self, method: str, path: str):
+        allowed = False
+        for route_method, pattern, name in ROUTES:
+            match = pattern.match(path)
+            if match:
+                if route_method == method:
+                    return getattr(self, f"_http_{name}"), match.groupdict()
+                allowed = True
+        if allowed:
+            raise HTTPError(405, "Method not allowed")
+        raise HTTPError(404, "Not found")
+
+    async def _http_start(self, send, body, query):
+        result = await self.manager.start(
+            _required(body, "role"),
+            body.get("persona", "normal"),
+            body.get("input_mode", "text"),
+        )
+        await _send_json(send, 201, result)
+
+    async def _http_state(self, send, body, query, session_id):
+        await _send_json(send, 200, session_state(self.manager.get(session_id)))
+
+    async def _http_answer(self, send, body, query, session_id):
+        text = _required(body, "text")
+
+        if query.get("stream") not in ("1", "true"):
+            await _send_json(send, 200, await self.manager.answer(session_id, text))
+            return
+
+        # Fail before the 200 header goes out
+        self.manager.get(session_id)
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/x-ndjson")],
+        })
+        parts = []
+        async for piece in self.manager.answer_stream(session_id, text):
+            parts.append(piece)
+            await send({"type": "http.response.body", "body": _ndjson({"delta": piece}), "more_body": True})
+
+        complete = self.manager.get(session_id).is_complete()
+        await send({
+            "type": "http.response.body",
+            "body": _ndjson({"session_id": session_id, "reply": "".join(parts), "complete": complete}),
+        })
+
+    async def _http_end(self, send, body, query, session_id):
+        await _send_json(send, 200, await self.manager.end(session_id))
+
+    async def _http_history(self, send, body, query):
+        limit = int(query.get("limit", 10))
+        await _send_json(send, 200, {"interviews": await self.manager.history(limit)})
+
+    async def _http_health(self, send, body, query):
+        await _send_json(send, 200, {"status": "ok", **self.manager.stats()})
+
+    # ------------------------------------------------------------
+    # WebSocket
+    # ------------------------------------------------------------
+    async def _handle_websocket(self, scope, receive, send):
+        if scope["path"] != "/ws":
+            await send({"type": "websocket.close", "code": 1008})
+            return
+
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+        await send({"type": "websocket.accept"})
+
+        session_id = None
+        while True:
+            message = await receive()
+            if message["type"] == "websocket.disconnect":
+                # The session stays alive; it can be continued over HTTP
+                return
+
+            try:
+                request = json.loads(message.get("text") or message.get("bytes") or b"{}")
+                session_id = await self._ws_dispatch(send, request, session_id)
+            except (SessionNotFound, SessionClosed, Overloaded, ValueError, HTTPError) as e:
+                await _ws_send(send, {"type": "error", "error": str(e)})
+
+    async def _ws_dispatch(self, send, request: Dict, session_id: Optional[str]) -> Optional[str]:
+        kind = request.get("type")
+
+        if kind == "start":
+            result = await self.manager.start(
+                _required(request, "role"),
+                request.get("persona", "normal"),
+                request.get("input_mode", "text"),
+            )
+            await _ws_send(send, {"type": "started", **result})
+            return result["session_id"]
+
+        session_id = request.get("session_id") or session_id
+        if session_id is None:
+            raise HTTPError(400, "Send a 'start' message first")
+
+        if kind == "answer":
+            parts = []
+            async for piece in self.manager.answer_stream(session_id, _required(request, "text")):
+                parts.append(piece)
+                await _ws_send(send, {"type": "delta", "text": piece})
+            complete = self.manager.get(session_id).is_complete()
+            await _ws_send(send, {"type": "reply", "reply": "".join(parts), "complete": complete})
+
+        elif kind == "end":
+            result = await self.manager.end(session_id)
+            await _ws_send(send, {"type": "feedback", **result})
+
+        else:
+            raise HTTPError(400, f"Unknown message type '{kind}'")
+
+        return session_id
+
+    # ------------------------------------------------------------
+    # Lifespan
+    # ------------------------------------------------------------
+    async def _handle_lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+# ------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------
+async def _read_body(receive) -> Dict:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+
+    raw = b"".join(chunks)
+    if not raw:
+        return {}
+    try:
+        body = json.loads(raw)
+    except json.JSONDecodeError:
+        raise HTTPError(400, "Body must be JSON")
+    if not isinstance(body, dict):
+        raise HTTPError(400, "Body must be a JSON object")
+    return body
+
+
+def _required(body: Dict, field: str) -> str:
+    value = body.get(field)
+    if not isinstance(value, str) or not value.strip():
+        raise HTTPError(400, f"Missing field '{field}'")
+    return value
+
+
+def _ndjson(payload: Dict) -> bytes:
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def _send_json(send, status: int, payload: Dict):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _ws_send(send, payload: Dict):
+    await send({"type": "websocket.send", "text": json.dumps(payload, ensure_ascii=False)})
+
+
+app = InterviewService()
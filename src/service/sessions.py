@@ -0,0 +1,276 @@
+"""
+Session manager for the headless interview service.
+
+Drives one InterviewEngine per interview with async LLM calls, so a
+single event loop can serve many candidates. Requests for the same
+session are serialized by a per-session lock (asyncio locks are FIFO, so
+answers are processed in arrival order); different sessions proceed
+concurrently. Engines live in a SessionPool: each turn is appended to
+the session journal, idle engines are evicted from memory, and evicted
+or pre-restart sessions resume on the next request. An
+AdmissionController caps concurrent interviews and in-flight LLM calls;
+turns that cannot get an LLM slot in time are answered locally.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from src.agents.admission import AdmissionController
+from src.agents.interview_engine import InterviewEngine
+from src.agents.session_pool import SessionPool
+from src.config import Config
+from src.feedback.analyzer import FeedbackAnalyzer
+from src.storage.checkpoints import CheckpointStore
+from src.storage.journal import SessionJournal, get_journal
+
+
+class SessionNotFound(KeyError):
+    """No active interview with this session id."""
+
+    def __str__(self):
+        return f"Unknown session {self.args[0]}"
+
+
+class SessionClosed(RuntimeError):
+    """The interview has already ended."""
+
+    def __str__(self):
+        return f"Session {self.args[0]} has ended"
+
+
+def session_state(engine: InterviewEngine) -> Dict:
+    """Public view of a live interview."""
+    state = engine.state
+    return {
+        "session_id": engine.session_id,
+        "role": state["role"],
+        "persona": state["persona"],
+        "input_mode": state["input_mode"],
+        "timestamp_start": state["timestamp_start"],
+        "question_count": state["question_count"],
+        "complete": engine.is_complete(),
+        "messages": engine.transcript.to_dicts(),
+    }
+
+
+class SessionManager:
+    """Creates, drives and finishes interviews for the service."""
+
+    def __init__(
+        self,
+        storage=None,
+        llm_factory: Optional[Callable] = None,
+        persist: bool = True,
+        checkpoints: Optional[CheckpointStore] = None,
+        journal: Optional[SessionJournal] = None,
+        admission: Optional[AdmissionController] = None,
+    ):
+        self.llm_factory = llm_factory
+        self.admission = admission or AdmissionController()
+        self.persist = persist
+        self._storage = storage
+        if persist:
+            checkpoints = checkpoints or CheckpointStore()
+            journal = journal or get_journal()
+        self.pool = SessionPool(checkpoints, journal, llm_factory=llm_factory)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._evictor: Optional[asyncio.Task] = None
+
+    @property
+    def storage(self):
+        if self._storage is None:
+            from src.storage.manager import StorageManager
+            self._storage = StorageManager()
+        return self._storage
+
+    # ------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------
+    def get(self, session_id: str) -> InterviewEngine:
+        """
+        The live engine; evicted sessions are resumed from their checkpoint
+        or journal (a small local file read, done inline so two requests cannot
+        resume the same session twice).
+        """
+        engine = self.pool.get(session_id)
+        if engine is None:
+            raise SessionNotFound(session_id)
+        return engine
+
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        return self._locks.setdefault(session_id, asyncio.Lock())
+
+    def stats(self) -> Dict:
+        pool = self.pool.stats()
+        return {
+            "active_sessions": pool["resident"],
+            "evicted": pool["evicted"],
+            "resumed": pool["resumed"],
+            "admission": self.admission.stats(),
+        }
+
+    # ------------------------------------------------------------
+    # Interview lifecycle
+    # ------------------------------------------------------------
+    async def start(self, role: str, persona: str = "normal", input_mode: str = "text") -> Dict:
+        """
+        Create an interview and return its id with the opening question.
+        Waits up to ADMISSION_WAIT_SECONDS for a free slot; raises
+        Overloaded if the service is full.
+        """
+        if role not in Config.INTERVIEW_ROLES:
+            raise ValueError(f"Unknown role '{role}'")
+        if persona not in Config.PERSONAS:
+            raise ValueError(f"Unknown persona '{persona}'")
+        self._ensure_evictor()
+
+        # Unique across concurrent starts; keeps the sortable timestamp prefix
+        session_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        await self.admission.admit_async(session_id, Config.ADMISSION_WAIT_SECONDS)
+
+        pooled = False
+        try:
+            engine = InterviewEngine(
+                role,
+                llm=self._llm(),
+                start_chat=False,
+                persona=persona,
+                input_mode=input_mode,
+                session_id=session_id,
+            )
+            if self.admission.degraded:
+                engine.shorten()
+
+            async with self._lock_for(session_id):
+                await engine.start_chat_async()
+                async with self.admission.llm_slot_async() as granted:
+                    if granted:
+                        opening = await engine.start_interview_async()
+                    else:
+                        opening = engine.start_interview_local()
+                pooled = True
+                await asyncio.to_thread(self.pool.add, engine)
+        except BaseException:
+            # Whatever failed, the admission slot must not leak
+            if pooled:
+                self.pool.discard(session_id)
+            self._locks.pop(session_id, None)
+            self.admission.release(session_id)
+            raise
+
+        return {"session_id": session_id, "reply": opening, "complete": False}
+
+    async def answer(self, session_id: str, text: str) -> Dict:
+        """
+        Record the candidate's answer and return the interviewer's reply.
+        """
+        self.get(session_id)
+        async with self._lock_for(session_id):
+            engine = self._get_open(session_id)
+            await self.admission.touch_async(session_id, Config.ADMISSION_WAIT_SECONDS)
+            if self.admission.degraded:
+                engine.shorten()
+            answer = engine.apply_persona(text, engine.state["persona"])
+            engine.record_answer(answer)
+            async with self.admission.llm_slot_async() as granted:
+                if granted:
+                    reply = await engine.respond_async(answer)
+                else:
+                    reply = engine.respond_local(answer)
+            await asyncio.to_thread(self.pool.save, engine)
+
+        return {"session_id": session_id, "reply": reply, "complete": engine.is_complete()}
+
+    async def answer_stream(self, session_id: str, text: str) -> AsyncIterator[str]:
+        """
+        Like answer(), but yields the reply in pieces as it is generated.
+        The session stays locked until the stream is finished.
+        """
+        self.get(session_id)
+        async with self._lock_for(session_id):
+            engine = self._get_open(session_id)
+            await self.admission.touch_async(session_id, Config.ADMISSION_WAIT_SECONDS)
+            if self.admission.degraded:
+                engine.shorten()
+            answer = engine.apply_persona(text, engine.state["persona"])
+            engine.record_answer(answer)
+            async with self.admission.llm_slot_async() as granted:
+                if granted:
+                    async for piece in engine.respond_stream_async(answer):
+                        yield piece
+                else:
+                    yield engine.respond_local(answer)
+            await asyncio.to_thread(self.pool.save, engine)
+
+    async def end(self, session_id: str) -> Dict:
+        """
+        Finish the interview: generate feedback, save it and release the
+        session.
+        """
+        self.get(session_id)
+        async with self._lock_for(session_id):
+            engine = self._get_open(session_id)
+
+            analyzer = FeedbackAnalyzer(llm=self._llm(), session_id=session_id)
+            try:
+                # No local fallback for feedback: wait in line for a slot
+                async with self.admission.llm_slot_async(timeout=None):
+                    feedback = await analyzer.analyze_interview_async(engine.role, engine.get_transcript())
+            except BaseException:
+                # The interview stays open; its next request is admitted again
+                self.admission.release(session_id)
+                raise
+
+            # Frozen only once feedback exists, so a failed end() loses nothing
+            engine.transcript.freeze()
+            data = await asyncio.to_thread(self.pool.complete, engine, feedback)
+            if self.persist:
+                await asyncio.to_thread(self.storage.save_interview, data)
+
+            await asyncio.to_thread(self.pool.discard, session_id)
+            self._locks.pop(session_id, None)
+            self.admission.release(session_id)
+
+        return {"session_id": session_id, "feedback": feedback}
+
+    async def history(self, limit: int = 10) -> List[Dict]:
+        return await asyncio.to_thread(self.storage.list_interviews, limit)
+
+    # ------------------------------------------------------------
+    # Idle eviction
+    # ------------------------------------------------------------
+    def _ensure_evictor(self):
+        if self.pool.durable and self._evictor is None:
+            self._evictor = asyncio.get_running_loop().create_task(self._evict_loop())
+
+    async def _evict_loop(self):
+        while True:
+            await asyncio.sleep(Config.SESSION_EVICT_INTERVAL_SECONDS)
+
+            def busy(session_id: str) -> bool:
+                lock = self._locks.get(session_id)
+                return lock is not None and lock.locked()
+
+            if self.pool.evict_idle(keep=busy):
+                # Locks of evicted sessions are recreated on resume
+                resident = self.pool.resident_ids()
+                for session_id in list(self._locks):
+                    if session_id not in resident and not busy(session_id):
+                        del self._locks[session_id]
+
+    # ------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------
+    def _llm(self):
+        # None: engine and analyzer create a client for their session id
+        return self.llm_factory() if self.llm_factory else None
+
+    def _get_open(self, session_id: str) -> InterviewEngine:
+        # Checked again under the lock: a request queued behind end()
+        # finds the session gone
+        engine = self.pool.get(session_id)
+        if engine is None:
+            raise SessionClosed(session_id)
+        return engine
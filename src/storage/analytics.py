@@ -0,0 +1,361 @@
+"""
+Columnar analytics over interview history.
+
+Per-session scalar fields are materialized into NumPy column arrays and
+cached on disk, so progress tracking never has to re-read every session
+JSON. Trend, percentile and moving-average computations run vectorized
+over those columns.
+"""
+
+import json
+import os
+import threading
+import warnings
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.config import Config
+from src.storage.summary import METRICS, SCORE_DIMENSIONS, summarize_session
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    pa = None
+    pq = None
+
+
+STRING_COLUMNS = ("session_id", "filename", "role", "persona")
+FLOAT_COLUMNS = ("mtime", "timestamp", "duration_seconds") + METRICS
+INT_COLUMNS = ("question_count",)
+COLUMNS = STRING_COLUMNS + FLOAT_COLUMNS + INT_COLUMNS
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _to_epoch(timestamp: str) -> float:
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    columns = {name: np.array([], dtype=str) for name in STRING_COLUMNS}
+    columns.update({name: np.array([], dtype=np.float64) for name in FLOAT_COLUMNS})
+    columns.update({name: np.array([], dtype=np.int32) for name in INT_COLUMNS})
+    return columns
+
+
+def session_row(data: Dict, filename: str, mtime: float) -> Dict:
+    """
+    Flatten one stored session into a row of scalar column values.
+    """
+    summary = summarize_session(data, filename)
+    feedback = data.get("feedback") or {}
+    scores = feedback.get("scores") or {}
+
+    row = {
+        "session_id": str(summary["session_id"]),
+        "filename": filename,
+        "role": str(summary["role"]),
+        "persona": str(summary["persona"]),
+        "mtime": mtime,
+        "timestamp": _to_epoch(summary["timestamp"]),
+        "duration_seconds": _to_float(summary["duration_seconds"]),
+        "overall_score": _to_float(summary["overall_score"]),
+        "question_count": summary["question_count"],
+    }
+    for dimension in SCORE_DIMENSIONS:
+        row[dimension] = _to_float(scores.get(dimension))
+
+    return row
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing moving average along axis 0, ignoring NaNs.
+    Works on 1-D series and on 2-D (sessions x metrics) matrices.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0 or window <= 1:
+        return values.copy()
+
+    valid = ~np.isnan(values)
+    sums = np.cumsum(np.where(valid, values, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+
+    sums[window:] = sums[window:] - sums[:-window]
+    counts[window:] = counts[window:] - counts[:-window]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+class InterviewAnalytics:
+    """NumPy column cache of session metrics with vectorized trend helpers."""
+
+    def __init__(self, cache_path: Optional[str] = None, interviews_dir: Optional[str] = None):
+        self.cache_path = cache_path or Config.ANALYTICS_CACHE_PATH
+        self.interviews_dir = interviews_dir or Config.INTERVIEWS_DIR
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        self._pending: Dict[str, Dict] = {}
+        self._dir_version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # Cache persistence
+    # ------------------------------------------------------------
+    def _load(self) -> Dict[str, np.ndarray]:
+        if self._columns is not None:
+            return self._columns
+
+        columns = _empty_columns()
+        if os.path.exists(self.cache_path):
+            try:
+                with np.load(self.cache_path, allow_pickle=False) as cached:
+                    if all(name in cached for name in COLUMNS):
+                        columns = {name: cached[name] for name in COLUMNS}
+            except Exception as e:
+                print(f"[Analytics] Error reading cache, rebuilding: {e}")
+
+        self._columns = columns
+        return columns
+
+    def _save(self):
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **self._columns)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"[Analytics] Error writing cache: {e}")
+
+    def _replace_rows(self, keep: np.ndarray, rows: List[Dict]):
+        columns = self._columns
+        updated = {}
+        for name in COLUMNS:
+            kept = columns[name][keep]
+            if rows:
+                dtype = str if name in STRING_COLUMNS else kept.dtype
+                added = np.array([row[name] for row in rows], dtype=dtype)
+                kept = np.concatenate([kept, added])
+            updated[name] = kept
+        self._columns = updated
+
+    def _merge_pending(self) -> bool:
+        """
+        Fold rows queued by upsert_session into the columns. The caller
+        holds the lock and saves the cache.
+        """
+        if not self._pending:
+            return False
+        columns = self._load()
+        keep = ~np.isin(columns["session_id"], list(self._pending))
+        self._replace_rows(keep, list(self._pending.values()))
+        self._pending.clear()
+        return True
+
+    # ------------------------------------------------------------
+    # Incremental refresh
+    # ------------------------------------------------------------
+    def refresh(self) -> int:
+        """
+        Bring the cache in line with the interviews directory.
+        Only new or modified session files are read.
+        Returns the number of sessions (re)loaded.
+        """
+        with self._lock:
+            merged = self._merge_pending()
+            columns = self._load()
+
+            try:
+                on_disk = {
+                    entry.name: entry.stat().st_mtime
+                    for entry in os.scandir(self.interviews_dir)
+                    if entry.name.endswith(".json")
+                }
+            except FileNotFoundError:
+                on_disk = {}
+
+            cached_rows = list(zip(columns["filename"].tolist(), columns["mtime"].tolist()))
+            cached = dict(cached_rows)
+            keep = np.array(
+                [on_disk.get(name) == mtime for name, mtime in cached_rows],
+                dtype=bool,
+            )
+
+            rows = []
+            for filename, mtime in on_disk.items():
+                if cached.get(filename) == mtime:
+                    continue
+                try:
+                    with open(os.path.join(self.interviews_dir, filename), "r", encoding="utf-8") as f:
+                        rows.append(session_row(json.load(f), filename, mtime))
+                except Exception as e:
+                    print(f"[Analytics] Error reading file {filename}: {e}")
+
+            if rows or not keep.all():
+                self._replace_rows(keep, rows)
+            if merged or rows or not keep.all():
+                self._save()
+
+            return len(rows)
+
+    def refresh_if_changed(self) -> int:
+        """
+        refresh(), skipped while the interviews directory is unchanged:
+        one stat instead of one per session. Storage publishes session
+        files by rename, which bumps the directory's mtime.
+        """
+        try:
+            version = os.stat(self.interviews_dir).st_mtime_ns
+        except FileNotFoundError:
+            version = None
+        if version is not None and version == self._dir_version:
+            return 0
+
+        refreshed = self.refresh()
+        self._dir_version = version
+        return refreshed
+
+    def upsert_session(self, session_data: Dict, filename: str):
+        """
+        Add or replace one session's row (called after a save).
+
+        Rows are queued and folded into the columns in one pass by the
+        next refresh() or columns() call, so a burst of saves does not
+        rewrite the cache once per session. A queued row lost on exit is
+        harmless: the file's new mtime makes refresh() read it again.
+        """
+        filepath = os.path.join(self.interviews_dir, filename)
+        try:
+            mtime = os.path.getmtime(filepath)
+        except OSError:
+            mtime = np.nan
+
+        row = session_row(session_data, filename, mtime)
+        with self._lock:
+            self._pending[row["session_id"]] = row
+
+    def remove_session(self, session_id: str):
+        """
+        Drop one session's row (called after a delete).
+        """
+        with self._lock:
+            self._pending.pop(session_id, None)
+            columns = self._load()
+            keep = columns["session_id"] != session_id
+            if not keep.all():
+                self._replace_rows(keep, [])
+                self._save()
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Column arrays sorted by session start time (oldest first).
+        """
+        with self._lock:
+            if self._merge_pending():
+                self._save()
+            columns = self._load()
+            order = np.argsort(columns["timestamp"], kind="stable")
+            return {name: values[order] for name, values in columns.items()}
+
+    def export_parquet(self, path: str) -> bool:
+        """
+        Write the column cache as a Parquet file (requires pyarrow).
+        """
+        if not PARQUET_AVAILABLE:
+            print("[Analytics] pyarrow not installed; Parquet export unavailable.")
+            return False
+
+        table = pa.table(self.columns())
+        pq.write_table(table, path)
+        return True
+
+    # ------------------------------------------------------------
+    # Vectorized computations
+    # ------------------------------------------------------------
+    def _metric_matrix(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Stack the metric columns into a (sessions x metrics) matrix.
+        """
+        return np.column_stack([columns[m] for m in METRICS]).reshape(-1, len(METRICS))
+
+    def trends(self, role: Optional[str] = None) -> Dict[str, float]:
+        """
+        Least-squares slope of every metric per session (score points gained
+        per interview), optionally for one role. Each metric is fitted over
+        the sessions that have it; all metrics are solved in one pass.
+        """
+        columns = self.columns()
+        if role:
+            mask = columns["role"] == role
+            columns = {name: values[mask] for name, values in columns.items()}
+
+        matrix = self._metric_matrix(columns)
+        valid = ~np.isnan(matrix)
+        # x counts each metric's own sessions: 0, 1, 2, ... down its column
+        x = np.cumsum(valid, axis=0) - 1.0
+        y = np.where(valid, matrix, 0.0)
+        x = np.where(valid, x, 0.0)
+
+        n = valid.sum(axis=0)
+        sx, sy = x.sum(axis=0), y.sum(axis=0)
+        sxx, sxy = (x * x).sum(axis=0), (x * y).sum(axis=0)
+        denominator = n * sxx - sx * sx
+        with np.errstate(invalid="ignore", divide="ignore"):
+            slopes = np.where(n >= 2, (n * sxy - sx * sy) / denominator, 0.0)
+
+        return {metric: round(float(slope), 3) + 0.0 for metric, slope in zip(METRICS, slopes)}
+
+    def role_trends(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-role trend slopes for every metric.
+        """
+        roles = np.unique(self.columns()["role"])
+        return {str(role): self.trends(str(role)) for role in roles}
+
+    def percentiles(self, qs=(25, 50, 75, 90)) -> Dict[str, Dict[str, Dict[int, float]]]:
+        """
+        Per-role percentiles of every metric, computed column-wise.
+        """
+        columns = self.columns()
+        result = {}
+
+        for role in np.unique(columns["role"]):
+            mask = columns["role"] == role
+            matrix = self._metric_matrix({m: columns[m][mask] for m in METRICS})
+            with warnings.catch_warnings():
+                # All-NaN columns (e.g. no dimension scores) yield NaN
+                warnings.simplefilter("ignore", RuntimeWarning)
+                values = np.nanpercentile(matrix, qs, axis=0)
+            result[str(role)] = {
+                metric: {q: round(float(values[i, j]), 2) for i, q in enumerate(qs)}
+                for j, metric in enumerate(METRICS)
+            }
+
+        return result
+
+    def moving_averages(self, window: int = 3, role: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Trailing moving average of every metric over the session timeline.
+        """
+        columns = self.columns()
+        if role:
+            mask = columns["role"] == role
+            columns = {name: values[mask] for name, values in columns.items()}
+
+        smoothed = moving_average(self._metric_matrix(columns), window)
+        result = {metric: smoothed[:, j] for j, metric in enumerate(METRICS)}
+        result["timestamp"] = columns["timestamp"]
+        return result
@@ -0,0 +1,83 @@
+"""
+Checkpoint store for live interviews.
+
+Holds the latest InterviewEngine.checkpoint() of every unfinished
+interview as one small JSON file per session. Engines that sit idle are
+dropped from memory and rebuilt from here on the next request, and
+interviews survive a process restart.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.config import Config
+
+
+# Bump when the checkpoint layout changes
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointStore:
+    """One JSON checkpoint per session id, written atomically."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or Config.CHECKPOINTS_DIR
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path_for(self, session_id: str) -> str:
+        return os.path.join(self.directory, f"{session_id}.json")
+
+    def save(self, session_id: str, checkpoint: Dict):
+        path = self.path_for(session_id)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(checkpoint, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def load(self, session_id: str) -> Optional[Dict]:
+        try:
+            with open(self.path_for(session_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[CheckpointStore] Error loading {session_id}: {e}")
+            return None
+
+    def delete(self, session_id: str):
+        try:
+            os.remove(self.path_for(session_id))
+        except FileNotFoundError:
+            pass
+
+    def session_ids(self) -> List[str]:
+        return sorted(
+            name[:-len(".json")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        )
+
+    def expire(self, max_age: Optional[float] = None) -> int:
+        """
+        Delete checkpoints not written for max_age seconds (default
+        CHECKPOINT_RETENTION_DAYS): spills of abandoned interviews.
+        """
+        max_age = Config.CHECKPOINT_RETENTION_DAYS * 86400 if max_age is None else max_age
+        cutoff = time.time() - max_age
+        expired = 0
+        for session_id in self.session_ids():
+            try:
+                if os.path.getmtime(self.path_for(session_id)) >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            self.delete(session_id)
+            expired += 1
+        return expired
@@ -0,0 +1,302 @@
+"""
+Append-only per-session journal.
+
+Every turn of a live interview is appended as one compact JSON line to
+data/journals/<session_id>.jsonl, so the cost of persisting a turn is
+proportional to the turn, not to the interview. Writes go straight to
+the file; fsync is batched on a background thread every
+JOURNAL_FSYNC_INTERVAL_MS, trading that much durability on power loss
+for not paying a disk flush per turn.
+
+Record types ("t"):
+    "turn": {"state": <InterviewState without messages>,
+             "messages": [new turns], "llm": [new LLM chat history entries]}
+    "end":  {"feedback": {...}, "ended_at": iso timestamp}
+
+Folding the records rebuilds an engine checkpoint (see
+InterviewEngine.from_checkpoint) or the final session document, and
+journals without an "end" record are the interviews that were never
+finished.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src.config import Config
+from src.storage.checkpoints import CHECKPOINT_VERSION
+
+
+class SessionJournal:
+    """Journals for all sessions of one process."""
+
+    def __init__(self, directory: Optional[str] = None, fsync_interval: Optional[float] = None):
+        self.directory = directory or Config.JOURNALS_DIR
+        self.fsync_interval = (
+            Config.JOURNAL_FSYNC_INTERVAL_MS / 1000 if fsync_interval is None else fsync_interval
+        )
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._fds: Dict[str, int] = {}
+        self._last_write: Dict[str, float] = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        # session id -> ((mtime_ns, size), summary or None if finished)
+        self._summaries: Dict[str, Tuple[Tuple[int, int], Optional[Dict]]] = {}
+
+    def path_for(self, session_id: str) -> str:
+        return os.path.join(self.directory, f"{session_id}.jsonl")
+
+    # ------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------
+    def append(self, session_id: str, record: Dict):
+        """
+        Append one record. Durable after the next batched fsync.
+        """
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+        with self._lock:
+            fd = self._fds.get(session_id)
+            if fd is None:
+                fd = os.open(self.path_for(session_id), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                self._fds[session_id] = fd
+            # One write() per record: O_APPEND keeps lines whole
+            os.write(fd, line)
+            self._dirty.add(session_id)
+            self._last_write[session_id] = time.monotonic()
+
+        self._ensure_flusher()
+
+    def flush(self):
+        """fsync every journal written since the last flush."""
+        # Sync duplicates outside the lock: appends never wait on the disk,
+        # and a handle closed meanwhile cannot be synced by mistake
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            fds = [os.dup(self._fds[session_id]) for session_id in dirty if session_id in self._fds]
+        try:
+            for fd in fds:
+                os.fsync(fd)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+        with self._lock:
+            # Close handles of sessions that went quiet
+            cutoff = time.monotonic() - Config.SESSION_IDLE_SECONDS
+            for session_id, last_write in list(self._last_write.items()):
+                if last_write < cutoff and session_id not in self._dirty:
+                    self._close(session_id)
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._close(session_id)
+            self._dirty.discard(session_id)
+            self._summaries.pop(session_id, None)
+            try:
+                os.remove(self.path_for(session_id))
+            except FileNotFoundError:
+                pass
+
+    def expire(self, max_age: Optional[float] = None) -> int:
+        """
+        Delete journals not written for max_age seconds (default
+        JOURNAL_RETENTION_DAYS): interviews abandoned long ago.
+        """
+        max_age = Config.JOURNAL_RETENTION_DAYS * 86400 if max_age is None else max_age
+        cutoff = time.time() - max_age
+        expired = 0
+        for session_id in self.session_ids():
+            try:
+                if os.path.getmtime(self.path_for(session_id)) >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            with self._lock:
+                if session_id in self._fds:
+                    continue
+            self.delete(session_id)
+            expired += 1
+        return expired
+
+    def _close(self, session_id: str):
+        fd = self._fds.pop(session_id, None)
+        self._last_write.pop(session_id, None)
+        if fd is not None:
+            os.close(fd)
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(self.fsync_interval)
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"[SessionJournal] fsync failed: {e}")
+
+        with self._lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=run, name="journal-fsync", daemon=True)
+                self._flusher.start()
+
+    # ------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------
+    def read(self, session_id: str) -> List[Dict]:
+        """
+        All records of a session. A torn last line (crash mid-write) is
+        skipped.
+        """
+        records = []
+        try:
+            with open(self.path_for(session_id), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    def fold(self, session_id: str) -> Optional[Dict]:
+        """
+        Replay the journal into an engine checkpoint, plus "feedback" and
+        "ended_at" if the interview was finished. None if there is no
+        journal.
+        """
+        records = self.read(session_id)
+        if not records:
+            return None
+
+        state: Dict = {}
+        messages: List[Dict] = []
+        llm_history: List = []
+        feedback = None
+        ended_at = None
+
+        for record in records:
+            if record.get("t") == "turn":
+                state = record["state"]
+                messages.extend(record.get("messages", []))
+                llm_history.extend(record.get("llm", []))
+            elif record.get("t") == "end":
+                feedback = record.get("feedback")
+                ended_at = record.get("ended_at")
+
+        if not state:
+            return None
+
+        return {
+            "version": CHECKPOINT_VERSION,
+            "state": {**state, "messages": messages},
+            "llm_history": llm_history,
+            "feedback": feedback,
+            "ended_at": ended_at,
+        }
+
+    def materialize(self, session_id: str) -> Optional[Dict]:
+        """
+        The session document in the format save_interview() stores.
+        Unfinished interviews have "feedback": None and "status": "unfinished".
+        """
+        folded = self.fold(session_id)
+        if folded is None:
+            return None
+
+        ended_at = folded["ended_at"] or datetime.fromtimestamp(
+            os.path.getmtime(self.path_for(session_id))
+        ).isoformat()
+        return session_document(folded, folded["feedback"], ended_at, finished=bool(folded["ended_at"]))
+
+    def session_ids(self) -> List[str]:
+        return sorted(
+            name[:-len(".jsonl")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".jsonl")
+        )
+
+    def unfinished(self, exclude=()) -> List[Dict]:
+        """
+        Summaries of interviews that were started but never ended
+        (crash, timeout or closed tab), newest first.
+
+        Summaries are cached per journal and only rebuilt when the file
+        changed, so listing costs a stat per journal, not a full fold.
+        """
+        summaries = []
+        for session_id in self.session_ids():
+            if session_id in exclude:
+                continue
+            summary = self._summary(session_id)
+            if summary is not None:
+                summaries.append(summary)
+
+        summaries.sort(key=lambda s: s["timestamp"], reverse=True)
+        return summaries
+
+    def _summary(self, session_id: str) -> Optional[Dict]:
+        try:
+            st = os.stat(self.path_for(session_id))
+        except FileNotFoundError:
+            return None
+        version = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._summaries.get(session_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        data = self.materialize(session_id)
+        summary = None
+        if data is not None and data["status"] == "unfinished":
+            summary = {
+                "session_id": session_id,
+                "role": data["role"],
+                "persona": data["persona"],
+                "timestamp": data["timestamp_start"],
+                "turns": len(data["messages"]),
+            }
+        with self._lock:
+            self._summaries[session_id] = (version, summary)
+        return summary
+
+
+def session_document(checkpoint: Dict, feedback: Optional[Dict], ended_at: str, finished: bool = True) -> Dict:
+    """
+    Build the stored session record from an engine checkpoint.
+    """
+    state = checkpoint["state"]
+    started = datetime.fromisoformat(state["timestamp_start"])
+    return {
+        "session_id": state["session_id"],
+        "role": state["role"],
+        "persona": state["persona"],
+        "input_mode": state["input_mode"],
+        "timestamp_start": state["timestamp_start"],
+        "duration_seconds": int((datetime.fromisoformat(ended_at) - started).total_seconds()),
+        "messages": state["messages"],
+        "feedback": feedback,
+        "status": "completed" if finished else "unfinished",
+    }
+
+
+_journal: Optional[SessionJournal] = None
+_journal_lock = threading.Lock()
+
+
+def get_journal() -> SessionJournal:
+    """Process-wide journal, so fsync batching covers every session."""
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = SessionJournal()
+        return _journal
@@ -2,12 +2,25 @@
 Storage manager - handles saving and loading interview sessions
 """
 
+import gzip
 import json
 import os
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from src.config import Config
+from src.storage.search_index import SearchIndex
+from src.storage.summary import summarize_session
+
+
+# "<id>_<role>.json" for ids as the app and service generate them. A role
+# that could be read as the optional hex part makes the split ambiguous:
+# such names do not match and are resolved from the file instead.
+_GENERATED_FILENAME = re.compile(r"^(\d{8}_\d{6}(?:_[0-9a-f]{6})?)_(?![0-9a-f]{6}(?:_|\.json$)).+\.json$")
 
 
 class StorageManager:
@@ -16,6 +29,21 @@ class StorageManager:
     def __init__(self):
         # Ensure directories exist
         os.makedirs(Config.INTERVIEWS_DIR, exist_ok=True)
+        self.search_index = SearchIndex()
+        self._analytics = None
+        self._analytics_lock = threading.Lock()
+
+    @property
+    def analytics(self):
+        """
+        The progress analytics cache, built on first use so that NumPy is
+        not imported at startup.
+        """
+        with self._analytics_lock:
+            if self._analytics is None:
+                from src.storage.analytics import InterviewAnalytics
+                self._analytics = InterviewAnalytics()
+            return self._analytics
 
     # ------------------------------------------------------------
     # Save Interview
@@ -37,15 +65,45 @@ class StorageManager:
         session_data["saved_at"] = datetime.now().isoformat()
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(filepath, session_data)
 
+            self.search_index.add_session(session_data)
+            if self._analytics is not None:
+                # Otherwise the first refresh() picks the new file up
+                self._analytics.upsert_session(session_data, filename)
             return filepath
 
         except Exception as e:
             print(f"[StorageManager] Error saving session: {e}")
             return ""
 
+    def rewrite_interview(self, session_data: Dict) -> str:
+        """
+        Replace an already saved session in place (e.g. after re-grading).
+
+        Unlike save_interview, "saved_at" is kept and the file keeps its
+        place in the newest-first listing: its mtime is restored, nudged
+        by a millisecond so mtime-based caches still see the change. The
+        analytics cache is not updated; call analytics.refresh() once
+        after a batch of rewrites.
+        """
+
+        session_id = session_data.get("session_id")
+        role = session_data.get("role", "unknown")
+        filepath = os.path.join(Config.INTERVIEWS_DIR, f"{session_id}_{role}.json")
+
+        try:
+            previous = os.stat(filepath)
+            _write_json_atomic(filepath, session_data)
+            os.utime(filepath, ns=(previous.st_atime_ns, previous.st_mtime_ns + 1_000_000))
+
+            self.search_index.add_session(session_data)
+            return filepath
+
+        except Exception as e:
+            print(f"[StorageManager] Error rewriting session: {e}")
+            return ""
+
     # ------------------------------------------------------------
     # Load Interview by Session ID
     # ------------------------------------------------------------
@@ -96,21 +154,7 @@ class StorageManager:
                     with open(filepath, "r", encoding="utf-8") as f:
                         data = json.load(f)
 
-                    summary = {
-                        "session_id": data.get("session_id", "unknown"),
-                        "role": data.get("role", "unknown"),
-                        "persona": data.get("persona", "normal"),
-                        "timestamp": data.get("timestamp_start", ""),
-                        "duration_seconds": data.get("duration_seconds", 0),
-                        "overall_score": data.get("feedback", {}).get("overall_score", 0),
-                        "question_count": len([
-                            m for m in data.get("messages", [])
-                            if m.get("role") == "interviewer"
-                        ]),
-                        "filename": filename,
-                    }
-
-                    summaries.append(summary)
+                    summaries.append(summarize_session(data, filename))
 
                 except Exception as e:
                     print(f"[StorageManager] Error reading file {filename}: {e}")
@@ -135,6 +179,9 @@ class StorageManager:
                     os.remove(
                         os.path.join(Config.INTERVIEWS_DIR, filename)
                     )
+                    self.search_index.remove_session(session_id)
+                    if self._analytics is not None:
+                        self._analytics.remove_session(session_id)
                     return True
                 except Exception as e:
                     print(f"[StorageManager] Error deleting session: {e}")
@@ -142,6 +189,302 @@ class StorageManager:
 
         return False
 
+    # ------------------------------------------------------------
+    # Full-text search over saved interviews
+    # ------------------------------------------------------------
+    def search_interviews(
+        self,
+        query: str,
+        role: Optional[str] = None,
+        persona: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        limit: int = 20
+    ) -> List[Dict]:
+        """
+        Search transcripts and feedback, best match first.
+        Sessions saved before the index existed are indexed on first use.
+        """
+
+        if self.search_index.needs_backfill():
+            self.rebuild_search_index()
+
+        return self.search_index.search(
+            query,
+            role=role,
+            persona=persona,
+            min_score=min_score,
+            max_score=max_score,
+            limit=limit
+        )
+
+    def rebuild_search_index(self) -> int:
+        """
+        Re-index every saved interview from disk.
+        """
+
+        return self.search_index.rebuild(self._iter_saved_sessions())
+
+    def _iter_saved_sessions(self) -> Iterator[Dict]:
+        try:
+            filenames = [
+                f for f in os.listdir(Config.INTERVIEWS_DIR)
+                if f.endswith(".json")
+            ]
+        except Exception as e:
+            print(f"[StorageManager] Error listing sessions: {e}")
+            return
+
+        for filename in filenames:
+            filepath = os.path.join(Config.INTERVIEWS_DIR, filename)
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    yield json.load(f)
+            except Exception as e:
+                print(f"[StorageManager] Error reading file {filename}: {e}")
+
+    # ------------------------------------------------------------
+    # Streaming bulk export / import
+    # ------------------------------------------------------------
+    def iter_sessions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        role: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None
+    ) -> Iterator[Dict]:
+        """
+        Lazily yield stored sessions matching the filters.
+
+        Role and date filters are applied to the file name
+        ("<YYYYmmdd_HHMMSS>_<role>.json") before a file is opened, so
+        non-matching sessions cost a directory entry, not a JSON parse.
+        Sessions are yielded in directory order. Timezone-aware bounds
+        are converted to local time, which session ids are stamped in.
+        """
+
+        since, until = _local_naive(since), _local_naive(until)
+        try:
+            entries = os.scandir(Config.INTERVIEWS_DIR)
+        except Exception as e:
+            print(f"[StorageManager] Error listing sessions: {e}")
+            return
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".json"):
+                    continue
+                if role and not name.endswith(f"_{role}.json"):
+                    continue
+
+                started = _timestamp_from_filename(name)
+                if started is not None and not _in_range(started, since, until):
+                    continue
+
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except Exception as e:
+                    print(f"[StorageManager] Error reading file {name}: {e}")
+                    continue
+
+                if started is None and (since or until):
+                    try:
+                        started = _local_naive(datetime.fromisoformat(data.get("timestamp_start", "")))
+                    except (TypeError, ValueError):
+                        continue
+                    if not _in_range(started, since, until):
+                        continue
+
+                if min_score is not None or max_score is not None:
+                    try:
+                        score = float((data.get("feedback") or {}).get("overall_score"))
+                    except (TypeError, ValueError):
+                        continue
+                    if min_score is not None and score < min_score:
+                        continue
+                    if max_score is not None and score > max_score:
+                        continue
+
+                yield data
+
+    def count_sessions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        role: Optional[str] = None
+    ) -> int:
+        """
+        Number of stored sessions passing iter_sessions' file name filters,
+        without opening any file. An upper bound when ids are not
+        timestamps or score filters are used.
+        """
+
+        since, until = _local_naive(since), _local_naive(until)
+        try:
+            names = os.listdir(Config.INTERVIEWS_DIR)
+        except Exception as e:
+            print(f"[StorageManager] Error listing sessions: {e}")
+            return 0
+
+        count = 0
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            if role and not name.endswith(f"_{role}.json"):
+                continue
+            started = _timestamp_from_filename(name)
+            if started is not None and not _in_range(started, since, until):
+                continue
+            count += 1
+        return count
+
+    def export_sessions(self, path: str, compress: Optional[bool] = None, **filters) -> int:
+        """
+        Stream matching sessions to a JSONL file, one session per line.
+        Gzip is used when compress is True or the path ends in ".gz".
+        Returns the number of sessions written.
+        """
+
+        if compress is None:
+            compress = path.endswith(".gz")
+
+        count = 0
+        opener = gzip.open if compress else open
+        with opener(path, "wt", encoding="utf-8") as out:
+            for data in self.iter_sessions(**filters):
+                out.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+                out.write("\n")
+                count += 1
+
+        return count
+
+    def import_sessions(self, path: str, workers: int = 4, overwrite: bool = False) -> Dict[str, int]:
+        """
+        Stream sessions from a JSONL (or .jsonl.gz) file into storage.
+
+        Import is idempotent by session id: a session that is already
+        stored (under any role) is skipped unless overwrite is set, and
+        later duplicates within the same input are always skipped. Files
+        are written by a thread pool with a bounded number of sessions in
+        flight.
+        """
+
+        counts = {"imported": 0, "skipped": 0, "failed": 0}
+        counts_lock = threading.Lock()
+        in_flight = threading.BoundedSemaphore(max(1, workers) * 4)
+        stored = self._stored_filenames()
+        seen = set()
+
+        def _done(future):
+            in_flight.release()
+            result = "failed" if future.exception() else future.result()
+            with counts_lock:
+                counts[result] += 1
+
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as src, \
+                ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for line_number, line in enumerate(src, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError as e:
+                    print(f"[StorageManager] Skipping malformed line {line_number}: {e}")
+                    with counts_lock:
+                        counts["failed"] += 1
+                    continue
+
+                session_id = data.get("session_id") if isinstance(data, dict) else None
+                if session_id in seen or (session_id in stored and not overwrite):
+                    with counts_lock:
+                        counts["skipped"] += 1
+                    continue
+                if session_id:
+                    seen.add(session_id)
+
+                in_flight.acquire()
+                pool.submit(
+                    self._import_session, data, overwrite, stored.get(session_id)
+                ).add_done_callback(_done)
+
+        # Bulk imports bypass the per-save analytics update
+        self.analytics.refresh()
+        return counts
+
+    def _stored_filenames(self) -> Dict[str, str]:
+        """
+        session id -> file name of every stored session ("<id>_<role>.json").
+
+        Ids and roles may both contain "_", so only names starting with
+        the generated id format ("YYYYmmdd_HHMMSS", optionally "_" plus
+        six hex digits) are split; any other file is opened for its
+        session_id.
+        """
+        try:
+            names = os.listdir(Config.INTERVIEWS_DIR)
+        except Exception as e:
+            print(f"[StorageManager] Error listing sessions: {e}")
+            return {}
+
+        stored = {}
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            match = _GENERATED_FILENAME.match(name)
+            if match:
+                stored[match.group(1)] = name
+                continue
+            try:
+                with open(os.path.join(Config.INTERVIEWS_DIR, name), "r", encoding="utf-8") as f:
+                    session_id = json.load(f).get("session_id")
+            except Exception as e:
+                print(f"[StorageManager] Error reading file {name}: {e}")
+                continue
+            if session_id:
+                stored[str(session_id)] = name
+        return stored
+
+    def _import_session(self, data: Dict, overwrite: bool, existing: Optional[str] = None) -> str:
+        session_id = data.get("session_id") if isinstance(data, dict) else None
+        if not session_id:
+            return "failed"
+
+        role = data.get("role", "unknown")
+        filepath = os.path.join(Config.INTERVIEWS_DIR, f"{session_id}_{role}.json")
+        data.setdefault("saved_at", datetime.now().isoformat())
+
+        # Write to a private temp file, then publish it atomically
+        tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+            if overwrite:
+                os.replace(tmp_path, filepath)
+            else:
+                try:
+                    os.link(tmp_path, filepath)
+                except FileExistsError:
+                    return "skipped"
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if existing and existing != os.path.basename(filepath):
+            # Overwritten under a different role: drop the old copy
+            try:
+                os.remove(os.path.join(Config.INTERVIEWS_DIR, existing))
+            except FileNotFoundError:
+                pass
+
+        self.search_index.add_session(data)
+        return "imported"
+
     # ------------------------------------------------------------
     # Generate Stats for Sidebar
     # ------------------------------------------------------------
@@ -178,3 +521,38 @@ class StorageManager:
             "roles_distribution": roles,
             "latest_interview": sessions[0]
         }
+
+
+def _write_json_atomic(filepath: str, data: Dict):
+    """Write to a private temp file, then swap it in with os.replace."""
+    tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _timestamp_from_filename(filename: str) -> Optional[datetime]:
+    """Parse the default "YYYYmmdd_HHMMSS" session id prefix, if present."""
+    try:
+        return datetime.strptime(filename[:15], "%Y%m%d_%H%M%S")
+    except ValueError:
+        return None
+
+
+def _local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Aware datetimes to naive local time; naive ones are kept as-is."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _in_range(value: datetime, since: Optional[datetime], until: Optional[datetime]) -> bool:
+    if since and value < since:
+        return False
+    if until and value > until:
+        return False
+    return True
@@ -0,0 +1,353 @@
+"""
+Full-text search index over stored interview sessions.
+
+The index lives in a local SQLite file and is a classic inverted index:
+one posting (term, doc_id, tf) per distinct term of a session, clustered
+by term so a query only touches the posting lists of its own terms.
+Results are ranked with BM25.
+"""
+
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from src.config import Config
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "do", "for",
+    "from", "had", "has", "have", "he", "her", "his", "i", "if", "in",
+    "is", "it", "its", "me", "my", "of", "on", "or", "our", "she", "so",
+    "that", "the", "their", "them", "then", "there", "they", "this", "to",
+    "was", "we", "were", "what", "when", "which", "who", "will", "with",
+    "you", "your",
+})
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+FEEDBACK_TEXT_FIELDS = ("best_answer", "needs_work", "summary")
+FEEDBACK_LIST_FIELDS = ("strengths", "improvements")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase, split on non-alphanumerics and drop stopwords.
+    """
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+
+def session_text(session_data: Dict) -> str:
+    """
+    Collect the searchable text of a session (transcript + feedback).
+    """
+    parts = [
+        m.get("content", "") for m in session_data.get("messages", [])
+        if isinstance(m, dict)
+    ]
+
+    feedback = session_data.get("feedback") or {}
+    if isinstance(feedback, dict):
+        for field in FEEDBACK_TEXT_FIELDS:
+            value = feedback.get(field)
+            if isinstance(value, str):
+                parts.append(value)
+        for field in FEEDBACK_LIST_FIELDS:
+            parts.extend(v for v in feedback.get(field, []) if isinstance(v, str))
+
+    return "\n".join(parts)
+
+
+def _to_score(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id INTEGER PRIMARY KEY,
+    session_id TEXT UNIQUE NOT NULL,
+    role TEXT,
+    persona TEXT,
+    overall_score REAL,
+    timestamp TEXT,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_doc ON postings (doc_id);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+INSERT OR IGNORE INTO meta (key, value) VALUES ('doc_count', 0), ('total_length', 0);
+"""
+
+
+class SearchIndex:
+    """On-disk inverted index with incremental updates and BM25 queries."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or Config.SEARCH_INDEX_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    # ------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------
+    def add_session(self, session_data: Dict) -> bool:
+        """
+        Index (or re-index) a single session.
+        """
+        session_id = session_data.get("session_id")
+        if not session_id:
+            return False
+
+        try:
+            with self._lock, self._conn:
+                self._remove(session_id)
+                self._add(session_id, session_data)
+            return True
+        except sqlite3.Error as e:
+            print(f"[SearchIndex] Error indexing session {session_id}: {e}")
+            return False
+
+    def remove_session(self, session_id: str) -> bool:
+        """
+        Drop a session and its postings from the index.
+        """
+        try:
+            with self._lock, self._conn:
+                return self._remove(session_id)
+        except sqlite3.Error as e:
+            print(f"[SearchIndex] Error removing session {session_id}: {e}")
+            return False
+
+    def rebuild(self, sessions: Iterable[Dict]) -> int:
+        """
+        Replace the whole index with the given sessions.
+        """
+        count = 0
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM postings")
+                self._conn.execute("DELETE FROM terms")
+                self._conn.execute("DELETE FROM docs")
+                self._conn.execute(
+                    "UPDATE meta SET value = 0 WHERE key IN ('doc_count', 'total_length')"
+                )
+                for session_data in sessions:
+                    session_id = session_data.get("session_id")
+                    if session_id:
+                        self._remove(session_id)
+                        self._add(session_id, session_data)
+                        count += 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('backfilled', 1)"
+                )
+        except sqlite3.Error as e:
+            print(f"[SearchIndex] Error rebuilding index: {e}")
+            return 0
+
+        return count
+
+    def needs_backfill(self) -> bool:
+        """
+        True until the index has been rebuilt from disk once. Sessions
+        saved before the index existed are only picked up by a rebuild,
+        and incremental adds alone never set the marker.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'backfilled'"
+            ).fetchone()
+            return row is None
+
+    def _add(self, session_id: str, session_data: Dict):
+        tokens = tokenize(session_text(session_data))
+        counts = Counter(tokens)
+        feedback = session_data.get("feedback") or {}
+
+        cur = self._conn.execute(
+            "INSERT INTO docs (session_id, role, persona, overall_score, timestamp, length) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                session_id,
+                session_data.get("role", "unknown"),
+                session_data.get("persona", "normal"),
+                _to_score(feedback.get("overall_score")) if isinstance(feedback, dict) else None,
+                session_data.get("timestamp_start", ""),
+                len(tokens),
+            ),
+        )
+        doc_id = cur.lastrowid
+
+        self._conn.executemany(
+            "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+            ((term, doc_id, tf) for term, tf in counts.items()),
+        )
+        self._conn.executemany(
+            "INSERT INTO terms (term, df) VALUES (?, 1) "
+            "ON CONFLICT(term) DO UPDATE SET df = df + 1",
+            ((term,) for term in counts),
+        )
+        self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'doc_count'")
+        self._conn.execute(
+            "UPDATE meta SET value = value + ? WHERE key = 'total_length'",
+            (len(tokens),),
+        )
+
+    def _remove(self, session_id: str) -> bool:
+        row = self._conn.execute(
+            "SELECT doc_id, length FROM docs WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return False
+
+        doc_id, length = row
+        self._conn.execute(
+            "UPDATE terms SET df = df - 1 WHERE term IN "
+            "(SELECT term FROM postings WHERE doc_id = ?)",
+            (doc_id,),
+        )
+        self._conn.execute(
+            "DELETE FROM terms WHERE df <= 0 AND term IN "
+            "(SELECT term FROM postings WHERE doc_id = ?)",
+            (doc_id,),
+        )
+        self._conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self._conn.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+        self._conn.execute("UPDATE meta SET value = value - 1 WHERE key = 'doc_count'")
+        self._conn.execute(
+            "UPDATE meta SET value = value - ? WHERE key = 'total_length'",
+            (length,),
+        )
+        return True
+
+    def _meta(self):
+        values = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        return values.get("doc_count", 0), values.get("total_length", 0)
+
+    # ------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------
+    def search(
+        self,
+        query: str,
+        role: Optional[str] = None,
+        persona: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        limit: int = 20
+    ) -> List[Dict]:
+        """
+        Return sessions matching the query, best BM25 match first.
+        """
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+
+        try:
+            with self._lock:
+                doc_count, total_length = self._meta()
+                if doc_count == 0:
+                    return []
+                avgdl = max(total_length / doc_count, 1.0)
+
+                placeholders = ",".join("?" * len(terms))
+                dfs = dict(self._conn.execute(
+                    f"SELECT term, df FROM terms WHERE term IN ({placeholders})",
+                    terms,
+                ).fetchall())
+                if not dfs:
+                    return []
+
+                weights = [
+                    (term, math.log(1 + (doc_count - df + 0.5) / (df + 0.5)))
+                    for term, df in dfs.items()
+                ]
+
+                filters = []
+                params: List = [value for pair in weights for value in pair]
+                params.extend([BM25_K1 + 1, BM25_K1, BM25_B, BM25_B, avgdl])
+
+                if role:
+                    filters.append("d.role = ?")
+                    params.append(role)
+                if persona:
+                    filters.append("d.persona = ?")
+                    params.append(persona)
+                if min_score is not None:
+                    filters.append("d.overall_score >= ?")
+                    params.append(min_score)
+                if max_score is not None:
+                    filters.append("d.overall_score <= ?")
+                    params.append(max_score)
+                params.append(limit)
+
+                values = ",".join("(?, ?)" for _ in weights)
+                where = " AND ".join(["p.term = q.term"] + filters)
+
+                rows = self._conn.execute(
+                    f"""
+                    WITH q(term, idf) AS (VALUES {values})
+                    SELECT d.session_id, d.role, d.persona, d.overall_score, d.timestamp,
+                           SUM(q.idf * p.tf * ? / (p.tf + ? * (1 - ? + ? * d.length / ?))) AS score
+                    FROM q
+                    JOIN postings p ON p.term = q.term
+                    JOIN docs d ON d.doc_id = p.doc_id
+                    WHERE {where}
+                    GROUP BY p.doc_id
+                    ORDER BY score DESC
+                    LIMIT ?
+                    """,
+                    params,
+                ).fetchall()
+
+        except sqlite3.Error as e:
+            print(f"[SearchIndex] Error searching index: {e}")
+            return []
+
+        return [
+            {
+                "session_id": session_id,
+                "role": row_role,
+                "persona": row_persona,
+                "overall_score": score if score is not None else 0,
+                "timestamp": timestamp or "",
+                "relevance": round(relevance, 4),
+            }
+            for session_id, row_role, row_persona, score, timestamp, relevance in rows
+        ]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,39 @@
+"""
+Shared helpers for summarizing stored interview sessions.
+"""
+
+from typing import Dict
+
+
+SCORE_DIMENSIONS = (
+    "communication",
+    "structure",
+    "confidence",
+    "content_quality",
+    "role_fit",
+)
+
+# Everything the progress dashboard charts per session
+METRICS = ("overall_score",) + SCORE_DIMENSIONS
+
+
+def summarize_session(data: Dict, filename: str) -> Dict:
+    """
+    Build the lightweight summary used by history lists and analytics.
+    """
+
+    feedback = data.get("feedback") or {}
+
+    return {
+        "session_id": data.get("session_id", "unknown"),
+        "role": data.get("role", "unknown"),
+        "persona": data.get("persona", "normal"),
+        "timestamp": data.get("timestamp_start", ""),
+        "duration_seconds": data.get("duration_seconds", 0),
+        "overall_score": feedback.get("overall_score", 0),
+        "question_count": len([
+            m for m in data.get("messages", [])
+            if m.get("role") == "interviewer"
+        ]),
+        "filename": filename,
+    }
@@ -0,0 +1,75 @@
+"""
+Command-line bulk export/import of interview sessions as JSONL.
+
+Usage:
+    python -m src.storage.transfer export sessions.jsonl.gz --role sales --since 2024-01-01
+    python -m src.storage.transfer import sessions.jsonl.gz --workers 8
+"""
+
+import argparse
+import time
+from datetime import datetime, time as dt_time
+
+from src.storage.manager import StorageManager
+
+
+def parse_since(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def parse_until(value: str) -> datetime:
+    """A bare date (2024-01-31) includes that whole day."""
+    parsed = datetime.fromisoformat(value)
+    if len(value) == 10:
+        parsed = datetime.combine(parsed.date(), dt_time.max, tzinfo=parsed.tzinfo)
+    return parsed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Bulk export/import of interview sessions.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="Stream sessions to a JSONL file")
+    export.add_argument("path", help="Output file (.jsonl or .jsonl.gz)")
+    export.add_argument("--since", type=parse_since, help="Earliest start time (ISO date)")
+    export.add_argument("--until", type=parse_until, help="Latest start time (ISO date; a bare date is inclusive)")
+    export.add_argument("--role", help="Only sessions for this role")
+    export.add_argument("--min-score", type=float, help="Minimum overall score")
+    export.add_argument("--max-score", type=float, help="Maximum overall score")
+    export.add_argument("--gzip", action="store_true", default=None, help="Force gzip compression")
+
+    imp = sub.add_parser("import", help="Stream sessions from a JSONL file")
+    imp.add_argument("path", help="Input file (.jsonl or .jsonl.gz)")
+    imp.add_argument("--workers", type=int, default=4, help="Parallel writer threads")
+    imp.add_argument("--overwrite", action="store_true", help="Replace sessions that already exist")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    storage = StorageManager()
+    started = time.perf_counter()
+
+    if args.command == "export":
+        count = storage.export_sessions(
+            args.path,
+            compress=args.gzip,
+            since=args.since,
+            until=args.until,
+            role=args.role,
+            min_score=args.min_score,
+            max_score=args.max_score,
+        )
+        print(f"Exported {count} sessions to {args.path} in {time.perf_counter() - started:.1f}s")
+
+    else:
+        counts = storage.import_sessions(args.path, workers=args.workers, overwrite=args.overwrite)
+        print(
+            f"Imported {counts['imported']}, skipped {counts['skipped']}, "
+            f"failed {counts['failed']} in {time.perf_counter() - started:.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
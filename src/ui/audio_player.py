@@ -0,0 +1,60 @@
+"""
+Sequential in-browser playback of streamed audio segments.
+
+Every segment is rendered as its own tiny HTML component as soon as it is
+ready. Segments of the same turn coordinate through localStorage and a
+BroadcastChannel (the component iframes share the app's origin), so
+segment N starts when segment N-1 ends, without waiting for the whole
+reply to be synthesized.
+"""
+
+import base64
+
+import streamlit.components.v1 as components
+
+
+_PLAYER_TEMPLATE = """
+<audio id="seg" src="data:{mime};base64,{data}" preload="auto"></audio>
+<script>
+(function () {{
+  const turn = "{turn}";
+  const seq = {seq};
+  const key = "voice-turn-" + turn;
+  const channel = new BroadcastChannel(key);
+  const audio = document.getElementById("seg");
+
+  const ended = () => parseInt(localStorage.getItem(key) || "-1", 10);
+  const markEnded = () => {{
+    localStorage.setItem(key, String(Math.max(ended(), seq)));
+    channel.postMessage(seq);
+  }};
+  let started = false;
+  const play = () => {{
+    if (started) return;
+    started = true;
+    audio.play().catch(markEnded);
+  }};
+
+  audio.addEventListener("ended", markEnded);
+  audio.addEventListener("error", markEnded);
+
+  // Subscribe before checking, so an "ended" in between is not missed
+  channel.onmessage = (event) => {{
+    if (event.data === seq - 1) play();
+  }};
+  if (seq === 0 || ended() >= seq - 1) play();
+}})();
+</script>
+"""
+
+
+def render_audio_segment(audio: bytes, mime: str, turn: str, seq: int):
+    """
+    Queue one audio segment for playback after the previous one of its turn.
+    """
+    data = base64.b64encode(audio).decode("ascii")
+
+    components.html(
+        _PLAYER_TEMPLATE.format(mime=mime, data=data, turn=turn, seq=seq),
+        height=0,
+    )
@@ -0,0 +1,290 @@
+"""
+Size-bounded audio cache with LRU eviction.
+
+Entries are tracked in an index file next to the audio files, so lookups
+and eviction decisions never scan the cache directory. Access times,
+sizes and hit/miss/eviction counters live in the index.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from src.config import Config
+
+
+class AudioCache:
+    """Index-backed audio file cache bounded by bytes and entry count."""
+
+    INDEX_FILENAME = "index.json"
+    AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg")
+
+    # Hits only touch access times; persist those lazily
+    FLUSH_EVERY_ACCESSES = 20
+    FLUSH_INTERVAL_SECONDS = 10
+
+    _instances: Dict[str, "AudioCache"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, cache_dir: Optional[str] = None) -> "AudioCache":
+        """
+        One cache object per directory and process, so concurrent handlers
+        do not overwrite each other's index updates.
+        """
+        cache_dir = os.path.abspath(cache_dir or Config.AUDIO_CACHE_DIR)
+        with cls._instances_lock:
+            if cache_dir not in cls._instances:
+                cls._instances[cache_dir] = cls(cache_dir)
+            return cls._instances[cache_dir]
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None
+    ):
+        self.cache_dir = cache_dir or Config.AUDIO_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.AUDIO_CACHE_MAX_BYTES
+        self.max_entries = max_entries if max_entries is not None else Config.AUDIO_CACHE_MAX_ENTRIES
+        self.index_path = os.path.join(self.cache_dir, self.INDEX_FILENAME)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict] = {}
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._total_bytes = 0
+        self._pending_accesses = 0
+        self._last_flush = time.monotonic()
+
+        self._load_index()
+
+    # ------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            self._entries = index.get("entries", {})
+            self._stats.update(index.get("stats", {}))
+        except FileNotFoundError:
+            # First run with an index: adopt files from the old unbounded cache
+            self._adopt_existing_files()
+        except Exception as e:
+            print(f"[AudioCache] Error reading index, rebuilding: {e}")
+            self._adopt_existing_files()
+
+        self._total_bytes = sum(entry["size"] for entry in self._entries.values())
+        self._evict()
+
+    def _adopt_existing_files(self):
+        self._entries = {}
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.AUDIO_EXTENSIONS):
+                stat = entry.stat()
+                self._entries[entry.name] = {
+                    "size": stat.st_size,
+                    "last_access": stat.st_mtime,
+                    "hits": 0,
+                }
+        self._flush()
+
+    def _flush(self):
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": self._entries, "stats": self._stats}, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            print(f"[AudioCache] Error writing index: {e}")
+
+        self._pending_accesses = 0
+        self._last_flush = time.monotonic()
+
+    def _maybe_flush(self):
+        self._pending_accesses += 1
+        if (
+            self._pending_accesses >= self.FLUSH_EVERY_ACCESSES
+            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS
+        ):
+            self._flush()
+
+    # ------------------------------------------------------------
+    # Lookup and insertion
+    # ------------------------------------------------------------
+    def path_for(self, filename: str) -> str:
+        return os.path.join(self.cache_dir, filename)
+
+    def get(self, filename: str, count_miss: bool = True) -> Optional[str]:
+        """
+        Return the cached file path and record the access, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(filename)
+            path = self.path_for(filename)
+
+            if entry is not None and not os.path.exists(path):
+                # Removed behind our back
+                self._drop(filename)
+                entry = None
+
+            if entry is None:
+                if count_miss:
+                    self._stats["misses"] += 1
+                    self._maybe_flush()
+                return None
+
+            entry["last_access"] = time.time()
+            entry["hits"] = entry.get("hits", 0) + 1
+            self._stats["hits"] += 1
+            self._maybe_flush()
+            return path
+
+    def put(self, filename: str, data: bytes) -> Optional[str]:
+        """
+        Atomically write a complete audio file into the cache.
+        Readers never observe a partially written file.
+        """
+        path = self.path_for(filename)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[AudioCache] Error writing {filename}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+        return self.commit(filename)
+
+    def commit(self, filename: str) -> Optional[str]:
+        """
+        Register a file that was just written into the cache directory,
+        then evict least recently used entries until within budget.
+        """
+        path = self.path_for(filename)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            if filename in self._entries:
+                self._total_bytes -= self._entries[filename]["size"]
+
+            pinned = self._entries.get(filename, {}).get("pinned", False)
+            self._entries[filename] = {
+                "size": size,
+                "last_access": time.time(),
+                "hits": 0,
+                "pinned": pinned,
+            }
+            self._total_bytes += size
+
+            self._evict(protect=filename)
+            self._flush()
+
+        return path
+
+    def pin(self, filename: str) -> bool:
+        """
+        Exempt an entry from eviction (static phrases warmed at startup).
+        """
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is None:
+                return False
+            if not entry.get("pinned"):
+                entry["pinned"] = True
+                self._flush()
+            return True
+
+    # ------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------
+    def _drop(self, filename: str):
+        entry = self._entries.pop(filename, None)
+        if entry is not None:
+            self._total_bytes -= entry["size"]
+
+    def _evict(self, protect: Optional[str] = None):
+        over_entries = len(self._entries) - self.max_entries
+        if over_entries <= 0 and self._total_bytes <= self.max_bytes:
+            return
+
+        candidates = sorted(
+            (
+                name for name, entry in self._entries.items()
+                if name != protect and not entry.get("pinned")
+            ),
+            key=lambda name: self._entries[name]["last_access"],
+        )
+
+        for name in candidates:
+            if len(self._entries) <= self.max_entries and self._total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(self.path_for(name))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"[AudioCache] Error evicting {name}: {e}")
+                continue
+            self._drop(name)
+            self._stats["evictions"] += 1
+
+    def discard(self, filename: str) -> Optional[Dict]:
+        """
+        Remove one entry (e.g. an intermediate file that was replaced by its
+        final artifact). Returns the removed index entry.
+        """
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is None:
+                return None
+            try:
+                os.remove(self.path_for(filename))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"[AudioCache] Error deleting {filename}: {e}")
+                return None
+            self._drop(filename)
+            self._flush()
+            return entry
+
+    def clear(self):
+        """
+        Delete every cached audio file. Counters are kept.
+        """
+        with self._lock:
+            for name in list(self._entries):
+                try:
+                    os.remove(self.path_for(name))
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    print(f"[AudioCache] Error deleting {name}: {e}")
+                    continue
+                self._drop(name)
+            self._flush()
+
+    # ------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "pinned": sum(1 for e in self._entries.values() if e.get("pinned")),
+                "bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                **self._stats,
+            }
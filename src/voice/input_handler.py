@@ -1,29 +1,70 @@
 """
 Speech-to-text input handler (STT) using SpeechRecognition.
 Improved version with better error handling & noise adjustment.
+
+Ambient-noise calibration is done once per microphone and refreshed in
+the background, instead of costing a second on every answer. A streaming
+mode cuts speech into segments at short pauses (energy-based voice
+activity detection) and transcribes them while the candidate is still
+talking.
 """
 
 import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from src.config import Config
+from src.voice.stt_engines import SPEECH_RECOGNITION_AVAILABLE, get_stt_engine, sr
+
+
+# ------------------------------------------------------------
+# Per-device calibration cache (process-wide)
+# ------------------------------------------------------------
+_calibrations: Dict[Optional[int], Dict] = {}
+_calibrations_lock = threading.Lock()
+_device_locks: Dict[Optional[int], threading.Lock] = {}
+
+_recognition_pool = None
+_recognition_pool_lock = threading.Lock()
 
-try:
-    import speech_recognition as sr
-    SPEECH_RECOGNITION_AVAILABLE = True
-except ImportError:
-    SPEECH_RECOGNITION_AVAILABLE = False
-    sr = None
+
+def _device_lock(device_index: Optional[int]) -> threading.Lock:
+    with _calibrations_lock:
+        return _device_locks.setdefault(device_index, threading.Lock())
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _recognition_pool
+    with _recognition_pool_lock:
+        if _recognition_pool is None:
+            _recognition_pool = ThreadPoolExecutor(
+                max_workers=Config.STT_MAX_WORKERS,
+                thread_name_prefix="stt"
+            )
+        return _recognition_pool
 
 
 class STTHandler:
     """Handles speech-to-text conversion safely."""
 
-    def __init__(self):
+    def __init__(self, device_index: Optional[int] = None, engine_name: Optional[str] = None):
         self.available = SPEECH_RECOGNITION_AVAILABLE
-        self.recognizer = sr.Recognizer() if self.available else None
+        self.device_index = device_index
+        self.engine = get_stt_engine(engine_name) if self.available else None
+        self._recognizer = None
 
-        if self.available:
+    @property
+    def recognizer(self):
+        # Created (and speech_recognition imported) on first microphone use
+        if self._recognizer is None and self.available:
+            self._recognizer = sr.Recognizer()
             # More stable sensitivity for background noise
-            self.recognizer.energy_threshold = 300
-            self.recognizer.dynamic_energy_threshold = True
+            self._recognizer.energy_threshold = 300
+            self._recognizer.dynamic_energy_threshold = True
+        return self._recognizer
 
     # ------------------------------------------------------------
     # Check availability
@@ -31,6 +72,80 @@ class STTHandler:
     def is_available(self) -> bool:
         return self.available
 
+    # ------------------------------------------------------------
+    # Ambient noise calibration
+    # ------------------------------------------------------------
+    def calibrate(self, source) -> float:
+        """
+        Measure ambient noise on an open microphone and cache the
+        resulting energy threshold for this device.
+        """
+        self.recognizer.adjust_for_ambient_noise(
+            source, duration=Config.STT_CALIBRATION_SECONDS
+        )
+        threshold = self.recognizer.energy_threshold
+        with _calibrations_lock:
+            _calibrations[self.device_index] = {
+                "energy_threshold": threshold,
+                "calibrated_at": time.time(),
+            }
+        return threshold
+
+    def _apply_calibration(self, source):
+        """
+        Use the cached threshold; calibrate inline only the first time a
+        device is used, and refresh stale values in the background.
+        """
+        with _calibrations_lock:
+            cached = _calibrations.get(self.device_index)
+            refresh = False
+            if cached is not None:
+                threshold = cached["energy_threshold"]
+                stale = time.time() - cached["calibrated_at"] > Config.STT_CALIBRATION_TTL_SECONDS
+                # Test-and-set under the lock: one background refresh per device
+                refresh = stale and not cached.get("refreshing")
+                if refresh:
+                    cached["refreshing"] = True
+
+        if cached is None:
+            try:
+                self.calibrate(source)
+            except Exception:
+                pass
+            return
+
+        self.recognizer.energy_threshold = threshold
+        if refresh:
+            threading.Thread(
+                target=self._refresh_calibration, name="stt-calibration", daemon=True
+            ).start()
+
+    def _refresh_calibration(self):
+        # Runs after the current listen releases the microphone; skipped if
+        # another listen grabbed it first.
+        lock = _device_lock(self.device_index)
+        if lock.acquire(timeout=Config.STT_CALIBRATION_TTL_SECONDS):
+            try:
+                with sr.Microphone(device_index=self.device_index) as source:
+                    STTHandler(self.device_index).calibrate(source)
+            except Exception as e:
+                print(f"[STT] Background calibration failed: {e}")
+            finally:
+                lock.release()
+
+        with _calibrations_lock:
+            cached = _calibrations.get(self.device_index)
+            if cached is not None:
+                cached["refreshing"] = False
+
+    def _remember_threshold(self):
+        # dynamic_energy_threshold keeps adapting while listening; keep the
+        # adapted value for the next answer.
+        with _calibrations_lock:
+            cached = _calibrations.get(self.device_index)
+            if cached is not None:
+                cached["energy_threshold"] = self.recognizer.energy_threshold
+
     # ------------------------------------------------------------
     # Live microphone listening
     # ------------------------------------------------------------
@@ -45,14 +160,11 @@ class STTHandler:
             return None
 
         try:
-            with sr.Microphone() as source:
+            with _device_lock(self.device_index), sr.Microphone(device_index=self.device_index) as source:
                 print("🎤 Listening...")
 
-                # Auto-adjust for noise
-                try:
-                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                except:
-                    pass
+                # Cached noise calibration (no per-answer dead time)
+                self._apply_calibration(source)
 
                 # Listen for speech
                 audio = self.recognizer.listen(
@@ -60,10 +172,14 @@ class STTHandler:
                     timeout=timeout,
                     phrase_time_limit=phrase_time_limit
                 )
+                self._remember_threshold()
 
-                # Convert to text using Google free STT API
-                text = self.recognizer.recognize_google(audio)
-                return text
+            # Convert to text with the configured engine
+            text = self.engine.transcribe(audio)
+            if not text:
+                print("[STT] Could not understand audio.")
+                return None
+            return text
 
         except sr.WaitTimeoutError:
             print("[STT] Listening timed out.")
@@ -78,6 +194,81 @@ class STTHandler:
             print(f"[STT] Unexpected error: {e}")
             return None
 
+    # ------------------------------------------------------------
+    # Streaming recognition (VAD segments, partial transcripts)
+    # ------------------------------------------------------------
+    def stream_from_microphone(self, timeout: int = 10, max_duration: int = 120) -> Iterator[Dict]:
+        """
+        Listen and transcribe segment by segment.
+
+        Speech is cut into segments at short pauses; each segment is sent
+        for recognition while the next one is being recorded. Yields
+        {"text": <transcript so far>, "final": False} as segments come
+        back, then one {"text": ..., "final": True} once the candidate has
+        been silent for STT_END_OF_SPEECH_SECONDS. The final result only
+        waits for the last short segment, not the whole answer.
+        """
+        if not self.available:
+            return
+
+        texts = []
+        pending = deque()
+
+        def collect(block: bool):
+            while pending and (block or pending[0].done()):
+                text = pending.popleft().result()
+                if text:
+                    texts.append(text)
+                    yield {"text": " ".join(texts), "final": False}
+
+        pause_threshold = self.recognizer.pause_threshold
+        non_speaking = self.recognizer.non_speaking_duration
+        self.recognizer.pause_threshold = Config.STT_SEGMENT_PAUSE_SECONDS
+        self.recognizer.non_speaking_duration = min(non_speaking, Config.STT_SEGMENT_PAUSE_SECONDS)
+
+        try:
+            with _device_lock(self.device_index), sr.Microphone(device_index=self.device_index) as source:
+                print("🎤 Listening (streaming)...")
+                self._apply_calibration(source)
+
+                started = time.monotonic()
+                wait = timeout
+                while time.monotonic() - started < max_duration:
+                    try:
+                        audio = self.recognizer.listen(
+                            source,
+                            timeout=wait,
+                            phrase_time_limit=Config.STT_SEGMENT_MAX_SECONDS
+                        )
+                    except sr.WaitTimeoutError:
+                        # No speech started within the window: end of answer
+                        break
+
+                    pending.append(_pool().submit(self._recognize_segment, audio))
+                    wait = Config.STT_END_OF_SPEECH_SECONDS
+                    yield from collect(block=False)
+
+                self._remember_threshold()
+
+            yield from collect(block=True)
+
+        except Exception as e:
+            print(f"[STT] Streaming error: {e}")
+            yield from collect(block=True)
+
+        finally:
+            self.recognizer.pause_threshold = pause_threshold
+            self.recognizer.non_speaking_duration = non_speaking
+
+        yield {"text": " ".join(texts), "final": True}
+
+    def _recognize_segment(self, audio) -> Optional[str]:
+        try:
+            return self.engine.transcribe(audio)
+        except Exception as e:
+            print(f"[STT] Segment recognition error: {e}")
+            return None
+
     # ------------------------------------------------------------
     # Transcribe audio file
     # ------------------------------------------------------------
@@ -91,15 +282,74 @@ class STTHandler:
         if not self.available:
             return None
 
-        if not os.path.exists(audio_file_path):
-            print("[STT] Audio file not found.")
-            return None
+        result = transcribe_file(audio_file_path, self.engine)
+        if result["error"]:
+            print(f"[STT] Error transcribing file: {result['error']}")
+        return result["text"]
 
-        try:
-            with sr.AudioFile(audio_file_path) as source:
-                audio = self.recognizer.record(source)
-                text = self.recognizer.recognize_google(audio)
-                return text
-        except Exception as e:
-            print(f"[STT] Error transcribing file: {e}")
-            return None
+    # ------------------------------------------------------------
+    # Batch transcription (process pool)
+    # ------------------------------------------------------------
+    def transcribe_batch(self, audio_file_paths: List[str], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Transcribe many audio files across a process pool.
+
+        Returns one result per input path, in input order:
+            {"path", "text" (str or None), "error" (str or None), "seconds"}
+        """
+        if not self.available:
+            return [
+                {"path": path, "text": None, "error": "speech_recognition not installed", "seconds": 0.0}
+                for path in audio_file_paths
+            ]
+
+        workers = workers or Config.STT_BATCH_WORKERS
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.engine.name,)
+        ) as pool:
+            return list(pool.map(
+                _transcribe_in_worker,
+                audio_file_paths,
+                chunksize=max(1, len(audio_file_paths) // (workers * 4))
+            ))
+
+
+def transcribe_file(audio_file_path: str, engine) -> Dict:
+    """
+    Transcribe one file and report the outcome instead of swallowing it.
+    """
+    started = time.perf_counter()
+    result = {"path": audio_file_path, "text": None, "error": None, "seconds": 0.0}
+
+    if not os.path.exists(audio_file_path):
+        result["error"] = "file not found"
+        return result
+
+    try:
+        with sr.AudioFile(audio_file_path) as source:
+            audio = sr.Recognizer().record(source)
+        text = engine.transcribe(audio)
+        if text:
+            result["text"] = text
+        else:
+            result["error"] = "no speech recognized"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+# Batch worker process state: one engine (and model) per process
+_batch_engine = None
+
+
+def _init_batch_worker(engine_name: str):
+    global _batch_engine
+    _batch_engine = get_stt_engine(engine_name)
+
+
+def _transcribe_in_worker(audio_file_path: str) -> Dict:
+    return transcribe_file(audio_file_path, _batch_engine)
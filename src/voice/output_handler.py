@@ -1,107 +1,225 @@
 """
-Text-to-speech handler using gTTS with stability improvements.
+Text-to-speech handler with caching, chunking and pluggable engines
+(gTTS or a local offline synthesizer, see tts_engines.py).
 """
 
+import mimetypes
 import os
-import hashlib
-from gtts import gTTS
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
 from src.config import Config
+from src.voice.audio_cache import AudioCache
+from src.voice.text import chunk_text, make_cache_key, normalize_text
+from src.voice.transcoder import get_transcoder
+from src.voice.tts_engines import get_engine
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _synthesis_pool() -> ThreadPoolExecutor:
+    """Process-wide bounded pool shared by all handlers."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=Config.TTS_MAX_WORKERS,
+                thread_name_prefix="tts"
+            )
+        return _pool
 
 
 class TTSHandler:
-    """Generates MP3 audio for interviewer messages with caching."""
+    """Generates audio for interviewer messages with caching."""
 
-    def __init__(self):
+    def __init__(self, engine_name: Optional[str] = None):
         os.makedirs(Config.AUDIO_CACHE_DIR, exist_ok=True)
         self.cache_dir = Config.AUDIO_CACHE_DIR
+        self.cache = AudioCache.shared(self.cache_dir)
+        self.engine = get_engine(engine_name)
+        self.transcoder = get_transcoder()
 
     # ------------------------------------------------------------
     # Cache filename generator
     # ------------------------------------------------------------
-    def _get_cache_path(self, text: str) -> str:
+    def _get_cache_filename(self, text: str) -> str:
         """
         Create a stable hash-based filename for caching.
+        The key covers the normalized text and the voice settings.
+        """
+        hashed = make_cache_key(
+            text,
+            engine=self.engine.name,
+            lang=Config.TTS_LANGUAGE,
+            slow=Config.TTS_SLOW
+        )
+        return f"{hashed}.{self.engine.extension}"
+
+    def _get_cache_path(self, text: str) -> str:
+        return self.cache.path_for(self._get_cache_filename(text))
+
+    def _get_artifact_filename(self, cache_name: str) -> Optional[str]:
+        """
+        Filename of the post-processed artifact, or None when disabled.
         """
-        hashed = hashlib.md5(text.encode("utf-8")).hexdigest()
-        return os.path.join(self.cache_dir, f"{hashed}.mp3")
+        if not self.transcoder.is_enabled():
+            return None
+        stem = cache_name.rsplit(".", 1)[0]
+        return stem + self.transcoder.artifact_suffix()
 
     # ------------------------------------------------------------
-    # Convert text to MP3
+    # Convert text to audio
     # ------------------------------------------------------------
     def text_to_speech(self, text: str, use_cache: bool = True) -> str:
         """
-        Generate speech from text using gTTS.
+        Generate speech from text using the configured engine.
 
         Returns:
-            Path to MP3 file or None if generation fails.
+            Path to the audio file or None if generation fails. The raw
+            engine output is replaced by its transcoded artifact in the
+            background, so use read_speech() to get the audio itself.
         """
-        if not text or len(text.strip()) == 0:
+        text = normalize_text(text or "")
+        if not text:
             print("[TTS] Empty text received.")
             return None
 
-        cache_path = self._get_cache_path(text)
+        cache_name = self._get_cache_filename(text)
+        artifact_name = self._get_artifact_filename(cache_name)
 
-        # Use cache if exists
-        if use_cache and os.path.exists(cache_path):
-            return cache_path
+        # Use cache if exists (final artifact first, then raw engine output)
+        if use_cache:
+            if artifact_name:
+                cached = self.cache.get(artifact_name, count_miss=False)
+                if cached:
+                    return cached
 
-        # Generate TTS safely
-        try:
-            # gTTS sometimes fails if text is too long or malformed → split into chunks
-            chunks = self._chunk_text(text, max_len=180)
+            cached = self.cache.get(cache_name)
+            if cached:
+                if artifact_name:
+                    self._schedule_transcode(cache_name, artifact_name)
+                return cached
 
-            with open(cache_path, "wb") as outfile:
-                for chunk in chunks:
-                    try:
-                        tts = gTTS(text=chunk, lang=Config.TTS_LANGUAGE, slow=Config.TTS_SLOW)
-                        temp_path = cache_path + ".tmp"
-                        tts.save(temp_path)
+        # Engines fail or get slow on very long input → split into chunks
+        chunks = self._chunk_text(text, max_len=self.engine.max_chunk_chars)
 
-                        # Append chunk audio
-                        with open(temp_path, "rb") as f:
-                            outfile.write(f.read())
+        audio = self._synthesize_chunks(chunks)
+        if audio is None:
+            return None
 
-                        os.remove(temp_path)
+        # Only complete audio is ever committed to the cache
+        path = self.cache.put(cache_name, audio)
 
-                    except Exception as e:
-                        print(f"[TTS] Error generating chunk: {e}")
+        # Serve the joined engine output now; the clean artifact replaces it
+        # in the background
+        if path and artifact_name:
+            self._schedule_transcode(cache_name, artifact_name)
 
-            return cache_path
+        return path
+
+    def read_speech(self, text: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Audio bytes and MIME type for text, or None if generation fails.
+
+        The bytes are read as soon as the file is resolved. If the raw
+        file was replaced by its artifact (or evicted) in between, the
+        lookup is repeated once.
+        """
+        for _ in range(2):
+            path = self.text_to_speech(text)
+            if not path:
+                return None
+            try:
+                with open(path, "rb") as f:
+                    return f.read(), mimetypes.guess_type(path)[0] or "audio/mpeg"
+            except FileNotFoundError:
+                continue
+        print("[TTS] Audio file disappeared before it could be read.")
+        return None
 
+    # ------------------------------------------------------------
+    # Post-processing (ffmpeg, off the request path)
+    # ------------------------------------------------------------
+    def _schedule_transcode(self, cache_name: str, artifact_name: str):
+        cache = self.cache
+        transcoder = self.transcoder
+        input_format = self.engine.extension
+
+        def job():
+            try:
+                with open(cache.path_for(cache_name), "rb") as f:
+                    data = f.read()
+                audio = transcoder.transcode(data, input_format)
+            except FileNotFoundError:
+                return
+            except Exception as e:
+                print(f"[TTS] Error transcoding {cache_name}: {e}")
+                return
+
+            if audio and cache.put(artifact_name, audio):
+                replaced = cache.discard(cache_name)
+                if replaced and replaced.get("pinned"):
+                    cache.pin(artifact_name)
+
+        transcoder.submit(artifact_name, job)
+
+    # ------------------------------------------------------------
+    # Chunk synthesis (parallel, in memory)
+    # ------------------------------------------------------------
+    def _synthesize_chunk(self, chunk: str) -> bytes:
+        return self.engine.synthesize(chunk, Config.TTS_LANGUAGE, Config.TTS_SLOW)
+
+    def _synthesize_chunks(self, chunks: List[str]) -> Optional[bytes]:
+        """
+        Synthesize all chunks concurrently and join them in order.
+        Returns None if any chunk fails.
+        """
+        if not chunks:
+            return None
+
+        try:
+            if len(chunks) == 1:
+                parts = [self._synthesize_chunk(chunks[0])]
+            else:
+                parts = list(_synthesis_pool().map(self._synthesize_chunk, chunks))
         except Exception as e:
             print(f"[TTS] Error generating TTS: {e}")
             return None
 
+        return self.engine.join(parts)
+
     # ------------------------------------------------------------
     # Split long text into gTTS-safe chunks
     # ------------------------------------------------------------
     def _chunk_text(self, text: str, max_len: int = 180):
         """
-        gTTS does not support very long input. This function splits it safely.
+        Engines do not support very long input. This function splits it safely.
         """
-        words = text.split()
-        chunks = []
-        current = []
-
-        for word in words:
-            if len(" ".join(current + [word])) > max_len:
-                chunks.append(" ".join(current))
-                current = []
-            current.append(word)
-
-        if current:
-            chunks.append(" ".join(current))
-
-        return chunks
+        return chunk_text(text, max_len=max_len)
 
     # ------------------------------------------------------------
     # Clear audio cache
     # ------------------------------------------------------------
     def clear_cache(self):
-        """Delete all cached MP3 files."""
-        try:
-            for f in os.listdir(self.cache_dir):
-                if f.endswith(".mp3"):
-                    os.remove(os.path.join(self.cache_dir, f))
-        except Exception as e:
-            print(f"[TTS] Error clearing cache: {e}")
+        """Delete all cached audio files."""
+        self.cache.clear()
+
+    def pin(self, text: str) -> bool:
+        """Keep the cached audio for this text from being evicted."""
+        cache_name = self._get_cache_filename(text)
+        artifact_name = self._get_artifact_filename(cache_name)
+        if artifact_name and self.cache.pin(artifact_name):
+            return True
+        # Not transcoded yet: the pin is carried over when it is
+        return self.cache.pin(cache_name)
+
+    def cache_stats(self) -> dict:
+        """Cache size, budget and hit/miss/eviction counters."""
+        return self.cache.stats()
+
+    def engine_stats(self) -> dict:
+        """Engine name, synthesis calls, failures and average latency."""
+        return self.engine.stats()
@@ -0,0 +1,193 @@
+"""
+Sentence-streamed voice output.
+
+An interviewer reply is cut at sentence boundaries and every sentence is
+synthesized (through the TTS cache) as soon as it is complete, so the
+first sentence can start playing while the rest is still being produced.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.config import Config
+from src.voice.text import SENTENCE_BOUNDARY, split_sentences
+
+
+class SentenceSegmenter:
+    """Turns a stream of text fragments into complete sentences."""
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, fragment: str) -> List[str]:
+        """
+        Add a text fragment; return the sentences it completed.
+        """
+        self._buffer += fragment
+
+        last_end = None
+        for match in SENTENCE_BOUNDARY.finditer(self._buffer):
+            last_end = match.end()
+        if last_end is None:
+            return []
+
+        complete, self._buffer = self._buffer[:last_end], self._buffer[last_end:]
+        return split_sentences(complete)
+
+    def flush(self) -> List[str]:
+        """
+        Return whatever is left as a final sentence.
+        """
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return [rest] if rest else []
+
+
+# ------------------------------------------------------------
+# Time-to-first-audio metrics (process-wide)
+# ------------------------------------------------------------
+_metrics_lock = threading.Lock()
+_ttfa_samples = deque(maxlen=200)
+_last_metrics: Dict = {}
+
+
+def _record(metrics: Dict):
+    global _last_metrics
+    with _metrics_lock:
+        _last_metrics = metrics
+        if metrics.get("time_to_first_audio") is not None:
+            _ttfa_samples.append(metrics["time_to_first_audio"])
+
+
+def voice_metrics() -> Dict:
+    """
+    Latest run plus p50/p95 time-to-first-audio over recent replies.
+    """
+    with _metrics_lock:
+        samples = sorted(_ttfa_samples)
+        last = dict(_last_metrics)
+
+    def percentile(q):
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    return {
+        "last": last,
+        "samples": len(samples),
+        "ttfa_p50": percentile(0.50),
+        "ttfa_p95": percentile(0.95),
+    }
+
+
+_segment_pool = None
+_segment_pool_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    # Separate from the chunk pool in output_handler: a segment task may
+    # itself fan out into chunk tasks.
+    global _segment_pool
+    with _segment_pool_lock:
+        if _segment_pool is None:
+            _segment_pool = ThreadPoolExecutor(
+                max_workers=Config.TTS_MAX_WORKERS,
+                thread_name_prefix="tts-segment"
+            )
+        return _segment_pool
+
+
+class ReplyStream:
+    """
+    A reply as it is produced by a background turn: ("text", piece) and
+    ("audio", (bytes, mime)) items in order, readable while still being
+    written.
+    """
+
+    def __init__(self):
+        self._items: List[Tuple[str, Any]] = []
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def put(self, kind: str, value: Any):
+        with self._cond:
+            self._items.append((kind, value))
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """Every item from the start, blocking until the stream is closed."""
+        index = 0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: index < len(self._items) or self._closed)
+                items = self._items[index:]
+                closed = self._closed
+            yield from items
+            index += len(items)
+            if closed and not items:
+                return
+
+
+class VoiceOutputPipeline:
+    """Segments replies and yields per-sentence audio in order."""
+
+    def __init__(self, tts_handler):
+        self.tts = tts_handler
+
+    def speak(self, fragments: Iterable[str], started: Optional[float] = None) -> Iterator[Tuple[bytes, str]]:
+        """
+        Consume reply text (whole, or incrementally as streamed from the
+        LLM) and yield (audio bytes, MIME type), one per sentence, in
+        order. Each segment is yielded as soon as it and all earlier ones
+        are ready. Bytes rather than cache paths are handed out, so the
+        cache may replace or evict the files while earlier segments play.
+
+        started is the time.perf_counter() time-to-first-audio is
+        measured from, e.g. when the candidate submitted the answer;
+        default now.
+        """
+        started = time.perf_counter() if started is None else started
+        segmenter = SentenceSegmenter()
+        pending = deque()
+        metrics = {"segments": 0, "failed": 0, "time_to_first_audio": None}
+
+        def submit(sentences):
+            for sentence in sentences:
+                pending.append(_pool().submit(self.tts.read_speech, sentence))
+
+        def emit(future):
+            segment = future.result()
+            if not segment:
+                metrics["failed"] += 1
+                return None
+            metrics["segments"] += 1
+            if metrics["time_to_first_audio"] is None:
+                metrics["time_to_first_audio"] = time.perf_counter() - started
+            return segment
+
+        try:
+            for fragment in fragments:
+                submit(segmenter.feed(fragment))
+                while pending and pending[0].done():
+                    segment = emit(pending.popleft())
+                    if segment:
+                        yield segment
+
+            submit(segmenter.flush())
+            while pending:
+                segment = emit(pending.popleft())
+                if segment:
+                    yield segment
+        finally:
+            for future in pending:
+                future.cancel()
+            metrics["total_seconds"] = time.perf_counter() - started
+            _record(metrics)
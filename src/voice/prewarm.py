@@ -0,0 +1,91 @@
+"""
+Background warm-up of the TTS cache for static interviewer phrases.
+
+At startup the phrases from get_static_phrases() are synthesized into the
+audio cache with bounded concurrency and pinned, so the first time they
+are spoken in a session they are already cache hits. Phrases are warmed
+sentence by sentence, the unit VoiceOutputPipeline synthesizes and caches.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from src.config import Config
+from src.llm.prompts import get_static_phrases
+from src.voice.text import split_sentences
+
+
+class WarmupJob:
+    """Tracks a background pre-synthesis run."""
+
+    def __init__(self, phrases: List[str]):
+        self.phrases = phrases
+        self.total = len(phrases)
+        self.done = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def start(self, tts_handler, max_workers: Optional[int] = None):
+        self.started_at = time.time()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(tts_handler, max_workers or Config.TTS_WARMUP_WORKERS),
+            name="tts-warmup",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def _run(self, tts_handler, max_workers: int):
+        def warm(phrase: str):
+            try:
+                ok = bool(tts_handler.text_to_speech(phrase)) and tts_handler.pin(phrase)
+            except Exception as e:
+                print(f"[TTS] Warm-up error for '{phrase}': {e}")
+                ok = False
+            with self._lock:
+                self.done += 1
+                if not ok:
+                    self.failed += 1
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts-warmup") as pool:
+            list(pool.map(warm, self.phrases))
+
+        self.finished_at = time.time()
+        if self.failed:
+            print(f"[TTS] Warm-up finished with {self.failed}/{self.total} failures.")
+
+    def progress(self) -> Dict:
+        with self._lock:
+            return {
+                "total": self.total,
+                "done": self.done,
+                "failed": self.failed,
+                "finished": self.finished,
+                "seconds": (self.finished_at or time.time()) - (self.started_at or time.time()),
+            }
+
+
+_job: Optional[WarmupJob] = None
+_job_lock = threading.Lock()
+
+
+def start_warmup(tts_handler) -> WarmupJob:
+    """
+    Start the warm-up once per process and return its job.
+    """
+    global _job
+    with _job_lock:
+        if _job is None:
+            sentences = [s for phrase in get_static_phrases() for s in split_sentences(phrase)]
+            _job = WarmupJob(list(dict.fromkeys(sentences))).start(tts_handler)
+        return _job
@@ -0,0 +1,125 @@
+"""
+Speech-to-text engines.
+
+Every engine turns one SpeechRecognition AudioData clip into text. An
+engine returns "" when the clip holds no recognizable speech and raises
+on real failures. Available:
+
+- "google": free Google Web Speech endpoint (network)
+- "vosk":   local Kaldi/Vosk model on the CPU (offline)
+"""
+
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from src.config import Config
+from src.lazy import is_installed, lazy_import
+
+SPEECH_RECOGNITION_AVAILABLE = is_installed("speech_recognition")
+VOSK_AVAILABLE = is_installed("vosk")
+
+# Imported on first recognition, not at app start
+sr = lazy_import("speech_recognition")
+vosk = lazy_import("vosk")
+
+
+class STTEngine(ABC):
+    """Base class: transcribe one audio clip."""
+
+    name = "base"
+
+    def is_available(self) -> bool:
+        return SPEECH_RECOGNITION_AVAILABLE
+
+    @abstractmethod
+    def transcribe(self, audio) -> str:
+        """Text of the clip, "" if it holds no recognizable speech."""
+
+
+class GoogleSTTEngine(STTEngine):
+    """Google Web Speech API through SpeechRecognition."""
+
+    name = "google"
+
+    def __init__(self):
+        self._recognizer = None
+
+    @property
+    def recognizer(self):
+        if self._recognizer is None:
+            self._recognizer = sr.Recognizer()
+        return self._recognizer
+
+    def transcribe(self, audio) -> str:
+        try:
+            return self.recognizer.recognize_google(audio)
+        except sr.UnknownValueError:
+            return ""
+
+
+class VoskSTTEngine(STTEngine):
+    """Offline recognition with a local Vosk model (Config.VOSK_MODEL_PATH)."""
+
+    name = "vosk"
+    SAMPLE_RATE = 16000
+
+    _model = None
+    _model_lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        # Without the model directory every transcription would fail
+        return (
+            SPEECH_RECOGNITION_AVAILABLE
+            and VOSK_AVAILABLE
+            and os.path.isdir(Config.VOSK_MODEL_PATH)
+        )
+
+    @classmethod
+    def _get_model(cls):
+        # Loading a model takes seconds and hundreds of MB: once per process
+        with cls._model_lock:
+            if cls._model is None:
+                vosk.SetLogLevel(-1)
+                cls._model = vosk.Model(Config.VOSK_MODEL_PATH)
+            return cls._model
+
+    def transcribe(self, audio) -> str:
+        recognizer = vosk.KaldiRecognizer(self._get_model(), self.SAMPLE_RATE)
+        recognizer.AcceptWaveform(
+            audio.get_raw_data(convert_rate=self.SAMPLE_RATE, convert_width=2)
+        )
+        return json.loads(recognizer.FinalResult()).get("text", "")
+
+
+STT_ENGINES = {
+    GoogleSTTEngine.name: GoogleSTTEngine,
+    VoskSTTEngine.name: VoskSTTEngine,
+}
+
+_instances: Dict[str, STTEngine] = {}
+_instances_lock = threading.Lock()
+
+
+def get_stt_engine(name: Optional[str] = None) -> STTEngine:
+    """
+    Return the process-wide engine for the configured name
+    (falls back to Google if the engine is unknown or not installed).
+    """
+    name = (name or Config.STT_ENGINE).lower()
+
+    with _instances_lock:
+        if name not in _instances:
+            engine_cls = STT_ENGINES.get(name)
+            if engine_cls is None:
+                print(f"[STT] Unknown engine '{name}', using google.")
+                engine_cls = GoogleSTTEngine
+            engine = engine_cls()
+            if not engine.is_available() and engine_cls is not GoogleSTTEngine:
+                print(f"[STT] Engine '{name}' unavailable, using google.")
+                engine = GoogleSTTEngine()
+            _instances[name] = engine
+
+        return _instances[name]
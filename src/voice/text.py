@@ -0,0 +1,107 @@
+"""
+Text preparation for speech synthesis.
+
+normalize_text() canonicalizes spoken text so that whitespace and
+punctuation variants share one cache entry; chunk_text() splits text into
+engine-sized chunks in a single pass, preferring sentence, then clause,
+then word boundaries.
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import List
+
+
+# Sentence end: terminal punctuation (optionally closed by quotes/brackets)
+# followed by whitespace.
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…])[\"')\]]*\s+")
+
+# Clause end: comma, semicolon, colon or dash followed by whitespace.
+CLAUSE_BOUNDARY = re.compile(r"(?<=[,;:—–])\s+")
+
+# NFKC already turns no-break spaces into plain ones; dashes are unified
+# so en- and em-dash variants share one cache entry
+_TRANSLATE = str.maketrans({
+    "‘": "'", "’": "'", "“": '"', "”": '"',
+    "–": "—",
+})
+_WHITESPACE = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCT = re.compile(r"\s+([.,!?;:…])")
+_REPEATED_PUNCT = re.compile(r"([!?,;:])\1+")
+_ELLIPSIS = re.compile(r"\.{3,}")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical spoken form: NFKC, straight quotes, single spaces, no space
+    before punctuation and no repeated punctuation.
+    """
+    text = unicodedata.normalize("NFKC", text).translate(_TRANSLATE)
+    text = _ELLIPSIS.sub("…", text)
+    text = _REPEATED_PUNCT.sub(r"\1", text)
+    text = _WHITESPACE.sub(" ", text)
+    text = _SPACE_BEFORE_PUNCT.sub(r"\1", text)
+    return text.strip()
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, dropping empty pieces.
+    """
+    return [s.strip() for s in SENTENCE_BOUNDARY.split(text) if s.strip()]
+
+
+def make_cache_key(text: str, engine: str, lang: str, slow: bool) -> str:
+    """
+    Cache key over normalized text plus every setting that changes the audio.
+    """
+    material = f"{engine}\x1f{lang}\x1f{int(bool(slow))}\x1f{normalize_text(text)}"
+    return hashlib.md5(material.encode("utf-8")).hexdigest()
+
+
+def chunk_text(text: str, max_len: int = 180) -> List[str]:
+    """
+    Split text into chunks of at most max_len characters in one pass.
+
+    Whole sentences are packed together where they fit; a sentence that is
+    too long is split at clause boundaries, and a clause that is still too
+    long at word boundaries. Empty chunks are never produced.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+
+    def add(piece: str):
+        nonlocal current_len
+        while len(piece) > max_len:
+            # A single word longer than a chunk: hard split
+            add(piece[:max_len])
+            piece = piece[max_len:]
+
+        extra = len(piece) + (1 if current else 0)
+        if current and current_len + extra > max_len:
+            chunks.append(" ".join(current))
+            current.clear()
+            current_len = 0
+            extra = len(piece)
+
+        current.append(piece)
+        current_len += extra
+
+    for sentence in split_sentences(text):
+        if len(sentence) <= max_len:
+            add(sentence)
+            continue
+
+        for clause in CLAUSE_BOUNDARY.split(sentence):
+            if len(clause) <= max_len:
+                add(clause)
+            else:
+                for word in clause.split():
+                    add(word)
+
+    if current:
+        chunks.append(" ".join(current))
+
+    return chunks
@@ -0,0 +1,113 @@
+"""
+Audio post-processing with ffmpeg (via ffmpeg-python).
+
+Engines return chunk audio that is simply joined; for gTTS that is several
+MP3 streams back to back. The transcoder decodes that input once and
+writes a single, properly muxed stream (correct duration and seeking),
+optionally as low-bitrate Opus in an Ogg container for slow links.
+Jobs run on a small worker pool, off the request path.
+"""
+
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from src.config import Config
+from src.lazy import is_installed, lazy_import
+
+FFMPEG_PYTHON_AVAILABLE = is_installed("ffmpeg")
+
+# Imported on first transcode, not at app start
+ffmpeg = lazy_import("ffmpeg")
+
+
+OUTPUT_FORMATS = {
+    # name: (container, codec, file extension)
+    "mp3": ("mp3", "libmp3lame", "mp3"),
+    "opus": ("ogg", "libopus", "ogg"),
+}
+
+
+class AudioTranscoder:
+    """Joins/transcodes audio into one clean file on a worker pool."""
+
+    def __init__(self, output_format: Optional[str] = None, bitrate: Optional[str] = None):
+        self.output_format = (output_format or Config.TTS_OUTPUT_FORMAT).lower()
+        self.bitrate = bitrate or Config.TTS_OUTPUT_BITRATE
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def is_enabled(self) -> bool:
+        return (
+            self.output_format in OUTPUT_FORMATS
+            and FFMPEG_PYTHON_AVAILABLE
+            and shutil.which("ffmpeg") is not None
+        )
+
+    @property
+    def extension(self) -> str:
+        return OUTPUT_FORMATS[self.output_format][2]
+
+    def artifact_suffix(self) -> str:
+        """
+        File name suffix of the final artifact, e.g. "-opus24k.ogg".
+        Format and bitrate are part of it, so changing them never serves
+        stale audio.
+        """
+        return f"-{self.output_format}{self.bitrate}.{self.extension}"
+
+    # ------------------------------------------------------------
+    # Transcoding
+    # ------------------------------------------------------------
+    def transcode(self, data: bytes, input_format: str) -> bytes:
+        """
+        Decode the input (concatenated streams are read back to back)
+        and encode one mono stream in the output format.
+        """
+        container, codec, _ = OUTPUT_FORMATS[self.output_format]
+        out, _ = (
+            ffmpeg
+            .input("pipe:", format=input_format)
+            .output("pipe:", format=container, acodec=codec, audio_bitrate=self.bitrate, ac=1)
+            .run(input=data, capture_stdout=True, capture_stderr=True, quiet=True)
+        )
+        return out
+
+    def submit(self, key: str, job: Callable[[], None]) -> Optional[Future]:
+        """
+        Run a post-processing job in the background, once per key.
+        """
+        with self._pool_lock:
+            if key in self._in_flight:
+                return self._in_flight[key]
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=Config.TTS_TRANSCODE_WORKERS,
+                    thread_name_prefix="tts-transcode"
+                )
+
+            future = self._pool.submit(job)
+            self._in_flight[key] = future
+
+        def _done(_):
+            with self._pool_lock:
+                self._in_flight.pop(key, None)
+
+        future.add_done_callback(_done)
+        return future
+
+
+_transcoder: Optional[AudioTranscoder] = None
+_transcoder_lock = threading.Lock()
+
+
+def get_transcoder() -> AudioTranscoder:
+    """Process-wide transcoder, so the worker pool and job dedup are shared."""
+    global _transcoder
+    with _transcoder_lock:
+        if _transcoder is None:
+            _transcoder = AudioTranscoder()
+        return _transcoder
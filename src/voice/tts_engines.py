@@ -0,0 +1,175 @@
+"""
+Text-to-speech engines.
+
+Every engine turns one chunk of text into audio bytes. TTSHandler owns
+caching, chunking and concurrency, so all engines share them. Available:
+
+- "gtts":   Google Translate TTS (network, MP3)
+- "espeak": local espeak-ng / espeak binary (offline, WAV)
+"""
+
+import io
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from src.config import Config
+from src.lazy import is_installed
+
+
+class TTSEngine(ABC):
+    """Base class: synthesize text chunks and join them into one file."""
+
+    name = "base"
+    extension = "mp3"
+    max_chunk_chars = 180
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._stats = {"calls": 0, "failures": 0, "seconds": 0.0}
+
+    def is_available(self) -> bool:
+        return True
+
+    def synthesize(self, text: str, lang: str, slow: bool) -> bytes:
+        """
+        Synthesize one chunk, recording call count and latency.
+        """
+        started = time.perf_counter()
+        try:
+            return self._synthesize(text, lang, slow)
+        except Exception:
+            with self._stats_lock:
+                self._stats["failures"] += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self._stats["calls"] += 1
+                self._stats["seconds"] += time.perf_counter() - started
+
+    @abstractmethod
+    def _synthesize(self, text: str, lang: str, slow: bool) -> bytes:
+        """Audio bytes for one chunk, in the engine's format."""
+
+    def join(self, parts: List[bytes]) -> bytes:
+        return b"".join(parts)
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            calls = self._stats["calls"]
+            return {
+                "engine": self.name,
+                "calls": calls,
+                "failures": self._stats["failures"],
+                "avg_ms": (self._stats["seconds"] / calls * 1000) if calls else 0.0,
+            }
+
+
+class GTTSEngine(TTSEngine):
+    """Google Translate TTS via gTTS (one HTTPS request per chunk)."""
+
+    name = "gtts"
+    extension = "mp3"
+    max_chunk_chars = 180
+
+    def is_available(self) -> bool:
+        # gtts is imported on first synthesis
+        return is_installed("gtts")
+
+    def _synthesize(self, text: str, lang: str, slow: bool) -> bytes:
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang, slow=slow).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class EspeakEngine(TTSEngine):
+    """Local CPU synthesis with espeak-ng (or espeak); no network needed."""
+
+    name = "espeak"
+    extension = "wav"
+    max_chunk_chars = 1000
+
+    NORMAL_RATE = 170
+    SLOW_RATE = 120
+
+    def __init__(self):
+        super().__init__()
+        self.binary = shutil.which("espeak-ng") or shutil.which("espeak")
+
+    def is_available(self) -> bool:
+        return self.binary is not None
+
+    def _synthesize(self, text: str, lang: str, slow: bool) -> bytes:
+        result = subprocess.run(
+            [
+                self.binary,
+                "-v", lang,
+                "-s", str(self.SLOW_RATE if slow else self.NORMAL_RATE),
+                "--stdout",
+                "--stdin",
+            ],
+            input=text.encode("utf-8"),
+            capture_output=True,
+            check=True,
+            timeout=30,
+        )
+        return result.stdout
+
+    def join(self, parts: List[bytes]) -> bytes:
+        """
+        Concatenate WAV chunks into one valid WAV file.
+        """
+        if len(parts) == 1:
+            return parts[0]
+
+        output = io.BytesIO()
+        with wave.open(output, "wb") as out:
+            for i, part in enumerate(parts):
+                with wave.open(io.BytesIO(part), "rb") as chunk:
+                    if i == 0:
+                        out.setparams(chunk.getparams())
+                    out.writeframes(chunk.readframes(chunk.getnframes()))
+        return output.getvalue()
+
+
+ENGINES = {
+    GTTSEngine.name: GTTSEngine,
+    EspeakEngine.name: EspeakEngine,
+}
+
+_instances: Dict[str, TTSEngine] = {}
+_instances_lock = threading.Lock()
+
+
+def get_engine(name: Optional[str] = None) -> TTSEngine:
+    """
+    Return the process-wide engine instance for the configured name.
+    Falls back to another available engine if the requested one is not.
+    """
+    name = (name or Config.TTS_ENGINE).lower()
+
+    with _instances_lock:
+        if name not in _instances:
+            engine_cls = ENGINES.get(name)
+            if engine_cls is None:
+                print(f"[TTS] Unknown engine '{name}', using gtts.")
+                engine_cls = GTTSEngine
+            engine = engine_cls()
+
+            if not engine.is_available():
+                for fallback_cls in ENGINES.values():
+                    fallback = fallback_cls()
+                    if fallback_cls is not engine_cls and fallback.is_available():
+                        print(f"[TTS] Engine '{engine.name}' unavailable, using '{fallback.name}'.")
+                        engine = fallback
+                        break
+
+            _instances[name] = engine
+
+        return _instances[name]